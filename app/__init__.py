@@ -1,8 +1,14 @@
 import os
 import sys
 
-from .installation_manager import InstallationManager
-
 execute_dir = os.path.split(os.path.realpath(sys.argv[0]))[0]
 
 __all__ = ["InstallationManager", "execute_dir"]
+
+
+def __getattr__(name):
+    # The installer UI needs Flet; import it lazily so the recording core also runs headless.
+    if name == "InstallationManager":
+        from .installation_manager import InstallationManager
+        return InstallationManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,3 +1,4 @@
+import importlib
 import os
 import time
 
@@ -5,6 +6,7 @@ import flet as ft
 
 from . import InstallationManager, execute_dir
 from .core.config_manager import ConfigManager
+from .core.event_bus import EventBus
 from .core.language_manager import LanguageManager
 from .core.record_manager import RecordingManager
 from .core.update_checker import UpdateChecker
@@ -12,15 +14,20 @@ from .process_manager import AsyncProcessManager
 from .ui.components.recording_card import RecordingCardManager
 from .ui.components.show_snackbar import ShowSnackBar
 from .ui.navigation.sidebar import LeftNavigationMenu, NavigationSidebar
-from .ui.views.about_view import AboutPage
-from .ui.views.home_view import HomePage
 from .ui.views.settings_view import SettingsPage
-from .ui.views.storage_view import StoragePage
 from .utils import utils
 from .utils.logger import logger
+from .utils.startup_timer import startup_timer
 
 
 class App:
+    # Pages other than settings are imported and built on first navigation
+    PAGE_CLASSES = {
+        "home": (".ui.views.home_view", "HomePage"),
+        "storage": (".ui.views.storage_view", "StoragePage"),
+        "about": (".ui.views.about_view", "AboutPage"),
+    }
+
     def __init__(self, page: ft.Page):
         self.install_progress = None
         self.page = page
@@ -28,6 +35,7 @@ class App:
         self.assets_dir = os.path.join(execute_dir, "assets")
         self.process_manager = AsyncProcessManager()
         self.config_manager = ConfigManager(self.run_path)
+        self.event_bus = EventBus()
         self.is_web_mode = False
         self.auth_manager = None
         self.current_username = None
@@ -38,11 +46,9 @@ class App:
             horizontal_alignment=ft.CrossAxisAlignment.START,
         )
 
+        # The settings page holds the loaded configuration used by the recording core, so it is created eagerly
         self.settings = SettingsPage(self)
         self.language_manager = LanguageManager(self)
-        self.about = AboutPage(self)
-        self.home = HomePage(self)
-        self.storage = StoragePage(self)
         self.pages = self.initialize_pages()
         self.language_code = self.settings.language_code
         self.sidebar = NavigationSidebar(self)
@@ -63,6 +69,8 @@ class App:
         self.snack_bar = ShowSnackBar(self.page)
         self.subprocess_start_up_info = utils.get_startup_info()
         self.record_card_manager = RecordingCardManager(self)
+        self.event_bus.subscribe(EventBus.RECORDING_UPDATED, self.on_recording_updated)
+        self.event_bus.subscribe(EventBus.NOTICE, self.on_notice)
         self.record_manager = RecordingManager(self)
         self.current_page = None
         self._loading_page = False
@@ -72,15 +80,24 @@ class App:
         self.page.run_task(self.install_manager.check_env)
         self.page.run_task(self.record_manager.check_free_space)
         self.page.run_task(self._check_for_updates)
+        startup_timer.mark("app construction")
 
     def initialize_pages(self):
         return {
             "settings": self.settings,
-            "home": self.home,
-            "storage": self.storage,
-            "about": self.about,
         }
 
+    def get_page(self, page_name):
+        """Return the page with the given name, importing and building it on first use."""
+        page = self.pages.get(page_name)
+        if page is None and page_name in self.PAGE_CLASSES:
+            started = time.perf_counter()
+            module_name, class_name = self.PAGE_CLASSES[page_name]
+            page_class = getattr(importlib.import_module(module_name, __package__), class_name)
+            page = self.pages[page_name] = page_class(self)
+            logger.debug(f"Page {page_name} created in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return page
+
     async def switch_page(self, page_name):
         if self._loading_page:
             return
@@ -89,10 +106,13 @@ class App:
 
         try:
             await self.clear_content_area()
-            if page := self.pages.get(page_name):
+            if page := self.get_page(page_name):
                 await self.settings.is_changed()
                 self.current_page = page
                 await page.load()
+                if not startup_timer.reported:
+                    startup_timer.mark(f"first page load ({page_name})")
+                    startup_timer.report()
         finally:
             self._loading_page = False
 
@@ -111,6 +131,15 @@ class App:
     def add_ffmpeg_process(self, process):
         self.process_manager.add_process(process)
 
+    def run_task(self, handler, *args, **kwargs):
+        return self.page.run_task(handler, *args, **kwargs)
+
+    def on_recording_updated(self, recording):
+        self.record_card_manager.request_update(recording)
+
+    def on_notice(self, message, **kwargs):
+        self.page.run_task(self.snack_bar.show_snack_bar, message, **kwargs)
+
     async def _check_for_updates(self):
         """Check for updates when the application starts"""
         try:
@@ -0,0 +1,86 @@
+import time
+from datetime import datetime
+
+
+class AdaptiveIntervalPolicy:
+    """
+    Computes a per-recording polling interval from the recording's own go-live history.
+
+    Checks run at the minimum interval inside a window around the room's usual start times,
+    the interval is shortened so the next check lands at the start of the next window, and
+    rooms that have not gone live for a long time back off towards the maximum interval.
+    """
+
+    SECONDS_PER_DAY = 86400
+    WINDOW_BEFORE_SECONDS = 30 * 60
+    WINDOW_AFTER_SECONDS = 60 * 60
+    DORMANT_AFTER_DAYS = 7
+    MAX_HISTORY = 30
+
+    DEFAULT_MIN_SECONDS = 30
+    DEFAULT_MAX_SECONDS = 3600
+
+    def __init__(self, enabled: bool = False, min_seconds: int = DEFAULT_MIN_SECONDS,
+                 max_seconds: int = DEFAULT_MAX_SECONDS):
+        self.enabled = enabled
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+
+    @classmethod
+    def from_config(cls, user_config: dict) -> "AdaptiveIntervalPolicy":
+        policy = cls()
+        policy.configure(user_config)
+        return policy
+
+    def configure(self, user_config: dict) -> None:
+        self.enabled = bool(user_config.get("adaptive_loop_time_enabled", False))
+        self.min_seconds = self._to_int(user_config.get("adaptive_min_loop_time"), self.DEFAULT_MIN_SECONDS)
+        self.max_seconds = self._to_int(user_config.get("adaptive_max_loop_time"), self.DEFAULT_MAX_SECONDS)
+        if self.max_seconds < self.min_seconds:
+            self.max_seconds = self.min_seconds
+
+    @staticmethod
+    def _to_int(value, default: int) -> int:
+        try:
+            return max(1, int(value))
+        except (TypeError, ValueError):
+            return default
+
+    @classmethod
+    def record_live_start(cls, live_history: list, timestamp: float | None = None) -> list:
+        """Append a go-live timestamp (epoch seconds), keeping only the most recent entries."""
+        live_history.append(int(timestamp or time.time()))
+        del live_history[:-cls.MAX_HISTORY]
+        return live_history
+
+    @classmethod
+    def _seconds_of_day(cls, timestamp: float) -> int:
+        dt = datetime.fromtimestamp(timestamp)
+        return dt.hour * 3600 + dt.minute * 60 + dt.second
+
+    def compute(self, live_history: list | None, base_seconds: int, now: float | None = None) -> int:
+        """Return the number of seconds until the next check for a recording."""
+        base_seconds = min(max(base_seconds, self.min_seconds), self.max_seconds)
+        if not live_history:
+            return base_seconds
+
+        now = now or time.time()
+        now_of_day = self._seconds_of_day(now)
+        seconds_to_window = self.SECONDS_PER_DAY
+        for timestamp in live_history:
+            start_of_day = self._seconds_of_day(timestamp)
+            # Offset of now relative to the usual start time, normalised to [-12h, 12h)
+            offset = (now_of_day - start_of_day + self.SECONDS_PER_DAY // 2) % self.SECONDS_PER_DAY
+            offset -= self.SECONDS_PER_DAY // 2
+            if -self.WINDOW_BEFORE_SECONDS <= offset <= self.WINDOW_AFTER_SECONDS:
+                return self.min_seconds
+            window_start = (start_of_day - self.WINDOW_BEFORE_SECONDS - now_of_day) % self.SECONDS_PER_DAY
+            seconds_to_window = min(seconds_to_window, window_start)
+
+        interval = base_seconds
+        dormant_days = (now - max(live_history)) / self.SECONDS_PER_DAY
+        if dormant_days > self.DORMANT_AFTER_DAYS:
+            interval = int(base_seconds * dormant_days / self.DORMANT_AFTER_DAYS)
+
+        interval = min(interval, max(seconds_to_window, self.min_seconds))
+        return min(max(interval, self.min_seconds), self.max_seconds)
@@ -0,0 +1,28 @@
+from typing import Any
+
+from .base import CaptureError, CaptureProcess
+from .flv import FLVCapture
+from .hls import HLSCapture
+
+__all__ = ["CaptureError", "CaptureProcess", "FLVCapture", "HLSCapture", "create_capture"]
+
+
+def create_capture(format_type: str, record_url: str, *args: Any, **kwargs: Any) -> CaptureProcess | None:
+    """
+    Creates the native capture for the output format and stream type, if there is one.
+
+    :param format_type: Media file format (e.g., 'ts','mkv', 'mp4').
+    :param record_url: URL of the media to be recorded.
+    :param args: Positional arguments passed to the capture constructor.
+    :param kwargs: Keyword arguments passed to the capture constructor.
+    :return: A capture that is not started yet, or None when the recording needs ffmpeg.
+    """
+    format_to_class = {
+        ("ts", ".m3u8"): HLSCapture,
+        ("flv", ".flv"): FLVCapture,
+    }
+    stream_path = record_url.split("?", 1)[0].lower()
+    for (capture_format, extension), capture_class in format_to_class.items():
+        if format_type.lower() == capture_format and stream_path.endswith(extension):
+            return capture_class(record_url, *args, **kwargs)
+    return None
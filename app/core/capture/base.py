@@ -0,0 +1,176 @@
+import abc
+import asyncio
+import itertools
+import os
+import time
+
+import httpx
+
+from ...utils.http_client import get_http_client
+from ..ffmpeg_builders.base import FFMPEG_USER_AGENT
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_TERMINATED = 255
+
+class CaptureError(Exception):
+    """A capture cannot continue; the message is written to its stderr like an ffmpeg error line."""
+
+
+class SegmentedFile:
+    """
+    Output file of a capture. With a `%03d` placeholder in the path a new numbered file is started on
+    every `rotate()`, the same naming the ffmpeg segment muxer uses.
+    """
+
+    BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, path_pattern: str):
+        self.path_pattern = path_pattern
+        self.segmented = "%03d" in path_pattern
+        self.index = -1
+        self.path: str | None = None
+        self.total_size = 0
+        self._file = None
+
+    async def write(self, data: bytes) -> None:
+        if self._file is None:
+            await self.rotate()
+        await asyncio.to_thread(self._file.write, data)
+        self.total_size += len(data)
+
+    async def rotate(self) -> None:
+        await self.close()
+        self.index += 1
+        self.path = self.path_pattern % self.index if self.segmented else self.path_pattern
+        self._file = await asyncio.to_thread(open, self.path, "wb", buffering=self.BUFFER_SIZE)
+
+    async def close(self) -> None:
+        if self._file is not None:
+            file, self._file = self._file, None
+            await asyncio.to_thread(file.close)
+
+
+class CaptureProcess(abc.ABC):
+    """
+    A recording done in-process by an asyncio task instead of an ffmpeg child process.
+
+    It mimics the parts of `asyncio.subprocess.Process` the recorder and the process manager use:
+    `returncode`, `pid`, `stdin`, `wait()`, `terminate()` and `kill()`. Progress is written to `stdout`
+    as `-progress` blocks and errors to `stderr` as text lines, so the readers and the supervision loop
+    of `LiveStreamRecorder.start_ffmpeg` handle both kinds of recording alike.
+    """
+
+    PROGRESS_INTERVAL = 1.0
+    _pids = itertools.count(1)
+
+    def __init__(
+        self,
+        record_url: str,
+        full_path: str,
+        segment_record: bool = False,
+        segment_time: str | None = None,
+        headers: dict | None = None,
+        proxy: str | None = None,
+    ):
+        self.record_url = record_url
+        self.full_path = full_path
+        self.segment_time = float(segment_time) if segment_record and segment_time else None
+        # Requests look like ffmpeg's to the CDNs, which some of them check
+        self.headers = {"User-Agent": FFMPEG_USER_AGENT, **(headers or {})}
+        self.proxy = proxy
+        self.client = get_http_client(proxy)
+        self.output = SegmentedFile(full_path)
+
+        self.pid = f"capture-{next(self._pids)}"
+        self.stdin = None
+        self.stdout = asyncio.StreamReader()
+        self.stderr = asyncio.StreamReader()
+        self.returncode: int | None = None
+        self.out_time = 0.0
+        self.started_at = time.monotonic()
+        self._stopping = False
+        self._task: asyncio.Task | None = None
+        self._exited = asyncio.Event()
+
+    def start(self) -> "CaptureProcess":
+        self._task = asyncio.create_task(self._run())
+        self._task.add_done_callback(self._on_done)
+        return self
+
+    @abc.abstractmethod
+    async def capture(self) -> None:
+        """Record until the stream ends; return normally when it did, raise CaptureError when it failed."""
+
+    async def _run(self) -> None:
+        progress_task = asyncio.create_task(self._report_progress())
+        try:
+            await self.capture()
+            returncode = EXIT_TERMINATED if self._stopping else EXIT_OK
+        except asyncio.CancelledError:
+            returncode = EXIT_TERMINATED
+        except Exception as e:
+            message = str(e) if isinstance(e, CaptureError) else f"{type(e).__name__}: {e}"
+            self.log_error(message)
+            returncode = EXIT_ERROR
+        finally:
+            progress_task.cancel()
+            try:
+                await self.output.close()
+            except OSError as e:
+                self.log_error(f"Failed to close {self.output.path}: {e}")
+
+        self.write_progress("end")
+        self.returncode = returncode
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        # Also runs when the task was cancelled before its first step and _run never executed
+        if self.returncode is None:
+            self.returncode = EXIT_TERMINATED
+        self.stdout.feed_eof()
+        self.stderr.feed_eof()
+        self._exited.set()
+
+    def log_error(self, message: str) -> None:
+        self.stderr.feed_data(f"{message}{os.linesep}".encode())
+
+    def write_progress(self, state: str = "continue") -> None:
+        elapsed = time.monotonic() - self.started_at
+        total_size = self.output.total_size
+        bitrate = f"{total_size * 8 / self.out_time / 1000:.1f}kbits/s" if self.out_time else "N/A"
+        speed = f"{self.out_time / elapsed:.2f}x" if elapsed > 0 else "N/A"
+        block = (
+            f"total_size={total_size}\n"
+            f"out_time_us={int(self.out_time * 1_000_000)}\n"
+            f"bitrate={bitrate}\n"
+            f"speed={speed}\n"
+            f"progress={state}\n"
+        )
+        self.stdout.feed_data(block.encode())
+
+    async def _report_progress(self) -> None:
+        while True:
+            await asyncio.sleep(self.PROGRESS_INTERVAL)
+            self.write_progress()
+
+    @staticmethod
+    def describe_error(error: httpx.HTTPError) -> str:
+        if isinstance(error, httpx.HTTPStatusError):
+            response = error.response
+            return f"Server returned {response.status_code} {response.reason_phrase}"
+        if isinstance(error, httpx.TimeoutException):
+            return f"Connection timed out ({type(error).__name__})"
+        return f"{type(error).__name__}: {error}"
+
+    async def wait(self) -> int:
+        await self._exited.wait()
+        return self.returncode
+
+    def terminate(self) -> None:
+        """Stop like ffmpeg on SIGTERM: the task is cancelled, the output closed and the code is 255."""
+        self._stopping = True
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+    def kill(self) -> None:
+        self.terminate()
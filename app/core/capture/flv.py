@@ -0,0 +1,219 @@
+import asyncio
+import os
+
+import httpx
+
+from .base import CaptureError, CaptureProcess, SegmentedFile
+
+FLV_HEADER_SIZE = 9
+TAG_HEADER_SIZE = 11
+PREVIOUS_TAG_SIZE = 4
+
+AUDIO_TAG = 8
+VIDEO_TAG = 9
+SCRIPT_TAG = 18
+
+AAC_FORMAT = 10
+VIDEO_CODECS_WITH_HEADER = (7, 12)  # AVC and the HEVC codec id used by Chinese CDNs
+
+
+def _read_timestamp(tag: bytearray) -> int:
+    return int.from_bytes(tag[4:7], "big") | tag[7] << 24
+
+
+def _write_timestamp(tag: bytearray, timestamp: int) -> None:
+    tag[4:7] = (timestamp & 0xFFFFFF).to_bytes(3, "big")
+    tag[7] = (timestamp >> 24) & 0xFF
+
+
+class FLVCapture(CaptureProcess):
+    """
+    Records an HTTP-FLV stream without ffmpeg. The tags of the response body are copied to the output as
+    they are, only the timestamps are rewritten, and written to disk in chunks of `WRITE_SIZE`, so memory
+    stays at about one chunk per stream whatever the bitrate.
+
+    Timestamps are rebased to start at zero and stay continuous across source resets and reconnects.
+    With segmented recording a new file is started at the first video keyframe after `segment_time`
+    seconds, and begins with the FLV header, the metadata and the codec sequence headers, so that every
+    file plays on its own.
+    """
+
+    WRITE_SIZE = 256 * 1024
+    MAX_TAG_SIZE = 16 * 1024 * 1024
+    MAX_RECONNECTS = 3
+    MAX_TIMESTAMP_JUMP = 5000  # Milliseconds; larger jumps in the source timestamps are treated as a reset
+    TIMESTAMP_GAP = 40  # Milliseconds between the last tag before a reset and the first one after it
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.segment_time and "%03d" not in self.full_path:
+            root, extension = os.path.splitext(self.full_path)
+            self.full_path = f"{root}_%03d{extension}"
+            self.output = SegmentedFile(self.full_path)
+
+        self._pending = bytearray()
+        self._buffer = bytearray()
+        self._expect_header = True
+        self._flags = 0x05
+        self._sequence_headers: dict[int, bytearray] = {}
+        self._offset = 0
+        self._discontinuity = False
+        self._last_source_timestamp: int | None = None
+        self._last_timestamp = 0
+        self._file_start: int | None = None
+        self._finished_time = 0.0
+
+    @property
+    def has_video(self) -> bool:
+        return bool(self._flags & 0x01)
+
+    async def capture(self) -> None:
+        try:
+            await self.read_stream()
+        finally:
+            await self.flush()
+
+    async def read_stream(self) -> None:
+        reconnects = 0
+        while True:
+            received = 0
+            try:
+                async with self.client.stream("GET", self.record_url, headers=self.headers) as response:
+                    response.raise_for_status()
+                    self._pending.clear()
+                    self._expect_header = True
+                    async for chunk in response.aiter_bytes():
+                        received += len(chunk)
+                        await self.feed(chunk)
+                # The server closed a live stream's body, the broadcast is over
+                return
+            except httpx.HTTPError as e:
+                status_code = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+                if status_code in (404, 410) and self.output.total_size:
+                    return
+                reconnects = 1 if received else reconnects + 1
+                if reconnects > self.MAX_RECONNECTS:
+                    raise CaptureError(f"Failed to read stream: {self.describe_error(e)}") from e
+                self.log_error(f"Stream interrupted, reconnecting: {self.describe_error(e)}")
+                await asyncio.sleep(reconnects)
+
+    async def flush(self) -> None:
+        if self._buffer:
+            buffer, self._buffer = self._buffer, bytearray()
+            await self.output.write(buffer)
+
+    async def feed(self, chunk: bytes) -> None:
+        """Copy the complete tags of the received data to the output buffer and keep the incomplete rest."""
+        pending = self._pending
+        pending += chunk
+        position = 0
+        if self._expect_header:
+            position = self.read_header()
+            if position is None:
+                return
+
+        output = self._buffer
+        while len(pending) - position >= TAG_HEADER_SIZE:
+            data_size = int.from_bytes(pending[position + 1:position + 4], "big")
+            if data_size > self.MAX_TAG_SIZE:
+                raise CaptureError(f"Invalid data found when processing input: FLV tag of {data_size} bytes")
+            tag_end = position + TAG_HEADER_SIZE + data_size + PREVIOUS_TAG_SIZE
+            if tag_end > len(pending):
+                break
+            tag = pending[position:tag_end]
+            position = tag_end
+
+            tag_type = tag[0] & 0x1F
+            is_header = tag_type == SCRIPT_TAG or self.is_sequence_header(tag_type, tag)
+            if is_header:
+                previous = self._sequence_headers.get(tag_type)
+                self._sequence_headers[tag_type] = tag
+                # Headers go to the start of every file; within a file only a new or changed codec header does
+                unchanged = previous is not None and previous[TAG_HEADER_SIZE:] == tag[TAG_HEADER_SIZE:]
+                if self._file_start is None or tag_type == SCRIPT_TAG or unchanged:
+                    continue
+            elif tag_type not in (AUDIO_TAG, VIDEO_TAG):
+                continue
+
+            timestamp = self.rebase(_read_timestamp(tag))
+            if self._file_start is None or (not is_header and self.should_split(tag_type, tag, timestamp)):
+                if self._file_start is not None:
+                    await self.flush()
+                    output = self._buffer
+                    await self.output.rotate()
+                    self._finished_time += (timestamp - self._file_start) / 1000
+                self._file_start = timestamp
+                output += self.file_header()
+
+            relative_timestamp = max(timestamp - self._file_start, 0)
+            _write_timestamp(tag, relative_timestamp)
+            output += tag
+            self.out_time = max(self.out_time, self._finished_time + relative_timestamp / 1000)
+
+        del pending[:position]
+        if len(output) >= self.WRITE_SIZE:
+            await self.flush()
+
+    def read_header(self) -> int | None:
+        """Parse the FLV header of a new connection and return the position of its first tag."""
+        pending = self._pending
+        if len(pending) < FLV_HEADER_SIZE:
+            return None
+        if pending[:3] != b"FLV":
+            raise CaptureError("Invalid data found when processing input: not an FLV stream")
+        first_tag = int.from_bytes(pending[5:9], "big") + PREVIOUS_TAG_SIZE
+        if len(pending) < first_tag:
+            return None
+        self._flags = pending[4]
+        self._expect_header = False
+        self._discontinuity = self._last_source_timestamp is not None
+        return first_tag
+
+    @staticmethod
+    def is_sequence_header(tag_type: int, tag: bytearray) -> bool:
+        if len(tag) < TAG_HEADER_SIZE + PREVIOUS_TAG_SIZE + 2:
+            return False
+        info, packet_type = tag[TAG_HEADER_SIZE], tag[TAG_HEADER_SIZE + 1]
+        if tag_type == AUDIO_TAG:
+            return info >> 4 == AAC_FORMAT and packet_type == 0
+        if tag_type == VIDEO_TAG:
+            if info & 0x80:  # Enhanced FLV: the packet type is in the low bits, 0 is the sequence start
+                return info & 0x0F == 0
+            return info & 0x0F in VIDEO_CODECS_WITH_HEADER and packet_type == 0
+        return False
+
+    @staticmethod
+    def is_keyframe(tag: bytearray) -> bool:
+        return len(tag) > TAG_HEADER_SIZE + PREVIOUS_TAG_SIZE and (tag[TAG_HEADER_SIZE] >> 4) & 0x07 == 1
+
+    def should_split(self, tag_type: int, tag: bytearray, timestamp: int) -> bool:
+        if not self.segment_time or timestamp - self._file_start < self.segment_time * 1000:
+            return False
+        if self.has_video:
+            return tag_type == VIDEO_TAG and self.is_keyframe(tag)
+        return True
+
+    def rebase(self, source_timestamp: int) -> int:
+        """Map a source timestamp onto the continuous output timeline, which starts at zero."""
+        if self._last_source_timestamp is None:
+            self._offset = -source_timestamp
+        elif self._discontinuity or abs(source_timestamp - self._last_source_timestamp) > self.MAX_TIMESTAMP_JUMP:
+            self._offset = self._last_timestamp + self.TIMESTAMP_GAP - source_timestamp
+        self._discontinuity = False
+        self._last_source_timestamp = source_timestamp
+        timestamp = max(source_timestamp + self._offset, 0)
+        self._last_timestamp = max(self._last_timestamp, timestamp)
+        return timestamp
+
+    def file_header(self) -> bytearray:
+        header = bytearray(b"FLV\x01")
+        header.append(self._flags)
+        header += FLV_HEADER_SIZE.to_bytes(4, "big")
+        header += bytes(PREVIOUS_TAG_SIZE)
+        for tag_type in (SCRIPT_TAG, VIDEO_TAG, AUDIO_TAG):
+            tag = self._sequence_headers.get(tag_type)
+            if tag:
+                tag = bytearray(tag)
+                _write_timestamp(tag, 0)
+                header += tag
+        return header
@@ -0,0 +1,178 @@
+import asyncio
+import time
+from urllib.parse import urljoin
+
+import httpx
+
+from .base import CaptureError, CaptureProcess
+
+
+class HLSSegment:
+    __slots__ = ("sequence", "url", "duration")
+
+    def __init__(self, sequence: int, url: str, duration: float):
+        self.sequence = sequence
+        self.url = url
+        self.duration = duration
+
+
+class HLSPlaylist:
+    """The parts of an m3u8 playlist a live capture needs: segments, variants and whether it has ended."""
+
+    __slots__ = ("target_duration", "segments", "variants", "ended", "unsupported")
+
+    def __init__(self):
+        self.target_duration = 6.0
+        self.segments: list[HLSSegment] = []
+        self.variants: list[tuple[int, str]] = []  # (bandwidth, url) of a master playlist
+        self.ended = False
+        self.unsupported: str | None = None
+
+    @classmethod
+    def parse(cls, text: str, base_url: str) -> "HLSPlaylist":
+        playlist = cls()
+        sequence = 0
+        duration = 0.0
+        bandwidth = None
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if not line.startswith("#"):
+                url = urljoin(base_url, line)
+                if bandwidth is not None:
+                    playlist.variants.append((bandwidth, url))
+                    bandwidth = None
+                else:
+                    playlist.segments.append(HLSSegment(sequence, url, duration))
+                    sequence += 1
+                    duration = 0.0
+                continue
+
+            tag, _, value = line.partition(":")
+            if tag == "#EXTINF":
+                duration = float(value.split(",", 1)[0] or 0)
+            elif tag == "#EXT-X-MEDIA-SEQUENCE":
+                sequence = int(value)
+            elif tag == "#EXT-X-TARGETDURATION":
+                playlist.target_duration = float(value)
+            elif tag == "#EXT-X-ENDLIST":
+                playlist.ended = True
+            elif tag == "#EXT-X-STREAM-INF":
+                bandwidth = 0
+                for attribute in value.split(","):
+                    name, _, number = attribute.partition("=")
+                    if name.strip() == "BANDWIDTH" and number.isdigit():
+                        bandwidth = int(number)
+            elif tag == "#EXT-X-KEY" and "METHOD=NONE" not in value:
+                playlist.unsupported = "encrypted segments"
+            elif tag == "#EXT-X-MAP":
+                playlist.unsupported = "fragmented MP4 segments"
+        return playlist
+
+
+class HLSCapture(CaptureProcess):
+    """
+    Records an HLS stream to MPEG-TS without ffmpeg: the media playlist is reloaded every target duration,
+    new segments are downloaded concurrently and appended to the output in playlist order. MPEG-TS
+    segments can be concatenated as they are, so nothing is demuxed or remuxed. With segmented recording
+    a new file is started at the first segment boundary after `segment_time` seconds of media.
+    """
+
+    LIVE_START_SEGMENTS = 3  # Like ffmpeg's live_start_index of -3
+    MAX_CONCURRENT_DOWNLOADS = 3
+    SEGMENT_RETRIES = 2
+    MAX_PLAYLIST_ERRORS = 5
+    MAX_SEGMENT_ERRORS = 10
+    STALL_TIMEOUT = 60  # Seconds without a new segment after which the stream counts as ended
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._downloads = asyncio.Semaphore(self.MAX_CONCURRENT_DOWNLOADS)
+        self._file_duration = 0.0
+        self._segment_errors = 0
+
+    async def capture(self) -> None:
+        playlist_url = self.record_url
+        last_sequence = None
+        last_segment_at = time.monotonic()
+        playlist_errors = 0
+
+        while True:
+            try:
+                playlist = await self.fetch_playlist(playlist_url)
+            except httpx.HTTPError as e:
+                status_code = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+                if status_code in (404, 410) and self.output.total_size:
+                    return
+                playlist_errors += 1
+                if playlist_errors >= self.MAX_PLAYLIST_ERRORS:
+                    raise CaptureError(f"Failed to reload playlist: {self.describe_error(e)}") from e
+                self.log_error(f"Playlist reload failed, retrying: {self.describe_error(e)}")
+                await asyncio.sleep(min(2 ** playlist_errors, 10))
+                continue
+            playlist_errors = 0
+
+            if playlist.variants:
+                playlist_url = max(playlist.variants)[1]
+                continue
+            if playlist.unsupported:
+                raise CaptureError(f"Unsupported HLS stream: {playlist.unsupported}")
+
+            segments = playlist.segments
+            if last_sequence is None:
+                segments = segments if playlist.ended else segments[-self.LIVE_START_SEGMENTS:]
+            elif segments and segments[-1].sequence >= last_sequence:
+                segments = [segment for segment in segments if segment.sequence > last_sequence]
+            # Otherwise the media sequence went back: the stream was restarted and all segments are new
+
+            if segments:
+                last_segment_at = time.monotonic()
+                last_sequence = segments[-1].sequence
+                await self.write_segments(segments)
+            elif time.monotonic() - last_segment_at > max(self.STALL_TIMEOUT, playlist.target_duration * 3):
+                return
+
+            if playlist.ended:
+                return
+            # Reload after one target duration, or half of it when the playlist had not changed (RFC 8216 6.3.4)
+            await asyncio.sleep(playlist.target_duration if segments else playlist.target_duration / 2)
+
+    async def fetch_playlist(self, url: str) -> HLSPlaylist:
+        response = await self.client.get(url, headers=self.headers)
+        response.raise_for_status()
+        return HLSPlaylist.parse(response.text, str(response.url))
+
+    async def fetch_segment(self, segment: HLSSegment) -> bytes | None:
+        async with self._downloads:
+            for _ in range(self.SEGMENT_RETRIES + 1):
+                try:
+                    response = await self.client.get(segment.url, headers=self.headers)
+                    response.raise_for_status()
+                    return response.content
+                except httpx.HTTPError as e:
+                    error = e
+            self.log_error(f"Skipped segment {segment.sequence}: {self.describe_error(error)}")
+            return None
+
+    async def write_segments(self, segments: list[HLSSegment]) -> None:
+        downloads = [asyncio.create_task(self.fetch_segment(segment)) for segment in segments]
+        try:
+            for segment, download in zip(segments, downloads):
+                data = await download
+                if data is None:
+                    self._segment_errors += 1
+                    if self._segment_errors >= self.MAX_SEGMENT_ERRORS:
+                        raise CaptureError(f"Too many failed segment downloads: {self.record_url}")
+                    continue
+                self._segment_errors = 0
+
+                if self.segment_time and self._file_duration >= self.segment_time:
+                    await self.output.rotate()
+                    self._file_duration = 0.0
+                await self.output.write(data)
+                self._file_duration += segment.duration
+                self.out_time += segment.duration
+        finally:
+            for download in downloads:
+                download.cancel()
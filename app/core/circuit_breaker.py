@@ -0,0 +1,128 @@
+import random
+import time
+
+from ..utils.logger import logger
+
+
+def backoff_delay(failures: int, base_seconds: float, max_seconds: float) -> float:
+    """
+    Exponential backoff with jitter for a recording whose live status check keeps failing.
+    The delay doubles with every consecutive failure, is capped at `max_seconds`, and is spread
+    over [50%, 100%] of that value so rooms of the same platform do not retry in lockstep.
+    """
+    if failures <= 0:
+        return base_seconds
+    delay = min(max_seconds, base_seconds * 2 ** (failures - 1))
+    return delay * random.uniform(0.5, 1.0)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for the stream resolution of a single platform.
+
+    After `failure_threshold` consecutive failures the breaker opens and all checks for the platform
+    are skipped. Once `recovery_seconds` have passed it goes half-open and lets exactly one room probe
+    the platform; a successful probe closes the breaker, a failed one opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_seconds: float = 300, clock=time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.probe_in_flight = False
+
+    def allow_request(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and self.clock() - self.opened_at >= self.recovery_seconds:
+            self.state = self.HALF_OPEN
+            logger.info(f"Circuit breaker half-open, probing platform: {self.name}")
+        if self.state == self.HALF_OPEN and not self.probe_in_flight:
+            self.probe_in_flight = True
+            return True
+        return False
+
+    def seconds_until_retry(self) -> float:
+        if self.state == self.CLOSED:
+            return 0
+        if self.state == self.HALF_OPEN:
+            # The probe decides the next state; rooms kept out wait one recovery window for its outcome
+            return self.recovery_seconds
+        return max(0.0, self.recovery_seconds - (self.clock() - self.opened_at))
+
+    def retry_delay(self) -> float:
+        """
+        Delay before a room skipped by the breaker is checked again. Spread over an extra 10% of the
+        recovery window, so the rooms of a platform do not all return at the moment the breaker half-opens.
+        """
+        return self.seconds_until_retry() + random.uniform(0, self.recovery_seconds * 0.1)
+
+    def release_probe(self) -> None:
+        """Give back the half-open probe token when the probe ended without a success or failure."""
+        self.probe_in_flight = False
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            logger.info(f"Circuit breaker closed, platform recovered: {self.name}")
+        self.state = self.CLOSED
+        self.failures = 0
+        self.probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"Circuit breaker opened after {self.failures} failures: {self.name}")
+            self.state = self.OPEN
+            self.opened_at = self.clock()
+
+
+class PlatformCircuitBreakers:
+    """Registry of circuit breakers keyed on platform_key."""
+
+    DEFAULT_FAILURE_THRESHOLD = 5
+    DEFAULT_RECOVERY_SECONDS = 300
+
+    def __init__(self, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 recovery_seconds: float = DEFAULT_RECOVERY_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    @classmethod
+    def from_config(cls, user_config: dict) -> "PlatformCircuitBreakers":
+        breakers = cls()
+        breakers.configure(user_config)
+        return breakers
+
+    def configure(self, user_config: dict) -> None:
+        try:
+            self.failure_threshold = max(1, int(user_config.get("circuit_breaker_failure_threshold")))
+        except (TypeError, ValueError):
+            self.failure_threshold = self.DEFAULT_FAILURE_THRESHOLD
+        try:
+            self.recovery_seconds = max(1.0, float(user_config.get("circuit_breaker_recovery_seconds")))
+        except (TypeError, ValueError):
+            self.recovery_seconds = self.DEFAULT_RECOVERY_SECONDS
+        for breaker in self._breakers.values():
+            breaker.failure_threshold = self.failure_threshold
+            breaker.recovery_seconds = self.recovery_seconds
+
+    def get(self, platform_key: str | None) -> CircuitBreaker:
+        key = platform_key or ""
+        if key not in self._breakers:
+            self._breakers[key] = CircuitBreaker(key, self.failure_threshold, self.recovery_seconds)
+        return self._breakers[key]
+
+    def get_state(self, platform_key: str | None) -> str:
+        breaker = self._breakers.get(platform_key or "")
+        return breaker.state if breaker else CircuitBreaker.CLOSED
@@ -1,6 +1,9 @@
+import contextlib
+import copy
 import json
 import os
 import shutil
+import tempfile
 from typing import Any
 
 import aiofiles
@@ -8,7 +11,44 @@ import aiofiles
 from ..utils.logger import logger
 
 
+class HotSettings:
+    """Typed values of settings read on hot paths, parsed once whenever the user config changes."""
+
+    KEYS = (
+        "loop_time_seconds", "recording_space_threshold", "enable_proxy", "proxy_address",
+        "default_platform_with_proxy",
+    )
+
+    def __init__(self, user_config: dict | None = None):
+        self.loop_time_seconds = 300
+        self.recording_space_threshold = 2.0
+        self.enable_proxy = False
+        self.proxy_address = None
+        self.proxy_platforms = frozenset()
+        self.refresh(user_config or {})
+
+    def refresh(self, user_config: dict) -> None:
+        try:
+            self.loop_time_seconds = int(user_config.get("loop_time_seconds") or 300)
+        except (TypeError, ValueError):
+            self.loop_time_seconds = 300
+        try:
+            self.recording_space_threshold = float(user_config.get("recording_space_threshold"))
+        except (TypeError, ValueError):
+            self.recording_space_threshold = 2.0
+        self.enable_proxy = bool(user_config.get("enable_proxy"))
+        self.proxy_address = user_config.get("proxy_address")
+        proxy_platforms = user_config.get("default_platform_with_proxy") or ""
+        self.proxy_platforms = frozenset(
+            platform for platform in proxy_platforms.replace("，", ",").replace(" ", "").split(",") if platform
+        )
+
+
 class ConfigManager:
+    # Parsed config files are shared by every ConfigManager of the process, e.g. one per web session
+    _shared_cache: dict[str, tuple[int, Any]] = {}
+    _initialized_paths: set[str] = set()
+
     def __init__(self, run_path):
         self.config_path = os.path.join(run_path, "config")
         self.language_config_path = os.path.join(self.config_path, "language.json")
@@ -19,9 +59,13 @@ class ConfigManager:
         self.recordings_config_path = os.path.join(self.config_path, "recordings.json")
         self.accounts_config_path = os.path.join(self.config_path, "accounts.json")
         self.web_auth_config_path = os.path.join(self.config_path, "web_auth.json")
+        self._cache = ConfigManager._shared_cache
+        self.hot_settings = HotSettings()
 
-        os.makedirs(os.path.dirname(self.default_config_path), exist_ok=True)
-        self.init()
+        if self.config_path not in ConfigManager._initialized_paths:
+            os.makedirs(os.path.dirname(self.default_config_path), exist_ok=True)
+            self.init()
+            ConfigManager._initialized_paths.add(self.config_path)
 
     def init(self):
         self.init_default_config()
@@ -69,9 +113,31 @@ class ConfigManager:
         cookies_config = {}
         self._init_config(self.web_auth_config_path, cookies_config)
 
+    def _load_config(self, config_path, error_message, cache=True):
+        """
+        Load configuration from a JSON file. Parsed files are cached until their mtime changes; callers get
+        their own copy so they can modify it freely.
+        """
+        if not cache:
+            return self._read_config(config_path, error_message)
+        return copy.deepcopy(self._load_cached(config_path, error_message))
+
+    def _load_cached(self, config_path, error_message):
+        try:
+            mtime = os.stat(config_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        cached = self._cache.get(config_path)
+        if mtime is not None and cached and cached[0] == mtime:
+            return cached[1]
+
+        config = self._read_config(config_path, error_message)
+        if mtime is not None:
+            self._cache[config_path] = (mtime, config)
+        return config
+
     @staticmethod
-    def _load_config(config_path, error_message):
-        """Load configuration from a JSON file."""
+    def _read_config(config_path, error_message):
         try:
             with open(config_path, encoding="utf-8") as file:
                 return json.load(file)
@@ -92,7 +158,9 @@ class ConfigManager:
         return self._load_config(self.user_config_path, "An error occurred while loading user config")
 
     def load_recordings_config(self):
-        return self._load_config(self.recordings_config_path, "An error occurred while loading recordings config")
+        return self._load_config(
+            self.recordings_config_path, "An error occurred while loading recordings config", cache=False
+        )
 
     def load_accounts_config(self):
         return self._load_config(self.accounts_config_path, "An error occurred while loading accounts config")
@@ -113,22 +181,44 @@ class ConfigManager:
     def load_web_auth_config(self):
         return self._load_config(self.web_auth_config_path, "An error occurred while loading web auth config")
 
-    @staticmethod
-    async def _save_config(config_path, config, success_message, error_message):
-        """Save configuration to a JSON file."""
+    async def _save_config(self, config_path, config, success_message, error_message, cache=True, raise_errors=False):
+        """
+        Save configuration to a JSON file, writing a uniquely named temp file in the same directory first and
+        replacing the target atomically. Errors are logged, and re-raised when `raise_errors` is set so the
+        caller can retry.
+        """
+        directory, file_name = os.path.split(config_path)
+        temp_path = None
         try:
-            async with aiofiles.open(config_path, "w", encoding="utf-8") as file:
+            fd, temp_path = tempfile.mkstemp(dir=directory or None, prefix=f"{file_name}.", suffix=".tmp")
+            os.close(fd)
+            async with aiofiles.open(temp_path, "w", encoding="utf-8") as file:
                 await file.write(json.dumps(config, ensure_ascii=False, indent=4))
+            if os.path.exists(config_path):
+                shutil.copymode(config_path, temp_path)
+            os.replace(temp_path, config_path)
+            temp_path = None
+            if cache:
+                self._cache[config_path] = (os.stat(config_path).st_mtime_ns, copy.deepcopy(config))
             logger.info(success_message)
         except Exception as e:
             logger.error(f"{error_message}: {e}")
+            if raise_errors:
+                raise
+        finally:
+            if temp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(temp_path)
 
     async def save_recordings_config(self, config):
+        """Save the recordings list; unlike the other configs a failed write raises, so it can be retried."""
         await self._save_config(
             self.recordings_config_path,
             config,
             success_message="Recordings configuration saved.",
             error_message="An error occurred while saving recordings config",
+            cache=False,
+            raise_errors=True,
         )
 
     async def save_accounts_config(self, config):
@@ -148,6 +238,7 @@ class ConfigManager:
         )
 
     async def save_user_config(self, config):
+        self.hot_settings.refresh(config)
         await self._save_config(
             self.user_config_path,
             config,
@@ -164,6 +255,6 @@ class ConfigManager:
         )
 
     def get_config_value(self, key: str, default: Any = None):
-        user_config = self.load_user_config()
-        default_config = self.load_default_config()
+        user_config = self._load_cached(self.user_config_path, "An error occurred while loading user config")
+        default_config = self._load_cached(self.default_config_path, "An error occurred while loading default config")
         return user_config.get(key, default_config.get(key, default))
@@ -0,0 +1,46 @@
+import asyncio
+import inspect
+
+from ..utils.logger import logger
+
+
+class EventBus:
+    """
+    In-process publish/subscribe bus between the recording core and its front ends.
+
+    The core publishes state changes (a recording card needs refreshing, a notice for the user) without
+    knowing who is listening: the Flet UI subscribes to repaint cards and show snack bars, the headless
+    daemon subscribes to log them. Coroutine subscribers are scheduled as tasks on the running loop.
+    """
+
+    RECORDING_UPDATED = "recording_updated"
+    NOTICE = "notice"
+
+    def __init__(self):
+        self._subscribers: dict[str, list] = {}
+        self._tasks = set()
+
+    def subscribe(self, topic: str, callback) -> None:
+        callbacks = self._subscribers.setdefault(topic, [])
+        if callback not in callbacks:
+            callbacks.append(callback)
+
+    def unsubscribe(self, topic: str, callback) -> None:
+        callbacks = self._subscribers.get(topic, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def unsubscribe_all(self) -> None:
+        self._subscribers.clear()
+
+    def publish(self, topic: str, *args, **kwargs) -> None:
+        for callback in list(self._subscribers.get(topic, [])):
+            try:
+                if inspect.iscoroutinefunction(callback):
+                    task = asyncio.get_running_loop().create_task(callback(*args, **kwargs))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                else:
+                    callback(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Event subscriber failed: {topic}, {e}")
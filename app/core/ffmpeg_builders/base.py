@@ -91,6 +91,8 @@ class FFmpegCommandBuilder(abc.ABC):
             "-max_muxing_queue_size", config["max_muxing_queue_size"],
             "-correct_ts_overflow", "1",
             "-avoid_negative_ts", "1",
+            "-progress", "pipe:1",
+            "-nostats",
         ]
 
         if self.headers:
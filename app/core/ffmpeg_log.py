@@ -0,0 +1,80 @@
+import asyncio
+import re
+from collections import deque
+
+MAX_LINE_LENGTH = 1024
+
+
+async def iter_lines(stream: asyncio.StreamReader, max_length: int = MAX_LINE_LENGTH):
+    """
+    Yield the decoded lines of a subprocess pipe until EOF. Reads fixed-size chunks instead of readline(),
+    so an overlong line is cut to `max_length` instead of stopping the reader and leaving the pipe undrained.
+    """
+    pending = b""
+    while chunk := await stream.read(4096):
+        *lines, pending = (pending + chunk).replace(b"\r", b"\n").split(b"\n")
+        for line in lines:
+            if line:
+                yield line[:max_length].decode(errors="ignore")
+        pending = pending[:max_length]
+    if pending:
+        yield pending.decode(errors="ignore")
+
+
+class FFmpegLog:
+    """
+    Bounded tail of the stderr output of one ffmpeg process. Keeps the last `MAX_LINES` lines and counts
+    the lines matching known error classes, so its size stays fixed however long the recording runs.
+    """
+
+    MAX_LINES = 50
+    ERROR_PATTERNS = (
+        ("http_403", re.compile(r"Server returned 403|HTTP error 403", re.IGNORECASE)),
+        ("http_404", re.compile(r"Server returned 404|HTTP error 404", re.IGNORECASE)),
+        ("http_error", re.compile(r"Server returned [45]\d\d|HTTP error [45]\d\d", re.IGNORECASE)),
+        ("timeout", re.compile(r"timed out|timeout", re.IGNORECASE)),
+        (
+            "invalid_data",
+            re.compile(r"Invalid data found|corrupt|non-existing PPS|error while decoding", re.IGNORECASE),
+        ),
+        ("connection", re.compile(r"Connection refused|Connection reset|Broken pipe|End of file", re.IGNORECASE)),
+        ("io", re.compile(r"No space left on device|Permission denied", re.IGNORECASE)),
+    )
+
+    __slots__ = ("lines", "error_counts", "last_error", "last_error_line")
+
+    def __init__(self):
+        self.lines: deque[str] = deque(maxlen=self.MAX_LINES)
+        self.error_counts: dict[str, int] = {}
+        self.last_error: str | None = None
+        self.last_error_line: str | None = None
+
+    @classmethod
+    def classify(cls, line: str) -> str | None:
+        for category, pattern in cls.ERROR_PATTERNS:
+            if pattern.search(line):
+                return category
+        return None
+
+    def add(self, line: str) -> str | None:
+        """Store one stderr line and return its error class, if it has one."""
+        line = line.strip()
+        if not line:
+            return None
+        self.lines.append(line)
+        category = self.classify(line)
+        if category:
+            self.error_counts[category] = self.error_counts.get(category, 0) + 1
+            self.last_error = category
+            self.last_error_line = line
+        return category
+
+    def tail(self, count: int | None = None) -> list[str]:
+        lines = list(self.lines)
+        return lines[-count:] if count else lines
+
+    def error_summary(self) -> str | None:
+        """The most recent classified error line, or the last line written if none was classified."""
+        if self.last_error_line:
+            return f"[{self.last_error}] {self.last_error_line}"
+        return self.lines[-1] if self.lines else None
@@ -0,0 +1,103 @@
+import time
+
+
+def _to_float(value: str | None, suffix: str = "") -> float | None:
+    if not value:
+        return None
+    value = value.strip()
+    if suffix and value.endswith(suffix):
+        value = value[:-len(suffix)]
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _to_int(value: str | None) -> int | None:
+    number = _to_float(value)
+    return int(number) if number is not None else None
+
+
+class FFmpegProgress:
+    """
+    Incremental parser for the key=value blocks ffmpeg writes with `-progress pipe:1`.
+
+    ffmpeg writes one block roughly every half second, each ending with a `progress=continue` line, or
+    `progress=end` when it exits. Besides the values reported by ffmpeg, the parser measures the rate at
+    which the output file actually grows between two blocks.
+    """
+
+    __slots__ = (
+        "bitrate_kbps",
+        "total_size",
+        "out_time_seconds",
+        "speed",
+        "drop_frames",
+        "dup_frames",
+        "write_rate",
+        "ended",
+        "updated_at",
+        "_block",
+    )
+
+    def __init__(self):
+        self.bitrate_kbps: float | None = None
+        self.total_size = 0
+        self.out_time_seconds = 0.0
+        self.speed: float | None = None
+        self.drop_frames = 0
+        self.dup_frames = 0
+        self.write_rate: float | None = None  # Bytes per second written to the output between two blocks
+        self.ended = False
+        self.updated_at: float | None = None
+        self._block: dict[str, str] = {}
+
+    def feed(self, line: str) -> bool:
+        """Consume one output line. Return True when it completed a block and the values were updated."""
+        key, sep, value = line.strip().partition("=")
+        if not sep:
+            return False
+        if key != "progress":
+            self._block[key] = value
+            return False
+        self._apply(self._block, time.monotonic())
+        self._block = {}
+        self.ended = value.strip() == "end"
+        return True
+
+    def _apply(self, block: dict[str, str], now: float) -> None:
+        total_size = _to_int(block.get("total_size"))
+        if total_size is not None:
+            if self.updated_at is not None and now > self.updated_at:
+                self.write_rate = max(total_size - self.total_size, 0) / (now - self.updated_at)
+            self.total_size = total_size
+        self.updated_at = now
+
+        out_time_us = _to_int(block.get("out_time_us"))
+        if out_time_us is not None:
+            self.out_time_seconds = out_time_us / 1_000_000
+        self.bitrate_kbps = _to_float(block.get("bitrate"), "kbits/s")
+        self.speed = _to_float(block.get("speed"), "x")
+        self.drop_frames = _to_int(block.get("drop_frames")) or 0
+        self.dup_frames = _to_int(block.get("dup_frames")) or 0
+
+    def format_speed(self) -> str:
+        """
+        Card text: the measured write rate, ffmpeg's speed relative to real time and the output bitrate,
+        followed by the dropped and duplicated frame counts once ffmpeg reports any.
+        """
+        parts = [f"{self.write_rate / 1024:.1f} KB/s" if self.write_rate is not None else "X KB/s"]
+        if self.speed is not None:
+            parts.append(f"{self.speed:.2f}x")
+        if self.bitrate_kbps is not None:
+            parts.append(f"{self.bitrate_kbps:.0f} kbit/s")
+        if self.drop_frames or self.dup_frames:
+            parts.append(f"drop {self.drop_frames} dup {self.dup_frames}")
+        return " · ".join(parts)
+
+    def summary(self) -> str:
+        bitrate = f"{self.bitrate_kbps:.1f} kbit/s" if self.bitrate_kbps is not None else "N/A"
+        return (
+            f"size={self.total_size / 1024 / 1024:.1f} MB, time={self.out_time_seconds:.0f}s, "
+            f"bitrate={bitrate}, drop={self.drop_frames}, dup={self.dup_frames}"
+        )
@@ -1,7 +1,6 @@
 import os
 
 from ..utils.logger import logger
-from .config_manager import ConfigManager
 
 
 class LanguageManager:
@@ -19,11 +18,10 @@ class LanguageManager:
         """
         Initialize the LanguageManager with settings and load the language configuration.
         """
-        config_manager = ConfigManager(self.app.run_path)
         logger.info(f"Language Code: {self.app.settings.language_code}")
         i18n_filename = f"{self.app.settings.language_code}.json"
         i18n_file_path = os.path.join(self.app.run_path, "locales", i18n_filename)
-        self.language = config_manager.load_i18n_config(i18n_file_path)
+        self.language = self.app.config_manager.load_i18n_config(i18n_file_path)
         return self.language
 
     def add_observer(self, observer):
@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+from ..utils.logger import logger
+from .adaptive_interval import AdaptiveIntervalPolicy
+from .circuit_breaker import PlatformCircuitBreakers
+from .event_bus import EventBus
+from .monitor_scheduler import MonitorScheduler
+from .rate_limiter import PlatformRateLimiter
+from .stream_probe import StreamInfoCache, StreamUrlProbe
+
+
+class MonitoringEngine:
+    """
+    Process-wide live monitoring state shared by every RecordingManager.
+
+    In web mode each browser session builds its own App and RecordingManager. They all attach to this
+    engine, so there is one check schedule, one set of platform limits and one periodic check loop no matter
+    how many sessions are open. Checks and the recordings they start run on the runner, the manager of a
+    `HeadlessApp` that belongs to no session, so they never depend on a page that may disconnect. Sessions
+    only subscribe to the runner's events to repaint their cards and show its notices.
+    """
+
+    MIN_TICK_SECONDS = 1
+    _instance = None
+
+    @classmethod
+    def get_instance(cls, user_config: dict) -> "MonitoringEngine":
+        if cls._instance is None:
+            cls._instance = cls(user_config)
+        return cls._instance
+
+    def __init__(self, user_config: dict):
+        self.scheduler = MonitorScheduler()
+        self.live_check_limiter = PlatformRateLimiter.from_config(user_config)
+        self.adaptive_interval = AdaptiveIntervalPolicy.from_config(user_config)
+        self.circuit_breakers = PlatformCircuitBreakers.from_config(user_config)
+        self.stream_probe = StreamUrlProbe()
+        self.stream_info_cache = StreamInfoCache.from_config(user_config)
+        self.max_check_interval: int | None = None  # Longest check interval under the committed settings
+        self.periodic_task_started = False
+        self.managers = []
+        self.runner = None
+        self.event_bus = EventBus()
+        self._wakeup_event = asyncio.Event()
+        self._next_wakeup = None
+
+    def attach(self, manager) -> None:
+        """
+        Attach a RecordingManager. The manager of a headless app becomes the runner; a session's manager is
+        subscribed to the runner's events, and the first one creates the runner if there is none yet.
+        """
+        if getattr(manager.app, "runs_monitoring", False):
+            if self.runner is None:
+                self.runner = manager
+            return
+        if manager not in self.managers:
+            self.managers.append(manager)
+            self.event_bus.subscribe(EventBus.RECORDING_UPDATED, manager.app.on_recording_updated)
+            self.event_bus.subscribe(EventBus.NOTICE, manager.app.on_notice)
+        if self.runner is None:
+            self.create_runner(manager.app)
+
+    def create_runner(self, app) -> None:
+        from ..headless import HeadlessApp
+
+        # Sharing the process manager lets the desktop close handler wait for the runner's recordings too
+        HeadlessApp(event_bus=self.event_bus, process_manager=app.process_manager)
+        logger.info("Monitoring runner created")
+
+    def detach(self, manager) -> None:
+        """Detach a session's manager; monitoring and recording carry on on the runner."""
+        if manager in self.managers:
+            self.managers.remove(manager)
+            self.event_bus.unsubscribe(EventBus.RECORDING_UPDATED, manager.app.on_recording_updated)
+            self.event_bus.unsubscribe(EventBus.NOTICE, manager.app.on_notice)
+
+    def wakeup(self, deadline: float) -> None:
+        """Wake the periodic loop early if `deadline` is earlier than the one it is sleeping towards."""
+        if self._next_wakeup is not None and deadline < self._next_wakeup:
+            self._wakeup_event.set()
+
+    async def run_periodic_check(self, interval: int = 180):
+        """
+        Run the periodic live check loop. The loop sleeps until the earliest scheduled deadline, capped at the
+        current loop time. Only the first call starts the loop; later calls return immediately.
+        """
+        if self.periodic_task_started:
+            return
+        self.periodic_task_started = True
+        logger.info("Periodic live check loop started")
+
+        manager = self.runner
+        last_space_check = time.monotonic()
+        while True:
+            max_sleep = manager.loop_time_seconds or interval
+            timeout = min(max(self.scheduler.seconds_until_next(max_sleep), self.MIN_TICK_SECONDS), max_sleep)
+            self._next_wakeup = time.monotonic() + timeout
+            self._wakeup_event.clear()
+            try:
+                await asyncio.wait_for(self._wakeup_event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+            now = time.monotonic()
+            try:
+                if manager.settings.reload_if_changed():
+                    # A session saved new settings; the runner picks them up from the config files
+                    manager.apply_check_interval()
+                if now - last_space_check >= max_sleep:
+                    last_space_check = now
+                    await manager.check_free_space()
+                if manager.app.recording_enabled:
+                    await manager.check_all_live_status()
+            except Exception as e:
+                logger.error(f"Periodic live check failed: {e}")
@@ -0,0 +1,88 @@
+import heapq
+import itertools
+import time
+
+
+class MonitorScheduler:
+    """
+    Keeps the next live-check deadline of every monitored recording in a min-heap.
+
+    Deadlines are taken from a monotonic clock, so they are not affected by wall-clock changes or by
+    midnight. Rescheduling a recording pushes a new heap entry and invalidates the previous one lazily,
+    which keeps both operations O(log n) and lets each tick pop only the recordings that are due.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self._heap: list[tuple[float, int, str]] = []
+        self._entries: dict[str, tuple[float, int]] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, rec_id: str) -> bool:
+        return rec_id in self._entries
+
+    def schedule(self, rec_id: str, delay: float) -> float:
+        """Schedule (or reschedule) a recording to be checked after `delay` seconds."""
+        deadline = self.clock() + max(0.0, float(delay))
+        seq = next(self._counter)
+        self._entries[rec_id] = (deadline, seq)
+        heapq.heappush(self._heap, (deadline, seq, rec_id))
+        self._compact_if_needed()
+        return deadline
+
+    def unschedule(self, rec_id: str) -> None:
+        """Remove a recording from the schedule. The stale heap entry is discarded when popped."""
+        self._entries.pop(rec_id, None)
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._entries.clear()
+
+    def pop_due(self) -> list[str]:
+        """Pop and return the ids of all recordings whose deadline has passed."""
+        now = self.clock()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _deadline, seq, rec_id = heapq.heappop(self._heap)
+            entry = self._entries.get(rec_id)
+            if entry and entry[1] == seq:
+                del self._entries[rec_id]
+                due.append(rec_id)
+        return due
+
+    def next_deadline(self) -> float | None:
+        """Return the earliest pending deadline, dropping stale entries on the way."""
+        while self._heap:
+            deadline, seq, rec_id = self._heap[0]
+            entry = self._entries.get(rec_id)
+            if entry and entry[1] == seq:
+                return deadline
+            heapq.heappop(self._heap)
+        return None
+
+    def seconds_until_next(self, default: float) -> float:
+        deadline = self.next_deadline()
+        if deadline is None:
+            return default
+        return max(0.0, deadline - self.clock())
+
+    def clamp(self, max_delay: float) -> None:
+        """
+        Pull every deadline that lies further away than `max_delay` seconds in to `now + max_delay`.
+        Used when the global check interval is shortened so the change takes effect immediately.
+        """
+        limit = self.clock() + max(0.0, float(max_delay))
+        for rec_id, (deadline, _seq) in list(self._entries.items()):
+            if deadline > limit:
+                seq = next(self._counter)
+                self._entries[rec_id] = (limit, seq)
+                heapq.heappush(self._heap, (limit, seq, rec_id))
+        self._compact_if_needed()
+
+    def _compact_if_needed(self) -> None:
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(deadline, seq, rec_id) for rec_id, (deadline, seq) in self._entries.items()]
+            heapq.heapify(self._heap)
@@ -1,17 +1,27 @@
 import abc
 import inspect
-import re
 import threading
-from typing import Any, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
-from streamget import StreamData
+from .registry import PlatformSpec, platform_registry
+
+if TYPE_CHECKING:
+    from streamget import StreamData
 
 T = TypeVar("T", bound="PlatformHandler")
-InstanceKey = tuple[str | None, tuple[tuple[str, str], ...] | None, str, str | None]
+InstanceKey = tuple[str, str | None, tuple[tuple[str, str], ...] | None, str, str | None]
 
 
 class PlatformHandler(abc.ABC):
-    _registry: dict[str, type["PlatformHandler"]] = {}
+    """
+    Fetches the stream information of the rooms of one platform.
+
+    Handlers may also provide the optional `async is_live_batch(live_urls)` capability: report the live
+    status of many rooms with as few requests as possible, as a mapping of live URL to True/False, or None
+    for rooms whose status could not be determined. Callers check for it with `hasattr`.
+    """
+
+    max_batch_size: int = 50
     _instances: dict[InstanceKey, "PlatformHandler"] = {}
     _lock: threading.Lock = threading.Lock()
 
@@ -34,7 +44,7 @@ class PlatformHandler(abc.ABC):
         self.account_type = account_type
 
     @abc.abstractmethod
-    async def get_stream_info(self, live_url: str) -> StreamData:
+    async def get_stream_info(self, live_url: str) -> "StreamData":
         """
         Abstract method to get stream information based on the live URL.
         """
@@ -43,40 +53,23 @@ class PlatformHandler(abc.ABC):
     @classmethod
     def register(cls: type[T], *patterns: str) -> type[T]:
         """
-        Register a platform handler class with one or more URL patterns.
+        Register a custom platform handler class with one or more URL patterns. The patterns are matched
+        after the built-in platforms, so a URL a built-in platform supports keeps its handler; plugins that
+        replace a built-in platform use the `streamcap.platforms` entry point instead.
         """
-        with cls._lock:
-            for pattern in patterns:
-                cls._registry[pattern] = cls
+        platform = getattr(cls, "platform", None) or cls.__name__
+        spec = PlatformSpec(platform, platform, patterns, handler_class=cls)
+        platform_registry.register(spec, override=False)
         return cls
 
-    @classmethod
-    def get_registered_patterns(cls) -> dict[str, type["PlatformHandler"]]:
-        """
-        Return a copy of the registered URL patterns and their corresponding handler classes.
-        """
-        with cls._lock:
-            return cls._registry.copy()
-
     @classmethod
     def _get_instance_key(
-        cls, proxy: str | None, cookies: str | None, record_quality: str, platform: str | None
+        cls, spec: PlatformSpec, proxy: str | None, cookies: str | None, record_quality: str, platform: str | None
     ) -> InstanceKey:
         """
         Generate a unique key for each instance based on the provided parameters.
         """
-        return proxy, cookies, record_quality, platform
-
-    @classmethod
-    def _get_handler_class(cls, live_url: str) -> type["PlatformHandler"] | None:
-        """
-        Find the appropriate handler class based on the live URL.
-        """
-        registered_patterns = cls.get_registered_patterns()
-        for pattern, handler_class in registered_patterns.items():
-            if re.search(pattern, live_url):
-                return handler_class
-        return None
+        return spec.key, proxy, cookies, record_quality, platform
 
     @classmethod
     def get_handler_instance(
@@ -93,14 +86,16 @@ class PlatformHandler(abc.ABC):
         """
         Get or create an instance of a platform handler based on the live URL and other parameters.
         """
-        handler_class = cls._get_handler_class(live_url)
+        spec = platform_registry.find(live_url)
+        handler_class = spec.get_handler_class() if spec else None
         if not handler_class:
             return None
 
-        instance_key = cls._get_instance_key(proxy, cookies, record_quality, platform)
+        instance_key = cls._get_instance_key(spec, proxy, cookies, record_quality, platform)
         if instance_key not in cls._instances:
             init_signature = inspect.signature(handler_class.__init__)
             handler_kwargs: dict[str, Any] = {
+                "spec": spec,
                 "proxy": proxy,
                 "cookies": cookies,
                 "record_quality": record_quality,
@@ -0,0 +1,247 @@
+import functools
+import re
+import threading
+from importlib.metadata import entry_points
+from urllib.parse import urlsplit
+
+from ...utils.logger import logger
+
+PLUGIN_ENTRY_POINT_GROUP = "streamcap.platforms"
+
+
+class PlatformSpec:
+    """
+    Declarative description of a live platform.
+
+    :param key: Platform key saved with the recordings and used by the filters and proxy settings.
+    :param name: Display name of the platform.
+    :param patterns: URL regexes that identify the platform, searched in table order.
+    :param client: Name of the streamget live stream class, or None for platforms without a stream handler.
+    :param fetch_method: Client method that fetches the room data for a live URL.
+    :param app_url_marker: URL substring for which `fetch_app_stream_data` is used instead of `fetch_method`.
+    :param credentials: Whether the client is created with the account username and password.
+    :param handler_class: Custom PlatformHandler subclass used instead of the streamget handler, or the name of
+        a class in the handlers module, imported on first use.
+    """
+
+    __slots__ = (
+        "key",
+        "name",
+        "patterns",
+        "client",
+        "fetch_method",
+        "app_url_marker",
+        "credentials",
+        "handler_class",
+    )
+
+    def __init__(
+        self,
+        key: str,
+        name: str,
+        patterns: tuple[str, ...],
+        client: str | None = None,
+        fetch_method: str = "fetch_web_stream_data",
+        app_url_marker: str | None = None,
+        credentials: bool = False,
+        handler_class: type | str | None = None,
+    ):
+        self.key = key
+        self.name = name
+        self.patterns = patterns
+        self.client = client
+        self.fetch_method = fetch_method
+        self.app_url_marker = app_url_marker
+        self.credentials = credentials
+        self.handler_class = handler_class
+
+    def get_handler_class(self) -> type | None:
+        if self.handler_class is not None and not isinstance(self.handler_class, str):
+            return self.handler_class
+        if self.client is None:
+            return None
+        from . import handlers
+        return getattr(handlers, self.handler_class or "StreamgetHandler")
+
+    def __repr__(self):
+        return f"PlatformSpec({self.key!r})"
+
+
+APP_FETCH_METHOD = "fetch_app_stream_data"
+
+PLATFORMS = (
+    PlatformSpec(
+        "douyin", "抖音直播", (r"https://.*\.douyin\.com/",), "DouyinLiveStream",
+        app_url_marker="v.douyin.com",
+    ),
+    PlatformSpec("tiktok", "TikTok直播", (r"https://.*\.tiktok\.com/",), "TikTokLiveStream"),
+    PlatformSpec("kuaishou", "快手直播", (r"https://live\.kuaishou\.com/",), "KwaiLiveStream"),
+    PlatformSpec("huya", "虎牙直播", (r"https://.*\.huya\.com/",), "HuyaLiveStream", APP_FETCH_METHOD),
+    PlatformSpec("douyu", "斗鱼直播", (r"https://.*\.douyu\.com/",), "DouyuLiveStream"),
+    PlatformSpec("yy", "YY直播", (r"https://.*\.yy\.com/",), "YYLiveStream"),
+    PlatformSpec(
+        "bilibili", "B站直播", (r"https://live\.bilibili\.com/",), "BilibiliLiveStream",
+        handler_class="BilibiliHandler",
+    ),
+    PlatformSpec("xiaohongshu", "小红书直播", (r"www\.xiaohongshu\.com/",), "RedNoteLiveStream", APP_FETCH_METHOD),
+    PlatformSpec("xhs", "小红书直播", (r"xhslink\.com/",), "RedNoteLiveStream", APP_FETCH_METHOD),
+    PlatformSpec("bigo", "Bigo直播", (r"https://www\.bigo\.tv/", r"https://slink\.bigovideo\.tv/"), "BigoLiveStream"),
+    PlatformSpec("blued", "Blued直播", (r"https://app\.blued\.cn/",), "BluedLiveStream"),
+    PlatformSpec("soop", "SOOP", (r"sooplive\.co\.kr/",), "SoopLiveStream", credentials=True),
+    PlatformSpec("netease", "网易CC直播", (r"cc\.163\.com/",), "NeteaseLiveStream"),
+    PlatformSpec("qiandurebo", "千度热播", (r"qiandurebo\.com/",), "QiandureboLiveStream"),
+    PlatformSpec("pandalive", "PandaTV", (r"\.pandalive\.co\.kr/",), "PandaLiveStream"),
+    PlatformSpec("maoerfm", "猫耳FM直播", (r"fm\.missevan\.com/",), "MaoerLiveStream"),
+    PlatformSpec("winktv", "WinkTV", (r"www\.winktv\.co\.kr/",), "WinkTVLiveStream"),
+    PlatformSpec("flextv", "FlexTV", (r"www\.flextv\.co\.kr/",), "FlexTVLiveStream", credentials=True),
+    PlatformSpec("look", "Look直播", (r"look\.163\.com/",), "LookLiveStream"),
+    PlatformSpec("popkontv", "PopkonTV", (r"www\.popkontv\.com/",), "PopkonTVLiveStream", credentials=True),
+    PlatformSpec("twitcasting", "TwitCasting", (r"twitcasting\.tv/",), "TwitCastingLiveStream", credentials=True),
+    PlatformSpec("baidu", "百度直播", (r"live\.baidu\.com/",), "BaiduLiveStream"),
+    PlatformSpec("weibo", "微博直播", (r"weibo\.com/",), "WeiboLiveStream"),
+    PlatformSpec("kugou", "酷狗直播", (r"\.kugou\.com/",), "KugouLiveStream"),
+    PlatformSpec("twitch", "TwitchTV", (r"https://.*\.twitch\.tv/",), "TwitchLiveStream"),
+    PlatformSpec("liveme", "LiveMe", (r"https://.*\.liveme\.com/",), "LiveMeLiveStream"),
+    PlatformSpec("huajiao", "花椒直播", (r"https://.*\.huajiao\.com/",), "HuajiaoLiveStream"),
+    PlatformSpec("liuxing", "流星直播", (r"7u66\.com/",)),
+    PlatformSpec("showroom", "ShowRoom", (r"\.showroom-live\.com/",), "ShowRoomLiveStream"),
+    PlatformSpec("acfun", "Acfun", (r"live\.acfun\.cn/",), "AcfunLiveStream"),
+    PlatformSpec("changliao", "畅聊直播", (r"tlclw\.com/",)),
+    PlatformSpec("yingbo", "音播直播", (r"live\.ybw1666\.com/",), "YinboLiveStream"),
+    PlatformSpec("inke", "映客直播", (r"https://.*\.inke\.cn/",), "InkeLiveStream"),
+    PlatformSpec("zhihu", "知乎直播", (r"https://.*\.zhihu\.com/",), "ZhihuLiveStream"),
+    PlatformSpec("chzzk", "CHZZK", (r"chzzk\.naver\.com/",), "ChzzkLiveStream"),
+    PlatformSpec("haixiu", "嗨秀直播", (r"https://.*\.haixiutv\.com/",), "HaixiuLiveStream"),
+    PlatformSpec("vvxq", "VV星球", (r"\.vvxqiu\.com/",), "VVXQLiveStream"),
+    PlatformSpec("17live", "17Live", (r"17\.live/",), "YiqiLiveStream"),
+    PlatformSpec("lang", "浪Live", (r"https://.*\.lang\.live/",), "LangLiveStream"),
+    PlatformSpec("piaopiao", "漂漂直播", (r"m\.pp\.weimipopo\.com/",), "PiaopaioLiveStream"),
+    PlatformSpec("6room", "六间房直播", (r"v\.6\.cn/",), "SixRoomLiveStream"),
+    PlatformSpec("lehai", "乐嗨直播", (r"https://.*\.lehaitv\.com/",), "LehaiLiveStream"),
+    PlatformSpec("catshow", "花猫直播", (r"h\.catshow168\.com/",), "HuamaoLiveStream"),
+    PlatformSpec("shopee", "shopee", (r"\.shp\.ee/",), "ShopeeLiveStream"),
+    PlatformSpec("youtube", "Youtube", (r"\.youtube\.com/",), "YoutubeLiveStream"),
+    PlatformSpec("taobao", "淘宝直播", (r"\.tb\.cn/",), "TaobaoLiveStream"),
+    PlatformSpec("jd", "京东直播", (r"//3\.cn/",), "JDLiveStream"),
+    PlatformSpec("faceit", "faceit", (r"https://.*\.faceit\.com/",), "FaceitLiveStream"),
+    PlatformSpec("custom", "自定义录制直播", (r"\.m3u8", r"\.flv")),
+)
+
+
+class PlatformDispatcher:
+    """
+    Compiled URL lookup over a fixed list of platforms.
+
+    The URL host is reduced to its registrable domain and looked up in an index built from the domain
+    literals of the patterns, so most URLs are only checked against the one or two platforms of their
+    domain. URLs without a known domain fall back to one precompiled regex that tries every platform in
+    table order. Results are memoized per URL in a bounded LRU cache.
+    """
+
+    CACHE_SIZE = 4096
+    SECOND_LEVEL_SUFFIXES = frozenset({"co.kr", "co.jp", "co.uk", "com.cn", "com.hk", "com.sg", "com.tw"})
+    DOMAIN_LITERAL = re.compile(r"(?:[A-Za-z0-9-]+\\\.)+[A-Za-z0-9-]+")
+
+    def __init__(self, specs: list[PlatformSpec]):
+        self.host_index: dict[str, list[PlatformSpec]] = {}
+        self.spec_patterns: dict[PlatformSpec, re.Pattern] = {}
+        self.group_specs: dict[str, PlatformSpec] = {}
+        alternatives = []
+        for spec in specs:
+            if not spec.patterns:
+                continue
+            self.spec_patterns[spec] = re.compile("|".join(f"(?:{pattern})" for pattern in spec.patterns))
+            for pattern in spec.patterns:
+                for literal in self.DOMAIN_LITERAL.findall(pattern):
+                    platforms = self.host_index.setdefault(self.registrable_domain(literal.replace("\\.", ".")), [])
+                    if spec not in platforms:
+                        platforms.append(spec)
+            group = f"_spec{len(self.group_specs)}"
+            self.group_specs[group] = spec
+            # Each alternative is a lookahead over the whole URL, so the first platform in table order wins
+            alternatives.append(f"(?=.*?(?P<{group}>{self.spec_patterns[spec].pattern}))")
+        self.any_pattern = re.compile("|".join(alternatives), re.DOTALL) if alternatives else None
+        self.find = functools.lru_cache(maxsize=self.CACHE_SIZE)(self._find)
+
+    @classmethod
+    def registrable_domain(cls, host: str) -> str:
+        labels = host.lower().rstrip(".").split(".")
+        count = 3 if len(labels) >= 3 and ".".join(labels[-2:]) in cls.SECOND_LEVEL_SUFFIXES else 2
+        return ".".join(labels[-count:])
+
+    def _find(self, url: str) -> PlatformSpec | None:
+        try:
+            host = urlsplit(url).hostname
+        except ValueError:
+            host = None
+        if host:
+            for spec in self.host_index.get(self.registrable_domain(host), ()):
+                if self.spec_patterns[spec].search(url):
+                    return spec
+        if self.any_pattern is None:
+            return None
+        match = self.any_pattern.match(url)
+        return self.group_specs[match.lastgroup] if match and match.lastgroup else None
+
+
+class PlatformRegistry:
+    """
+    Ordered table of the supported platforms. Platforms contributed by plugins through the
+    `streamcap.platforms` entry point group are loaded on the first lookup and take precedence over the
+    built-in table; an entry point loads a PlatformSpec or a sequence of them.
+    """
+
+    def __init__(self, platforms=()):
+        self._lock = threading.Lock()
+        self._plugin_specs: list[PlatformSpec] = []
+        self._specs: list[PlatformSpec] = list(platforms)
+        self._plugins_loaded = False
+        self._dispatcher: PlatformDispatcher | None = None
+
+    def register(self, spec: PlatformSpec, override: bool = True) -> PlatformSpec:
+        """
+        Add a platform. With `override` it is matched before the built-in platforms, like a plugin;
+        otherwise after them, so it only handles URLs no built-in platform matches.
+        """
+        with self._lock:
+            (self._plugin_specs if override else self._specs).append(spec)
+            self._dispatcher = None
+        return spec
+
+    def load_plugins(self) -> None:
+        with self._lock:
+            if self._plugins_loaded:
+                return
+            self._plugins_loaded = True
+        for entry_point in entry_points(group=PLUGIN_ENTRY_POINT_GROUP):
+            try:
+                loaded = entry_point.load()
+            except Exception as e:
+                logger.error(f"Failed to load platform plugin {entry_point.name}: {e}")
+                continue
+            for spec in [loaded] if isinstance(loaded, PlatformSpec) else loaded:
+                self.register(spec)
+                logger.info(f"Loaded platform plugin: {spec.key} ({entry_point.name})")
+
+    @property
+    def specs(self) -> list[PlatformSpec]:
+        self.load_plugins()
+        with self._lock:
+            return self._plugin_specs + self._specs
+
+    @property
+    def dispatcher(self) -> PlatformDispatcher:
+        dispatcher = self._dispatcher
+        if dispatcher is None:
+            dispatcher = PlatformDispatcher(self.specs)
+            with self._lock:
+                if self._dispatcher is None:
+                    self._dispatcher = dispatcher
+        return dispatcher
+
+    def find(self, url: str) -> PlatformSpec | None:
+        """Return the platform whose patterns match the URL."""
+        return self.dispatcher.find(url)
+
+
+platform_registry = PlatformRegistry(PLATFORMS)
@@ -0,0 +1,116 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+from ..utils.logger import logger
+
+
+class TokenBucket:
+    """
+    Asynchronous token bucket. `rate` tokens are added per second up to `capacity`;
+    a rate of 0 or less disables the limit.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None, clock=time.monotonic):
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1.0, self.rate))
+        self.clock = clock
+        self.tokens = self.capacity
+        self.updated_at = clock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class PlatformRateLimiter:
+    """
+    Limits live status checks per platform with a max-in-flight semaphore and a requests-per-second
+    token bucket, so a large watchlist on one platform does not burst into the platform's throttling.
+    """
+
+    DEFAULT_MAX_IN_FLIGHT = 5
+    DEFAULT_REQUESTS_PER_SECOND = 2.0
+
+    def __init__(
+        self,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        overrides: dict[str, tuple[int, float]] | None = None,
+    ):
+        self.max_in_flight = max_in_flight
+        self.requests_per_second = requests_per_second
+        self.overrides = overrides or {}
+        self._limits: dict[str, tuple[asyncio.Semaphore, TokenBucket]] = {}
+
+    @classmethod
+    def from_config(cls, user_config: dict) -> "PlatformRateLimiter":
+        limiter = cls()
+        limiter.configure(user_config)
+        return limiter
+
+    def configure(self, user_config: dict) -> None:
+        """(Re)load the limits from the user settings. Checks already in flight keep their old limits."""
+        self.max_in_flight = self._to_number(
+            user_config.get("platform_max_concurrent_checks"), int, self.DEFAULT_MAX_IN_FLIGHT
+        )
+        self.requests_per_second = self._to_number(
+            user_config.get("platform_checks_per_second"), float, self.DEFAULT_REQUESTS_PER_SECOND
+        )
+        self.overrides = self.parse_overrides(user_config.get("custom_platform_check_limits", ""))
+        self._limits.clear()
+
+    @staticmethod
+    def _to_number(value, cast, default):
+        try:
+            return cast(value)
+        except (TypeError, ValueError):
+            return default
+
+    @classmethod
+    def parse_overrides(cls, text: str | None) -> dict[str, tuple[int, float]]:
+        """
+        Parse per-platform limits written as `platform_key=max_in_flight/requests_per_second`,
+        separated by commas, e.g. `douyin=3/1.5, tiktok=2/0.5`.
+        """
+        overrides = {}
+        if not text:
+            return overrides
+        for item in text.replace("，", ",").replace(" ", "").split(","):
+            if not item:
+                continue
+            try:
+                platform_key, limits = item.split("=", maxsplit=1)
+                max_in_flight, _, requests_per_second = limits.partition("/")
+                overrides[platform_key] = (
+                    int(max_in_flight),
+                    float(requests_per_second) if requests_per_second else cls.DEFAULT_REQUESTS_PER_SECOND,
+                )
+            except ValueError:
+                logger.warning(f"Invalid platform check limit ignored: {item}")
+        return overrides
+
+    def get_limits(self, platform_key: str | None) -> tuple[int, float]:
+        return self.overrides.get(platform_key or "", (self.max_in_flight, self.requests_per_second))
+
+    def _get_limiters(self, platform_key: str | None) -> tuple[asyncio.Semaphore, TokenBucket]:
+        key = platform_key or ""
+        if key not in self._limits:
+            max_in_flight, requests_per_second = self.get_limits(platform_key)
+            self._limits[key] = (asyncio.Semaphore(max(1, max_in_flight)), TokenBucket(requests_per_second))
+        return self._limits[key]
+
+    @asynccontextmanager
+    async def limit(self, platform_key: str | None):
+        semaphore, bucket = self._get_limiters(platform_key)
+        async with semaphore:
+            await bucket.acquire()
+            yield
@@ -1,37 +1,98 @@
 import asyncio
+import copy
 import threading
+import time
 from datetime import datetime, timedelta
 
 from ..messages.message_pusher import MessagePusher
 from ..models.recording_model import Recording
 from ..models.recording_status_model import RecordingStatus
 from ..utils import utils
+from ..utils.http_client import close_http_clients
 from ..utils.logger import logger
-from .platform_handlers import get_platform_info
+from .adaptive_interval import AdaptiveIntervalPolicy
+from .circuit_breaker import CircuitBreaker, backoff_delay
+from .event_bus import EventBus
+from .monitor_engine import MonitoringEngine
+from .platform_handlers import get_platform_handler, get_platform_info
+from .recording_store import create_recording_store
+from .recordings_persister import RecordingsPersister
 from .stream_manager import LiveStreamRecorder
+from .stream_probe import ProbeResult
 
 
 class GlobalRecordingState:
     recordings = []
+    index = {}
+    observers = []
+    loaded = False
     lock = threading.Lock()
+    store = None
+    persister = None
+    active_ids = set()
+
+    @classmethod
+    def on_field_changed(cls, recording, field_name):
+        """Keep `active_ids` in step with the recordings that are currently recording."""
+        if field_name != "is_recording":
+            return
+        if recording.is_recording:
+            cls.active_ids.add(recording.rec_id)
+        else:
+            cls.active_ids.discard(recording.rec_id)
 
 
 class RecordingManager:
+    MIN_TICK_SECONDS = MonitoringEngine.MIN_TICK_SECONDS
+
     def __init__(self, app):
         self.app = app
         self.settings = app.settings
-        self.periodic_task_started = False
         self.loop_time_seconds = None
+        self.engine = MonitoringEngine.get_instance(self.settings.user_config)
+        self.engine.attach(self)
+        self.scheduler = self.engine.scheduler
+        self.live_check_limiter = self.engine.live_check_limiter
+        self.adaptive_interval = self.engine.adaptive_interval
+        self.circuit_breakers = self.engine.circuit_breakers
+        self.stream_probe = self.engine.stream_probe
+        self.stream_info_cache = self.engine.stream_info_cache
         self.app.language_manager.add_observer(self)
+        if GlobalRecordingState.store is None:
+            Recording.add_field_observer(GlobalRecordingState.on_field_changed)
+            GlobalRecordingState.store = create_recording_store(self.app.config_manager, self.settings.user_config)
+            GlobalRecordingState.persister = RecordingsPersister(
+                GlobalRecordingState.store.save,
+                lambda: [rec.to_dict() for rec in GlobalRecordingState.recordings],
+            )
+        self.store = GlobalRecordingState.store
+        self.persister = GlobalRecordingState.persister
         self.load_recordings()
         self._ = {}
         self.load()
         self.initialize_dynamic_state()
+        if self.engine.max_check_interval is None:
+            self.engine.max_check_interval = self.get_max_check_interval()
 
     @property
     def recordings(self):
         return GlobalRecordingState.recordings
 
+    @property
+    def active_recordings(self):
+        """The recordings that are currently recording, without scanning the whole list."""
+        index = GlobalRecordingState.index
+        return [index[rec_id] for rec_id in list(GlobalRecordingState.active_ids) if rec_id in index]
+
+    @property
+    def runner(self) -> "RecordingManager":
+        """The manager that runs live checks and recordings independently of any session."""
+        return self.engine.runner or self
+
+    @property
+    def periodic_task_started(self):
+        return self.engine.periodic_task_started
+
     @recordings.setter
     def recordings(self, value):
         raise AttributeError("Please use add_recording/update_recording methods to modify data")
@@ -42,45 +103,111 @@ class RecordingManager:
             self._.update(language.get(key, {}))
 
     def load_recordings(self):
-        """Load recordings from a JSON file into objects."""
-        recordings_data = self.app.config_manager.load_recordings_config()
-        if not GlobalRecordingState.recordings:
+        """Load recordings from the recording store into objects."""
+        if not GlobalRecordingState.loaded:
+            GlobalRecordingState.loaded = True
+            recordings_data = self.store.load()
             GlobalRecordingState.recordings = [Recording.from_dict(rec) for rec in recordings_data]
-        logger.info(f"Live Recordings: Loaded {len(self.recordings)} items")
+            GlobalRecordingState.index = {rec.rec_id: rec for rec in GlobalRecordingState.recordings}
+        logger.info(f"Live Recordings: Loaded {len(self.recordings)} items ({self.store.name} store)")
 
     def initialize_dynamic_state(self):
         """Initialize dynamic state for all recordings."""
-        loop_time_seconds = self.settings.user_config.get("loop_time_seconds")
-        self.loop_time_seconds = int(loop_time_seconds or 300)
+        self.loop_time_seconds = self.app.config_manager.hot_settings.loop_time_seconds
         for recording in self.recordings:
             recording.loop_time_seconds = self.loop_time_seconds
             recording.update_title(self._[recording.quality])
 
+    def get_max_check_interval(self) -> int:
+        """The longest delay a live check can be scheduled with under the current interval settings."""
+        if self.adaptive_interval.enabled:
+            return self.adaptive_interval.max_seconds
+        return self.loop_time_seconds
+
+    def apply_check_interval(self):
+        """
+        Apply a committed change of the check interval settings. Scheduled deadlines are pulled in only when
+        the longest possible interval got shorter, so raising the interval or opening a new session never
+        moves backed-off rooms forward.
+        """
+        # The calling manager goes last, so its freshly applied settings win for the shared recordings
+        for manager in dict.fromkeys([self.runner, *self.engine.managers, self]):
+            manager.initialize_dynamic_state()
+        previous = self.engine.max_check_interval
+        current = self.engine.max_check_interval = self.get_max_check_interval()
+        if previous is not None and current < previous:
+            self.scheduler.clamp(current)
+            self.engine.wakeup(time.monotonic())
+
+    def schedule_live_check(self, recording: Recording, delay: float | None = None):
+        """Schedule the next live status check of a recording."""
+        if delay is None:
+            delay = recording.loop_time_seconds or self.loop_time_seconds
+            # Rooms on a custom interval (e.g. notify-only) keep it; the rest follow their go-live history
+            if self.adaptive_interval.enabled and delay == self.loop_time_seconds:
+                delay = self.adaptive_interval.compute(recording.live_history, delay)
+        deadline = self.scheduler.schedule(recording.rec_id, delay)
+        self.engine.wakeup(deadline)
+
+    @staticmethod
+    def add_observer(observer):
+        """
+        Register an observer of the shared recordings list. It is notified through recording_added,
+        recording_removed and recordings_cleared.
+        """
+        if observer not in GlobalRecordingState.observers:
+            GlobalRecordingState.observers.append(observer)
+
+    def detach(self):
+        """Detach this session from the shared monitoring engine."""
+        self.engine.detach(self)
+
     async def add_recording(self, recording):
         with GlobalRecordingState.lock:
             GlobalRecordingState.recordings.append(recording)
+            GlobalRecordingState.index[recording.rec_id] = recording
+            for observer in GlobalRecordingState.observers:
+                observer.recording_added(recording)
             await self.persist_recordings()
 
     async def remove_recording(self, recording: Recording):
         with GlobalRecordingState.lock:
             GlobalRecordingState.recordings.remove(recording)
+            GlobalRecordingState.index.pop(recording.rec_id, None)
+            GlobalRecordingState.active_ids.discard(recording.rec_id)
+            for observer in GlobalRecordingState.observers:
+                observer.recording_removed(recording)
+            self.scheduler.unschedule(recording.rec_id)
             await self.persist_recordings()
 
     async def clear_all_recordings(self):
         with GlobalRecordingState.lock:
             GlobalRecordingState.recordings.clear()
+            GlobalRecordingState.index.clear()
+            GlobalRecordingState.active_ids.clear()
+            for observer in GlobalRecordingState.observers:
+                observer.recordings_cleared()
+            self.scheduler.clear()
             await self.persist_recordings()
 
     async def persist_recordings(self):
-        """Persist recordings to a JSON file."""
-        data_to_save = [rec.to_dict() for rec in self.recordings]
-        await self.app.config_manager.save_recordings_config(data_to_save)
+        """Mark recordings as changed; they are written to the JSON file by the write-behind persister."""
+        self.persister.mark_dirty()
+
+    async def flush_recordings(self):
+        """Write pending recording changes to the JSON file immediately."""
+        await self.persister.flush()
+
+    async def close(self):
+        """Release the process-wide network resources when the application shuts down."""
+        await self.stream_probe.aclose()
+        await close_http_clients()
 
     async def update_recording_card(self, recording: Recording, updated_info: dict):
         """Update an existing recording object and persist changes to a JSON file."""
         if recording:
             recording.update(updated_info)
-            self.app.page.run_task(self.persist_recordings)
+            self.app.run_task(self.persist_recordings)
 
     @staticmethod
     async def _update_recording(
@@ -107,11 +234,10 @@ class RecordingManager:
                 status_info=RecordingStatus.MONITORING,
                 selected=False,
             )
-            self.app.page.run_task(self.check_if_live, recording)
-            self.app.page.run_task(self.app.record_card_manager.update_card, recording)
-            self.app.page.pubsub.send_others_on_topic("update", recording)
+            self.app.run_task(self.check_if_live, recording)
+            self.app.event_bus.publish(EventBus.RECORDING_UPDATED, recording)
             if auto_save:
-                self.app.page.run_task(self.persist_recordings)
+                self.app.run_task(self.persist_recordings)
 
     async def stop_monitor_recording(self, recording: Recording, auto_save: bool = True):
         """
@@ -126,10 +252,10 @@ class RecordingManager:
                 selected=False,
             )
             self.stop_recording(recording, manually_stopped=True)
-            self.app.page.run_task(self.app.record_card_manager.update_card, recording)
-            self.app.page.pubsub.send_others_on_topic("update", recording)
+            self.scheduler.unschedule(recording.rec_id)
+            self.app.event_bus.publish(EventBus.RECORDING_UPDATED, recording)
             if auto_save:
-                self.app.page.run_task(self.persist_recordings)
+                self.app.run_task(self.persist_recordings)
 
     async def start_monitor_recordings(self):
         """
@@ -137,11 +263,10 @@ class RecordingManager:
         """
         selected_recordings = await self.get_selected_recordings()
         pre_start_monitor_recordings = selected_recordings if selected_recordings else self.recordings
-        cards_obj = self.app.record_card_manager.cards_obj
         for recording in pre_start_monitor_recordings:
-            if cards_obj[recording.rec_id]["card"].visible:
-                self.app.page.run_task(self.start_monitor_recording, recording, auto_save=False)
-        self.app.page.run_task(self.persist_recordings)
+            if self.app.record_card_manager.is_visible(recording.rec_id):
+                self.app.run_task(self.start_monitor_recording, recording, auto_save=False)
+        self.app.run_task(self.persist_recordings)
         logger.info(f"Batch Start Monitor Recordings: {[i.rec_id for i in pre_start_monitor_recordings]}")
 
     async def stop_monitor_recordings(self, selected_recordings: list[Recording | None] | None = None):
@@ -151,11 +276,10 @@ class RecordingManager:
         if not selected_recordings:
             selected_recordings = await self.get_selected_recordings()
         pre_stop_monitor_recordings = selected_recordings or self.recordings
-        cards_obj = self.app.record_card_manager.cards_obj
         for recording in pre_stop_monitor_recordings:
-            if cards_obj[recording.rec_id]["card"].visible:
-                self.app.page.run_task(self.stop_monitor_recording, recording, auto_save=False)
-        self.app.page.run_task(self.persist_recordings)
+            if self.app.record_card_manager.is_visible(recording.rec_id):
+                self.app.run_task(self.stop_monitor_recording, recording, auto_save=False)
+        self.app.run_task(self.persist_recordings)
         logger.info(f"Batch Stop Monitor Recordings: {[i.rec_id for i in pre_stop_monitor_recordings]}")
 
     async def get_selected_recordings(self):
@@ -168,37 +292,112 @@ class RecordingManager:
                 await self.remove_recording(recording)
                 logger.info(f"Delete Items: {recording.rec_id}-{recording.streamer_name}")
 
-    def find_recording_by_id(self, rec_id: str):
+    @staticmethod
+    def find_recording_by_id(rec_id: str):
         """Find a recording by its ID (hash of dict representation)."""
-        for rec in self.recordings:
-            if rec.rec_id == rec_id:
-                return rec
-        return None
+        return GlobalRecordingState.index.get(rec_id)
+
+    def start_initial_check(self, recording: Recording):
+        """Run the first live check of a recording unless the shared engine already has it scheduled."""
+        if not self.app.recording_enabled:
+            recording.status_info = RecordingStatus.NOT_RECORDING_SPACE
+        elif recording.rec_id not in self.scheduler:
+            self.schedule_live_check(recording)
+            self.app.run_task(self.check_if_live, recording)
 
     async def check_all_live_status(self):
-        """Check the live status of all recordings and update their display titles."""
-        for recording in self.recordings:
-            if recording.monitor_status and not recording.is_recording:
-                is_exceeded = utils.is_time_interval_exceeded(recording.detection_time, recording.loop_time_seconds)
-                if not recording.detection_time or is_exceeded:
-                    self.app.page.run_task(self.check_if_live, recording)
+        """Check the live status of the recordings whose next check deadline has passed."""
+        due_by_platform = {}
+        for rec_id in self.scheduler.pop_due():
+            recording = self.find_recording_by_id(rec_id)
+            if not recording or not recording.monitor_status:
+                continue
+
+            # Reschedule up front so a check that never completes cannot drop the room from the schedule.
+            self.schedule_live_check(recording)
+            if recording.is_recording or recording.is_checking:
+                continue
+            if recording.platform_key and not recording.scheduled_recording:
+                due_by_platform.setdefault(recording.platform_key, []).append(recording)
+            else:
+                self.app.run_task(self.check_if_live, recording)
 
-    async def setup_periodic_live_check(self, interval: int = 180):
-        """Set up a periodic task to check live status."""
+        for platform_key, recordings in due_by_platform.items():
+            if len(recordings) > 1:
+                self.app.run_task(self.check_if_live_batch, platform_key, recordings)
+            else:
+                self.app.run_task(self.check_if_live, recordings[0])
 
-        async def periodic_check():
-            while True:
-                await asyncio.sleep(interval)
-                await self.check_free_space()
-                if self.app.recording_enabled:
-                    await self.check_all_live_status()
+    async def check_if_live_batch(self, platform_key: str, recordings: list[Recording]):
+        """
+        Probe the live status of several rooms of one platform in batched requests when the platform handler
+        supports it, and run the full stream resolution only for rooms that are live or undetermined.
+        """
+        handler = None
+        if self.circuit_breakers.get_state(platform_key) == CircuitBreaker.CLOSED:
+            hot_settings = self.app.config_manager.hot_settings
+            use_proxy = hot_settings.enable_proxy and platform_key in hot_settings.proxy_platforms
+            handler = get_platform_handler(
+                recordings[0].url,
+                proxy=hot_settings.proxy_address if use_proxy else None,
+                cookies=self.settings.cookies_config.get(platform_key),
+                record_quality=recordings[0].quality,
+                platform=recordings[0].platform,
+            )
+
+        if not handler or not hasattr(handler, "is_live_batch"):
+            for recording in recordings:
+                self.app.run_task(self.check_if_live, recording)
+            return
+
+        live_status = {}
+        for start in range(0, len(recordings), handler.max_batch_size):
+            live_urls = [recording.url for recording in recordings[start:start + handler.max_batch_size]]
+            try:
+                async with self.live_check_limiter.limit(platform_key):
+                    live_status.update(await handler.is_live_batch(live_urls))
+            except Exception as e:
+                logger.error(f"Batch live status probe failed: {platform_key}, {e}")
+
+        for recording in recordings:
+            if live_status.get(recording.url) is False and not recording.is_live:
+                recording.detection_time = datetime.now()
+                recording.check_failures = 0
+                if recording.status_info != RecordingStatus.MONITORING:
+                    recording.status_info = RecordingStatus.MONITORING
+                    self.app.event_bus.publish(EventBus.RECORDING_UPDATED, recording)
+            else:
+                self.app.run_task(self.check_if_live, recording)
 
+    async def setup_periodic_live_check(self, interval: int = 180):
+        """Set up the process-wide periodic task to check live status."""
         if not self.periodic_task_started:
-            self.periodic_task_started = True
-            await periodic_check()
+            for recording in self.recordings:
+                if recording.monitor_status and recording.rec_id not in self.scheduler:
+                    self.schedule_live_check(recording)
+            runner = self.runner
+            if runner is self:
+                await self.engine.run_periodic_check(interval)
+            else:
+                # The loop must outlive the session that happened to start it
+                runner.app.run_task(self.engine.run_periodic_check, interval)
 
     async def check_if_live(self, recording: Recording):
         """Check if the live stream is available, fetch stream data and update is_live status."""
+        runner = self.runner
+        if runner is not self:
+            # The check and the recording it may start run on the runner, so a session that disconnects
+            # meanwhile cannot cancel them
+            await asyncio.shield(runner.app.run_task(runner.check_if_live, recording))
+            return
+        try:
+            await self._check_if_live(recording)
+        except Exception as e:
+            # Without the reset the room would stay marked as checking and never be checked again
+            recording.is_checking = False
+            logger.error(f"Live status check failed: {type(e).__name__}: {e}, {recording.url}")
+
+    async def _check_if_live(self, recording: Recording):
 
         if recording.is_recording:
             return
@@ -209,7 +408,8 @@ class RecordingManager:
 
         elif not recording.is_checking:
             recording.status_info = RecordingStatus.STATUS_CHECKING
-            recording.detection_time = datetime.now().time()
+            recording.detection_time = datetime.now()
+            self.schedule_live_check(recording)
             if recording.scheduled_recording and recording.scheduled_start_time and recording.monitor_hours:
                 scheduled_time_range = await self.get_scheduled_time_range(
                     recording.scheduled_start_time, recording.monitor_hours)
@@ -226,7 +426,7 @@ class RecordingManager:
             if platform and platform_key and (recording.platform is None or recording.platform_key is None):
                 recording.platform = platform
                 recording.platform_key = platform_key
-                self.app.page.run_task(self.persist_recordings)
+                self.app.run_task(self.persist_recordings)
 
             if self.settings.user_config["language"] != "zh_CN":
                 platform = platform_key
@@ -248,77 +448,136 @@ class RecordingManager:
                 "quality": recording.quality,
             }
 
-            recorder = LiveStreamRecorder(self.app, recording, recording_info)
-            stream_info = await recorder.fetch_stream()
-            logger.info(f"Stream Data: {stream_info}")
-            if not stream_info or not stream_info.anchor_name:
-                logger.error(f"Fetch stream data failed: {recording.url}")
+            breaker = self.circuit_breakers.get(platform_key)
+            if not breaker.allow_request():
                 recording.is_checking = False
-                recording.status_info = RecordingStatus.LIVE_STATUS_CHECK_ERROR
-                if recording.monitor_status:
-                    self.app.page.run_task(self.app.record_card_manager.update_card, recording)
+                recording.status_info = RecordingStatus.PLATFORM_CIRCUIT_OPEN
+                self.schedule_live_check(recording, max(breaker.retry_delay(), self.MIN_TICK_SECONDS))
+                self.app.event_bus.publish(EventBus.RECORDING_UPDATED, recording)
                 return
-            if self.settings.user_config.get("remove_emojis"):
-                stream_info.anchor_name = utils.clean_name(stream_info.anchor_name, self._["live_room"])
-
-            recording.is_live = stream_info.is_live
-            is_record = True
-            if recording.is_live and not recording.is_recording:
-                recording.status_info = RecordingStatus.PREPARING_RECORDING
-                recording.live_title = stream_info.title
-                if recording.streamer_name.strip() == self._["live_room"]:
-                    recording.streamer_name = stream_info.anchor_name
-                recording.title = f"{recording.streamer_name} - {self._[recording.quality]}"
-                recording.display_title = f"[{self._['is_live']}] {recording.title}"
-
-                msg_manager = MessagePusher(self.settings)
-                user_config = self.settings.user_config
-                if MessagePusher.should_push_message(self.settings, recording):
-                    push_content = self._["push_content"]
-                    begin_push_message_text = user_config.get("custom_stream_start_content")
-                    if begin_push_message_text:
-                        push_content = begin_push_message_text
-
-                    push_at = datetime.today().strftime("%Y-%m-%d %H:%M:%S")
-                    push_content = push_content.replace("[room_name]", recording.streamer_name).replace(
-                        "[time]", push_at
-                    )
-                    msg_title = user_config.get("custom_notification_title").strip()
-                    msg_title = msg_title or self._["status_notify"]
-
-                    self.app.page.run_task(msg_manager.push_messages, msg_title, push_content)
-
-                    if user_config.get("only_notify_no_record"):
-                        notify_loop_time = user_config.get("notify_loop_time")
-                        recording.loop_time_seconds = int(notify_loop_time or 3600)
-                        is_record = False
+
+            is_probe = breaker.state == CircuitBreaker.HALF_OPEN
+            try:
+                recorder = LiveStreamRecorder(self.app, recording, recording_info)
+                stream_info = await self.probe_cached_stream(recording, recorder)
+                if stream_info is None:
+                    async with self.live_check_limiter.limit(platform_key):
+                        stream_info = await recorder.fetch_stream()
+                    if stream_info and stream_info.is_live and stream_info.record_url:
+                        self.stream_info_cache.set(recording.rec_id, stream_info)
                     else:
-                        recording.loop_time_seconds = self.loop_time_seconds
+                        self.stream_info_cache.invalidate(recording.rec_id)
+                logger.info(f"Stream Data: {stream_info}")
+                if not stream_info:
+                    logger.error(f"Fetch stream data failed ({stream_info.kind}): {recording.url}")
+                    breaker.record_failure()
+                    recording.is_checking = False
+                    recording.check_failures += 1
+                    recording.last_failure = stream_info
+                    recording.status_info = RecordingStatus.LIVE_STATUS_CHECK_ERROR
+                    base_delay = recording.loop_time_seconds or self.loop_time_seconds
+                    max_delay = max(base_delay, self.adaptive_interval.max_seconds)
+                    self.schedule_live_check(recording, backoff_delay(recording.check_failures, base_delay, max_delay))
+                    if recording.monitor_status:
+                        self.app.event_bus.publish(EventBus.RECORDING_UPDATED, recording)
+                    return
+
+                breaker.record_success()
+                recording.check_failures = 0
+                recording.last_failure = None
+                if self.settings.user_config.get("remove_emojis"):
+                    stream_info.anchor_name = utils.clean_name(stream_info.anchor_name, self._["live_room"])
+
+                if stream_info.is_live and not recording.is_live:
+                    AdaptiveIntervalPolicy.record_live_start(recording.live_history)
+                    self.app.run_task(self.persist_recordings)
+                recording.is_live = stream_info.is_live
+                is_record = True
+                if recording.is_live and not recording.is_recording:
+                    recording.status_info = RecordingStatus.PREPARING_RECORDING
+                    recording.live_title = stream_info.title
+                    if recording.streamer_name.strip() == self._["live_room"]:
+                        recording.streamer_name = stream_info.anchor_name
+                    recording.title = f"{recording.streamer_name} - {self._[recording.quality]}"
+                    recording.display_title = f"[{self._['is_live']}] {recording.title}"
+
+                    msg_manager = MessagePusher(self.settings)
+                    user_config = self.settings.user_config
+                    if MessagePusher.should_push_message(self.settings, recording):
+                        push_content = self._["push_content"]
+                        begin_push_message_text = user_config.get("custom_stream_start_content")
+                        if begin_push_message_text:
+                            push_content = begin_push_message_text
+
+                        push_at = datetime.today().strftime("%Y-%m-%d %H:%M:%S")
+                        push_content = push_content.replace("[room_name]", recording.streamer_name).replace(
+                            "[time]", push_at
+                        )
+                        msg_title = user_config.get("custom_notification_title").strip()
+                        msg_title = msg_title or self._["status_notify"]
+
+                        self.app.run_task(msg_manager.push_messages, msg_title, push_content)
+
+                        if user_config.get("only_notify_no_record"):
+                            notify_loop_time = user_config.get("notify_loop_time")
+                            recording.loop_time_seconds = int(notify_loop_time or 3600)
+                            is_record = False
+                        else:
+                            recording.loop_time_seconds = self.loop_time_seconds
+
+                    if is_record:
+                        self.start_update(recording)
+                        self.app.run_task(recorder.start_recording, stream_info)
+                    else:
+                        recording.is_checking = False
 
-                if is_record:
-                    self.start_update(recording)
-                    self.app.page.run_task(recorder.start_recording, stream_info)
+                    self.app.event_bus.publish(EventBus.RECORDING_UPDATED, recording)
                 else:
                     recording.is_checking = False
-
-                self.app.page.run_task(self.app.record_card_manager.update_card, recording)
-                self.app.page.pubsub.send_others_on_topic("update", recording)
-            else:
-                recording.is_checking = False
-                recording.status_info = RecordingStatus.MONITORING
-                title = f"{stream_info.anchor_name or recording.streamer_name} - {self._[recording.quality]}"
-                if recording.streamer_name == self._["live_room"] or \
-                        f"[{self._['is_live']}]" in recording.display_title:
-                    recording.update(
-                        {
-                            "streamer_name": stream_info.anchor_name,
-                            "title": title,
-                            "display_title": title,
-                        }
-                    )
-                    self.app.page.run_task(self.app.record_card_manager.update_card, recording)
-                    self.app.page.pubsub.send_others_on_topic("update", recording)
-                    self.app.page.run_task(self.persist_recordings)
+                    recording.status_info = RecordingStatus.MONITORING
+                    title = f"{stream_info.anchor_name or recording.streamer_name} - {self._[recording.quality]}"
+                    if recording.streamer_name == self._["live_room"] or \
+                            f"[{self._['is_live']}]" in recording.display_title:
+                        recording.update(
+                            {
+                                "streamer_name": stream_info.anchor_name,
+                                "title": title,
+                                "display_title": title,
+                            }
+                        )
+                        self.app.event_bus.publish(EventBus.RECORDING_UPDATED, recording)
+                        self.app.run_task(self.persist_recordings)
+            finally:
+                if is_probe and breaker.probe_in_flight:
+                    breaker.release_probe()
+
+    async def probe_cached_stream(self, recording: Recording, recorder: LiveStreamRecorder):
+        """
+        Probe the last resolved stream URL of a recording before a full resolution.
+        Return the cached stream data (marked offline if the stream is gone) when the probe is conclusive,
+        or None when the platform handler has to be asked. Only rooms resolved live within the cache TTL
+        have a URL to probe; rooms that stayed offline always go through the platform handler, where the
+        batch probe of platforms that support one keeps their checks cheap.
+        """
+        cached_stream_info = self.stream_info_cache.get(recording.rec_id)
+        if not cached_stream_info:
+            return None
+
+        record_url = recorder.get_record_url(cached_stream_info.record_url)
+        result = await self.stream_probe.probe(
+            record_url, recorder.proxy, recorder.get_headers_params(record_url, recorder.platform_key)
+        )
+        logger.info(f"Stream URL Probe: {result}, {recording.url}")
+        if result == ProbeResult.INCONCLUSIVE:
+            return None
+
+        recording.is_checking = False
+        if result == ProbeResult.LIVE:
+            return cached_stream_info
+        offline_stream_info = copy.copy(cached_stream_info)
+        offline_stream_info.is_live = False
+        offline_stream_info.record_url = None
+        return offline_stream_info
 
     @staticmethod
     def start_update(recording: Recording):
@@ -348,8 +607,21 @@ class RecordingManager:
             recording.start_time = None
             recording.is_recording = False
             recording.manually_stopped = manually_stopped
+            if recording.stop_event:
+                recording.stop_event.set()
             logger.info(f"Stopped recording for {recording.title}")
 
+    def disable_recording(self):
+        """
+        Disable recording for this app and the monitoring runner, and wake the ffmpeg supervisors so they stop
+        their processes.
+        """
+        self.app.recording_enabled = False
+        self.runner.app.recording_enabled = False
+        for recording in self.recordings:
+            if recording.stop_event:
+                recording.stop_event.set()
+
     def get_duration(self, recording: Recording):
         """Get the duration of the current recording session in a formatted string."""
         if recording.is_recording and recording.start_time is not None:
@@ -363,7 +635,7 @@ class RecordingManager:
             return str(total_duration).split(".")[0]
 
     async def delete_recording_cards(self, recordings: list[Recording]):
-        self.app.page.run_task(self.app.record_card_manager.remove_recording_card, recordings)
+        self.app.run_task(self.app.record_card_manager.remove_recording_card, recordings)
         self.app.page.pubsub.send_others_on_topic('delete', recordings)
         await self.remove_recordings(recordings)
         
@@ -374,15 +646,15 @@ class RecordingManager:
                 self.app.current_page.content_area.update()
 
     async def check_free_space(self, output_dir: str | None = None):
-        disk_space_limit = float(self.settings.user_config.get("recording_space_threshold"))
+        disk_space_limit = self.app.config_manager.hot_settings.recording_space_threshold
         output_dir = output_dir or self.settings.get_video_save_path()
         if utils.check_disk_capacity(output_dir) < disk_space_limit:
-            self.app.recording_enabled = False
+            self.disable_recording()
             logger.error(
                 f"Disk space remaining is below {disk_space_limit} GB. Recording function disabled"
             )
-            self.app.page.run_task(
-                self.app.snack_bar.show_snack_bar,
+            self.app.event_bus.publish(
+                EventBus.NOTICE,
                 self._["not_disk_space_tip"],
                 duration=86400,
                 show_close_icon=True
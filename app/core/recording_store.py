@@ -0,0 +1,407 @@
+import asyncio
+import contextlib
+import copy
+import json
+import os
+import sqlite3
+import tempfile
+import time
+
+import aiofiles
+
+from ..utils.logger import logger
+
+
+class JsonRecordingStore:
+    """Stores the recordings list as one JSON document in config/recordings.json."""
+
+    name = "json"
+
+    def __init__(self, config_manager):
+        self.config_manager = config_manager
+
+    def load(self) -> list[dict]:
+        return self.config_manager.load_recordings_config() or []
+
+    async def save(self, records: list[dict]) -> None:
+        await self.config_manager.save_recordings_config(records)
+
+
+class JournaledRecordingStore(JsonRecordingStore):
+    """
+    recordings.json snapshot plus an append-only journal of per-recording deltas.
+
+    `save` diffs the snapshot it receives against the last saved state and appends one JSON line per change
+    (`put` a new or replaced recording, `set` changed fields, `del` a removed recording) to
+    recordings.journal. The journal is compacted into a new snapshot once it grows past `COMPACT_BYTES` or
+    `COMPACT_SECONDS` have passed, and replayed over the snapshot at startup. A torn last line left by a crash
+    is dropped on replay.
+
+    The first line of the journal is a `base` entry with the mtime of the snapshot it applies to. A journal
+    whose base does not match recordings.json, because a compaction did not finish or another backend wrote
+    the file since, is discarded instead of being replayed over a newer snapshot.
+    """
+
+    name = "journal"
+    COMPACT_BYTES = 1024 * 1024
+    COMPACT_SECONDS = 3600
+
+    def __init__(self, config_manager):
+        super().__init__(config_manager)
+        self.journal_path = os.path.join(config_manager.config_path, "recordings.journal")
+        self._written: dict[str, dict] = {}
+        self._last_compaction = time.monotonic()
+        self._compaction_failed = False
+
+    def load(self) -> list[dict]:
+        records = {record.get("rec_id"): record for record in super().load()}
+        lines = []
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, encoding="utf-8") as file:
+                lines = file.read().splitlines(keepends=True)
+        rewrite = not lines
+        has_base = False
+        if lines and not lines[-1].endswith("\n"):
+            # Drop the torn tail of an interrupted append so later appends start on a fresh line
+            logger.warning(f"Skipped a truncated recordings journal entry: {self.journal_path}")
+            lines.pop()
+            rewrite = True
+
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(f"Skipped an invalid recordings journal entry: {self.journal_path}")
+        if entries and entries[0].get("op") == "base":
+            base = entries.pop(0)
+            has_base = True
+            if base.get("snapshot_mtime_ns") != self._snapshot_mtime():
+                logger.warning(f"Discarded a recordings journal older than its snapshot: {self.journal_path}")
+                lines, entries, has_base = [], [], False
+                rewrite = True
+        else:
+            # Journal of an older version without a base entry, it applies to the current snapshot
+            rewrite = True
+
+        for entry in entries:
+            self._apply_entry(records, entry)
+        if entries:
+            logger.info(f"Replayed {len(entries)} recordings journal entries")
+        if rewrite:
+            try:
+                self._replace_journal(self._base_line() + "".join(lines[1:] if has_base else lines))
+            except OSError as e:
+                logger.error(f"An error occurred while rewriting recordings journal: {e}")
+        self._written = copy.deepcopy(records)
+        return list(records.values())
+
+    def _snapshot_mtime(self) -> int | None:
+        try:
+            return os.stat(self.config_manager.recordings_config_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _base_line(self) -> str:
+        return json.dumps({"op": "base", "snapshot_mtime_ns": self._snapshot_mtime()}) + "\n"
+
+    def _replace_journal(self, content: str) -> None:
+        """Replace the journal atomically, so a crash leaves either the old or the new journal."""
+        directory, file_name = os.path.split(self.journal_path)
+        fd, temp_path = tempfile.mkstemp(dir=directory or None, prefix=f"{file_name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(content)
+            os.replace(temp_path, self.journal_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def _apply_entry(records: dict, entry: dict) -> None:
+        op = entry.get("op")
+        rec_id = entry.get("rec_id")
+        if op == "put":
+            records[rec_id] = entry["record"]
+        elif op == "set" and rec_id in records:
+            records[rec_id].update(entry["fields"])
+        elif op == "del":
+            records.pop(rec_id, None)
+
+    def _diff(self, records: list[dict]) -> list[dict]:
+        entries = []
+        current_ids = set()
+        for record in records:
+            rec_id = record.get("rec_id")
+            current_ids.add(rec_id)
+            written = self._written.get(rec_id)
+            if written is None:
+                entries.append({"op": "put", "rec_id": rec_id, "record": record})
+                continue
+            fields = {key: value for key, value in record.items() if written.get(key) != value}
+            if written.keys() - record.keys():
+                entries.append({"op": "put", "rec_id": rec_id, "record": record})
+            elif fields:
+                entries.append({"op": "set", "rec_id": rec_id, "fields": fields})
+        entries.extend({"op": "del", "rec_id": rec_id} for rec_id in self._written if rec_id not in current_ids)
+        return entries
+
+    def _should_compact(self) -> bool:
+        if self._compaction_failed:
+            return True
+        if time.monotonic() - self._last_compaction >= self.COMPACT_SECONDS:
+            return True
+        try:
+            return os.path.getsize(self.journal_path) >= self.COMPACT_BYTES
+        except OSError:
+            return False
+
+    async def compact(self, records: list[dict]) -> None:
+        """
+        Write a full snapshot and start a new, empty journal. A failed snapshot raises before the journal is
+        touched; a journal that is not replaced afterwards no longer matches the snapshot and is discarded.
+        """
+        # Until a compaction completes, appends could land in a journal that no longer matches the snapshot
+        self._compaction_failed = True
+        await super().save(records)
+        await asyncio.to_thread(self._replace_journal, self._base_line())
+        self._compaction_failed = False
+        self._written = {record.get("rec_id"): copy.deepcopy(record) for record in records}
+        self._last_compaction = time.monotonic()
+
+    async def save(self, records: list[dict]) -> None:
+        entries = self._diff(records)
+        if not entries:
+            return
+        if self._should_compact():
+            await self.compact(records)
+            return
+
+        try:
+            async with aiofiles.open(self.journal_path, "a", encoding="utf-8") as file:
+                await file.write("".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries))
+        except OSError as e:
+            logger.error(f"An error occurred while writing recordings journal: {e}")
+            raise
+        for entry in entries:
+            self._apply_entry(self._written, copy.deepcopy(entry))
+        logger.info(f"Recordings journal appended: {len(entries)} entries")
+
+
+class SqliteRecordingStore:
+    """
+    Stores recordings as rows of an SQLite database in WAL mode.
+
+    Each row keeps the serialized recording plus the indexed columns used for lookups. `save` receives the
+    full snapshot but only writes rows whose data changed since the last save, moves rows whose position
+    changed and deletes removed rows, so a change to one room costs one row update instead of a rewrite of
+    the whole watchlist.
+
+    recordings.json is kept as the hand-over point between backends: the database imports it whenever it
+    changed since they were last in sync, and `create_recording_store` exports the database to it when
+    another backend is selected, so switching back and forth never loads a stale watchlist.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, db_path: str, json_path: str | None = None):
+        self.db_path = db_path
+        self.json_path = json_path
+        self._written: dict[str, str] = {}
+        self._positions: dict[str, int] = {}
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        with self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS recordings (
+                    rec_id TEXT PRIMARY KEY,
+                    position INTEGER NOT NULL,
+                    url TEXT,
+                    platform_key TEXT,
+                    monitor_status INTEGER,
+                    data TEXT NOT NULL
+                )
+                """
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_recordings_url ON recordings (url)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_recordings_platform_key ON recordings (platform_key)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_recordings_monitor_status ON recordings (monitor_status)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    def _get_meta(self, key: str) -> str | None:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, **values) -> None:
+        rows = [(key, str(value)) for key, value in values.items()]
+        self.conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", rows)
+
+    def _has_rows(self) -> bool:
+        return self.conn.execute("SELECT 1 FROM recordings LIMIT 1").fetchone() is not None
+
+    def json_changed(self) -> bool:
+        """Whether recordings.json was written since the database was last in sync with it."""
+        if not self.json_path or not os.path.exists(self.json_path):
+            return False
+        synced_mtime = self._get_meta("json_mtime_ns")
+        if synced_mtime is None:
+            # Never synced with the JSON file, e.g. a database of an older version: import only into an empty one
+            return not self._has_rows()
+        return str(os.stat(self.json_path).st_mtime_ns) != synced_mtime
+
+    def needs_export(self) -> bool:
+        """Whether the database has changes that recordings.json does not have yet."""
+        synced = self._get_meta("json_synced")
+        return synced == "0" or (synced is None and self._has_rows())
+
+    def _read_rows(self) -> list[tuple[str, str]]:
+        return self.conn.execute("SELECT rec_id, data FROM recordings ORDER BY position").fetchall()
+
+    def load(self) -> list[dict]:
+        if self.json_changed():
+            imported = self.import_json(self.json_path)
+            if imported is not None:
+                logger.info(f"Imported {imported} recordings from {self.json_path}")
+
+        records = []
+        self._written.clear()
+        self._positions.clear()
+        for position, (rec_id, data) in enumerate(self._read_rows()):
+            try:
+                records.append(json.loads(data))
+            except json.JSONDecodeError:
+                logger.error(f"Invalid recording row in database: {rec_id}")
+                continue
+            self._written[rec_id] = data
+            self._positions[rec_id] = position
+        return records
+
+    @staticmethod
+    def _to_row(position: int, record: dict, data: str) -> tuple:
+        return (
+            record.get("rec_id"),
+            position,
+            record.get("url"),
+            record.get("platform_key"),
+            int(bool(record.get("monitor_status"))),
+            data,
+        )
+
+    def _save_sync(self, records: list[dict]) -> None:
+        upserts = []
+        moves = []
+        written = {}
+        positions = {}
+        for position, record in enumerate(records):
+            rec_id = record.get("rec_id")
+            data = json.dumps(record, ensure_ascii=False)
+            written[rec_id] = data
+            positions[rec_id] = position
+            if self._written.get(rec_id) != data:
+                upserts.append(self._to_row(position, record, data))
+            elif self._positions.get(rec_id) != position:
+                moves.append((position, rec_id))
+        deletes = [(rec_id,) for rec_id in self._written if rec_id not in written]
+        if not upserts and not moves and not deletes:
+            return
+
+        with self.conn:
+            if deletes:
+                self.conn.executemany("DELETE FROM recordings WHERE rec_id = ?", deletes)
+            if moves:
+                self.conn.executemany("UPDATE recordings SET position = ? WHERE rec_id = ?", moves)
+            if upserts:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO recordings (rec_id, position, url, platform_key, monitor_status, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    upserts,
+                )
+            self._set_meta(json_synced=0)
+        self._written = written
+        self._positions = positions
+        logger.info(
+            f"Recordings database saved: {len(upserts)} updated, {len(moves)} moved, {len(deletes)} deleted"
+        )
+
+    async def save(self, records: list[dict]) -> None:
+        try:
+            await asyncio.to_thread(self._save_sync, records)
+        except sqlite3.Error as e:
+            logger.error(f"An error occurred while saving recordings database: {e}")
+            raise
+
+    def import_json(self, json_path: str) -> int | None:
+        """Replace the database content with the recordings of a recordings.json file."""
+        try:
+            with open(json_path, encoding="utf-8") as file:
+                records = json.load(file)
+            mtime_ns = os.stat(json_path).st_mtime_ns
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to import recordings from {json_path}: {e}")
+            return None
+        if not isinstance(records, list):
+            logger.error(f"Failed to import recordings from {json_path}: not a list of recordings")
+            return None
+        # Diff against the rows on disk so recordings missing from the file are deleted
+        self._written = dict(self._read_rows())
+        self._positions = {rec_id: position for position, rec_id in enumerate(self._written)}
+        self._save_sync(records)
+        with self.conn:
+            self._set_meta(json_mtime_ns=mtime_ns, json_synced=1)
+        return len(records)
+
+    def export_json(self, json_path: str) -> int:
+        """Write all recordings to a recordings.json file, replacing it atomically."""
+        records = [json.loads(data) for _, data in self._read_rows()]
+        directory, file_name = os.path.split(json_path)
+        fd, temp_path = tempfile.mkstemp(dir=directory or None, prefix=f"{file_name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(records, file, ensure_ascii=False, indent=4)
+            os.replace(temp_path, json_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+        with self.conn:
+            self._set_meta(json_mtime_ns=os.stat(json_path).st_mtime_ns, json_synced=1)
+        return len(records)
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def _export_database(db_path: str, json_path: str) -> None:
+    """Bring recordings.json up to date with the database after another backend was selected."""
+    try:
+        store = SqliteRecordingStore(db_path, json_path)
+        try:
+            if store.needs_export():
+                exported = store.export_json(json_path)
+                logger.info(f"Exported {exported} recordings from {db_path} to {json_path}")
+        finally:
+            store.close()
+    except (sqlite3.Error, OSError, ValueError) as e:
+        logger.error(f"Failed to export recordings database to {json_path}: {e}")
+
+
+def create_recording_store(config_manager, user_config: dict):
+    """Create the recording store selected by the `recording_storage_backend` setting."""
+    backend = str(user_config.get("recording_storage_backend") or JsonRecordingStore.name).lower()
+    db_path = os.path.join(config_manager.config_path, "recordings.db")
+    if backend == SqliteRecordingStore.name:
+        try:
+            return SqliteRecordingStore(db_path, config_manager.recordings_config_path)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to open recordings database, falling back to JSON: {e}")
+    elif os.path.exists(db_path):
+        _export_database(db_path, config_manager.recordings_config_path)
+    if backend == JournaledRecordingStore.name:
+        return JournaledRecordingStore(config_manager)
+    return JsonRecordingStore(config_manager)
@@ -0,0 +1,54 @@
+import asyncio
+
+from ..utils.logger import logger
+
+
+class RecordingsPersister:
+    """
+    Write-behind persistence of the recordings list.
+
+    Callers only mark the list dirty; all dirty signals within `delay` seconds are coalesced into one
+    write of the latest snapshot. `flush` writes any pending change immediately and is used on shutdown.
+    """
+
+    DEFAULT_DELAY = 2.0
+    MAX_RETRY_DELAY = 60.0
+
+    def __init__(self, save_func, snapshot_func, delay: float = DEFAULT_DELAY):
+        self.save_func = save_func
+        self.snapshot_func = snapshot_func
+        self.delay = delay
+        self.dirty = False
+        self.failures = 0
+        self._pending_task = None
+        self._write_lock = asyncio.Lock()
+
+    def mark_dirty(self) -> None:
+        self.dirty = True
+        self._schedule_write(self.delay)
+
+    def _schedule_write(self, delay: float) -> None:
+        pending = self._pending_task
+        if pending is None or pending.done() or pending is asyncio.current_task():
+            self._pending_task = asyncio.get_running_loop().create_task(self._write_later(delay))
+
+    async def _write_later(self, delay: float):
+        await asyncio.sleep(delay)
+        await self.flush()
+
+    async def flush(self) -> None:
+        async with self._write_lock:
+            if not self.dirty:
+                return
+            self.dirty = False
+            try:
+                await self.save_func(self.snapshot_func())
+            except Exception as e:
+                # Retry on its own with a growing delay; a later change must not be needed to save this one
+                self.dirty = True
+                self.failures += 1
+                retry_delay = min(self.delay * 2 ** self.failures, self.MAX_RETRY_DELAY)
+                logger.error(f"Failed to persist recordings, retrying in {retry_delay:.0f} s: {e}")
+                self._schedule_write(retry_delay)
+            else:
+                self.failures = 0
@@ -4,7 +4,7 @@ import shutil
 import subprocess
 import time
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..messages.message_pusher import MessagePusher
 from ..models.recording_status_model import RecordingStatus
@@ -12,8 +12,15 @@ from ..models.video_quality_model import VideoQuality
 from ..process_manager import BackgroundService
 from ..utils import utils
 from ..utils.logger import logger
-from . import ffmpeg_builders, platform_handlers
-from .platform_handlers import StreamData
+from . import capture, ffmpeg_builders, platform_handlers
+from .event_bus import EventBus
+from .ffmpeg_log import FFmpegLog, iter_lines
+from .ffmpeg_progress import FFmpegProgress
+from .stream_probe import StreamUrlProbe
+
+if TYPE_CHECKING:
+    from .capture import CaptureProcess
+    from .platform_handlers import StreamData
 
 
 class LiveStreamRecorder:
@@ -55,13 +62,12 @@ class LiveStreamRecorder:
         return self.recording_info.get(key, default) or default
 
     def is_use_proxy(self):
-        default_proxy_platform = self.user_config.get("default_platform_with_proxy", "")
-        proxy_list = default_proxy_platform.replace("，", ",").replace(" ", "").split(",")
-        if self.user_config.get("enable_proxy") and self.platform_key in proxy_list:
-            self.proxy = self.user_config.get("proxy_address")
+        hot_settings = self.app.config_manager.hot_settings
+        if hot_settings.enable_proxy and self.platform_key in hot_settings.proxy_platforms:
+            self.proxy = hot_settings.proxy_address
             return self.proxy
 
-    def _get_filename(self, stream_info: StreamData) -> str:
+    def _get_filename(self, stream_info: "StreamData") -> str:
         live_title = None
         stream_info.title = utils.clean_name(stream_info.title, None)
         if self.user_config.get("filename_includes_title") and stream_info.title:
@@ -77,7 +83,7 @@ class LiveStreamRecorder:
         full_filename = "_".join([i for i in (stream_info.anchor_name, live_title, now) if i])
         return full_filename
 
-    def _get_output_dir(self, stream_info: StreamData) -> str:
+    def _get_output_dir(self, stream_info: "StreamData") -> str:
         if self.recording.recording_dir and self.user_config.get("folder_name_time"):
             current_date = datetime.today().strftime("%Y-%m-%d")
             if current_date not in self.recording.recording_dir:
@@ -102,7 +108,7 @@ class LiveStreamRecorder:
                 output_dir = os.path.join(output_dir, f"{now[:10]}_{live_title}")
         os.makedirs(output_dir, exist_ok=True)
         self.recording.recording_dir = output_dir
-        self.app.page.run_task(self.app.record_manager.persist_recordings)
+        self.app.run_task(self.app.record_manager.persist_recordings)
         return output_dir
 
     def _get_save_path(self, filename: str) -> str:
@@ -118,7 +124,7 @@ class LiveStreamRecorder:
         cleaned_title = title[:30].replace("，", ",").replace(" ", "")
         return cleaned_title
 
-    def _get_record_url(self, url: str):
+    def get_record_url(self, url: str):
         http_record_list = ["shopee"]
         if self.platform_key in http_record_list:
             url = url.replace("https://", "http://")
@@ -126,11 +132,8 @@ class LiveStreamRecorder:
             url = url.replace("http://", "https://")
         return url
 
-    async def fetch_stream(self) -> StreamData:
-        logger.info(f"Live URL: {self.live_url}")
-        logger.info(f"Use Proxy: {self.proxy or None}")
-        self.recording.use_proxy = bool(self.proxy)
-        handler = platform_handlers.get_platform_handler(
+    def get_platform_handler(self) -> platform_handlers.PlatformHandler | None:
+        return platform_handlers.get_platform_handler(
             live_url=self.live_url,
             proxy=self.proxy,
             cookies=self.cookies,
@@ -140,11 +143,27 @@ class LiveStreamRecorder:
             password=self.account_config.get(self.platform_key, {}).get("password"),
             account_type=self.account_config.get(self.platform_key, {}).get("account_type")
         )
-        stream_info = await handler.get_stream_info(self.live_url)
-        self.recording.is_checking = False
+
+    async def fetch_stream(self) -> "StreamData | utils.FetchFailure":
+        logger.info(f"Live URL: {self.live_url}")
+        logger.info(f"Use Proxy: {self.proxy or None}")
+        self.recording.use_proxy = bool(self.proxy)
+        handler = self.get_platform_handler()
+        if not handler:
+            self.recording.is_checking = False
+            return utils.FetchFailure(utils.FetchFailure.UNSUPPORTED, self.live_url)
+
+        try:
+            stream_info = await handler.get_stream_info(self.live_url)
+        except Exception as e:
+            stream_info = utils.FetchFailure.from_exception(e)
+        finally:
+            self.recording.is_checking = False
+        if stream_info is None or (not isinstance(stream_info, utils.FetchFailure) and not stream_info.anchor_name):
+            stream_info = utils.FetchFailure(utils.FetchFailure.EMPTY)
         return stream_info
 
-    async def start_recording(self, stream_info: StreamData):
+    async def start_recording(self, stream_info: "StreamData"):
         """
         Construct ffmpeg recording parameters and start recording
         """
@@ -155,65 +174,118 @@ class LiveStreamRecorder:
         logger.info(f"Save Path: {save_path}")
         self.recording.recording_dir = os.path.dirname(save_path)
         os.makedirs(self.recording.recording_dir, exist_ok=True)
-        record_url = self._get_record_url(stream_info.record_url)
+        record_url = self.get_record_url(stream_info.record_url)
+        headers = self.get_headers_params(record_url, self.platform_key)
+
+        native_capture = None
+        if self.user_config.get("recording_engine") == "native":
+            native_capture = capture.create_capture(
+                self.save_format,
+                record_url=record_url,
+                proxy=self.proxy,
+                segment_record=self.segment_record,
+                segment_time=self.segment_time,
+                full_path=save_path,
+                headers=StreamUrlProbe.parse_headers(headers)
+            )
 
-        ffmpeg_builder = ffmpeg_builders.create_builder(
-            self.save_format,
-            record_url=record_url,
-            proxy=self.proxy,
-            segment_record=self.segment_record,
-            segment_time=self.segment_time,
-            full_path=save_path,
-            headers=self.get_headers_params(record_url, self.platform_key)
-        )
-        ffmpeg_command = ffmpeg_builder.build_command()
-        self.app.page.run_task(
+        ffmpeg_command = None
+        if native_capture:
+            logger.info(f"Recording Engine: {type(native_capture).__name__}")
+        else:
+            ffmpeg_builder = ffmpeg_builders.create_builder(
+                self.save_format,
+                record_url=record_url,
+                proxy=self.proxy,
+                segment_record=self.segment_record,
+                segment_time=self.segment_time,
+                full_path=save_path,
+                headers=headers
+            )
+            ffmpeg_command = ffmpeg_builder.build_command()
+        self.app.run_task(
             self.start_ffmpeg,
             stream_info.anchor_name,
             self.live_url,
             stream_info.record_url,
             ffmpeg_command,
             self.save_format,
-            self.user_config.get("custom_script_command")
+            self.user_config.get("custom_script_command"),
+            native_capture=native_capture
         )
 
+    async def read_progress(self, stream: asyncio.StreamReader):
+        """Parse the -progress output of ffmpeg and keep the recording's speed and telemetry up to date."""
+        progress = FFmpegProgress()
+        self.recording.progress = progress
+        try:
+            async for line in iter_lines(stream):
+                if progress.feed(line):
+                    self.recording.speed = progress.format_speed()
+        except ConnectionError as e:
+            logger.debug(f"Stopped reading ffmpeg progress: {e}")
+        finally:
+            self.recording.speed = "X KB/s"
+            logger.info(f"Recording Progress: {progress.summary()}, {self.live_url}")
+
+    async def read_stderr(self, stream: asyncio.StreamReader):
+        """Drain the stderr of ffmpeg while it runs, so a full pipe never blocks the recording."""
+        ffmpeg_log = self.recording.ffmpeg_log = FFmpegLog()
+        try:
+            async for line in iter_lines(stream):
+                category = ffmpeg_log.add(line)
+                if category and ffmpeg_log.error_counts[category] == 1:
+                    logger.warning(f"FFmpeg Error [{category}]: {line}, {self.live_url}")
+        except ConnectionError as e:
+            logger.debug(f"Stopped reading ffmpeg stderr: {e}")
+
     async def start_ffmpeg(
         self,
         record_name: str,
         live_url: str,
         record_url: str,
-        ffmpeg_command: list,
+        ffmpeg_command: list | None,
         save_type: str,
-        script_command: str | None = None
+        script_command: str | None = None,
+        native_capture: "CaptureProcess | None" = None
     ) -> bool:
         """
-        The child process executes ffmpeg for recording
+        The child process executes ffmpeg for recording, or the native capture records in-process when given
         """
 
         try:
-            save_file_path = ffmpeg_command[-1]
-
-            process = await asyncio.create_subprocess_exec(
-                *ffmpeg_command,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                startupinfo=self.subprocess_start_info
-            )
+            if native_capture:
+                save_file_path = native_capture.full_path
+                process = native_capture.start()
+            else:
+                save_file_path = ffmpeg_command[-1]
+                process = await asyncio.create_subprocess_exec(
+                    *ffmpeg_command,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    startupinfo=self.subprocess_start_info
+                )
 
             self.app.add_ffmpeg_process(process)
+            progress_task = asyncio.create_task(self.read_progress(process.stdout))
+            stderr_task = asyncio.create_task(self.read_stderr(process.stderr))
             self.recording.status_info = RecordingStatus.RECORDING
             self.recording.record_url = record_url
             logger.info(f"Recording in Progress: {live_url}")
             logger.log("STREAM", f"Recording Stream URL: {record_url}")
-            while True:
+
+            # Sleep until ffmpeg exits or a stop is requested; the event is only a wake-up signal, the
+            # recording and app state decide whether to stop, since one app may wake all recordings.
+            stop_event = self.recording.stop_event = asyncio.Event()
+            exit_task = asyncio.create_task(process.wait())
+            while not exit_task.done():
                 if not self.recording.is_recording or not self.app.recording_enabled:
                     logger.info(f"Preparing to End Recording: {live_url}")
 
-                    if os.name == "nt":
-                        if process.stdin:
-                            process.stdin.write(b"q")
-                            await process.stdin.drain()
+                    if os.name == "nt" and process.stdin:
+                        process.stdin.write(b"q")
+                        await process.stdin.drain()
                     else:
                         # import signal
                         # process.send_signal(signal.SIGINT)
@@ -223,30 +295,35 @@ class LiveStreamRecorder:
                         process.stdin.close()
 
                     try:
-                        await asyncio.wait_for(process.wait(), timeout=10.0)
+                        await asyncio.wait_for(asyncio.shield(exit_task), timeout=10.0)
                     except asyncio.TimeoutError:
                         process.kill()
-                        await process.wait()
-
-                if process.returncode is not None:
-                    logger.info(f"Exit loop recording (normal 0 | abnormal 1): code={process.returncode}, {live_url}")
                     break
 
-                await asyncio.sleep(1)
+                stop_task = asyncio.create_task(stop_event.wait())
+                await asyncio.wait({exit_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+                stop_task.cancel()
+                stop_event.clear()
 
+            await exit_task
+            if self.recording.stop_event is stop_event:
+                self.recording.stop_event = None
+            logger.info(f"Exit loop recording (normal 0 | abnormal 1): code={process.returncode}, {live_url}")
+
+            await asyncio.gather(progress_task, stderr_task)
             return_code = process.returncode
             safe_return_code = [0, 255]
-            stdout, stderr = await process.communicate()
-            if return_code not in safe_return_code and stderr:
-                logger.error(f"FFmpeg Stderr Output: {str(stderr.decode()).splitlines()[0]}")
+            ffmpeg_log = self.recording.ffmpeg_log
+            if return_code not in safe_return_code and ffmpeg_log.lines:
+                logger.error(f"FFmpeg Stderr Output: {ffmpeg_log.error_summary()}")
+                logger.debug("FFmpeg Stderr Tail:\n" + "\n".join(ffmpeg_log.tail()))
                 self.recording.status_info = RecordingStatus.RECORDING_ERROR
 
                 try:
                     self.app.record_manager.stop_recording(self.recording)
-                    await self.app.record_card_manager.update_card(self.recording)
-                    self.app.page.pubsub.send_others_on_topic("update", self.recording)
-                    await self.app.snack_bar.show_snack_bar(
-                        record_name + " " + self._["record_stream_error"], duration=2000
+                    self.app.event_bus.publish(EventBus.RECORDING_UPDATED, self.recording)
+                    self.app.event_bus.publish(
+                        EventBus.NOTICE, record_name + " " + self._["record_stream_error"], duration=2000
                     )
                 except Exception as e:
                     logger.debug(f"Failed to update UI: {e}")
@@ -282,13 +359,12 @@ class LiveStreamRecorder:
                         msg_title = user_config.get("custom_notification_title").strip()
                         msg_title = msg_title or self._["status_notify"]
 
-                        self.app.page.run_task(msg_manager.push_messages, msg_title, push_content)
+                        self.app.run_task(msg_manager.push_messages, msg_title, push_content)
                 try:
                     self.recording.update({"display_title": display_title})
-                    await self.app.record_card_manager.update_card(self.recording)
-                    self.app.page.pubsub.send_others_on_topic("update", self.recording)
+                    self.app.event_bus.publish(EventBus.RECORDING_UPDATED, self.recording)
                     if self.app.recording_enabled and process in self.app.process_manager.ffmpeg_processes:
-                        self.app.page.run_task(self.app.record_manager.check_if_live, self.recording)
+                        self.app.run_task(self.app.record_manager.check_if_live, self.recording)
                     else:
                         self.recording.status_info = RecordingStatus.NOT_RECORDING_SPACE
                 except Exception as e:
@@ -301,7 +377,7 @@ class LiveStreamRecorder:
                         for path in file_paths:
                             if prefix in path:
                                 try:
-                                    self.app.page.run_task(
+                                    self.app.run_task(
                                         self.converts_mp4, path, self.user_config["delete_original"]
                                     )
                                 except Exception as e:
@@ -309,7 +385,7 @@ class LiveStreamRecorder:
                                     await self.converts_mp4(path, self.user_config["delete_original"])
                     else:
                         try:
-                            self.app.page.run_task(
+                            self.app.run_task(
                                 self.converts_mp4, save_file_path, self.user_config["delete_original"]
                             )
                         except Exception as e:
@@ -319,7 +395,7 @@ class LiveStreamRecorder:
                 if self.user_config.get("execute_custom_script") and script_command:
                     logger.info("Prepare a direct script in the background")
                     try:
-                        self.app.page.run_task(
+                        self.app.run_task(
                             self.custom_script_execute,
                             script_command,
                             record_name,
@@ -446,7 +522,7 @@ class LiveStreamRecorder:
             logger.info("Application is closing, adding script execution task to background service")
             BackgroundService.get_instance().add_task(self.run_script_sync, script_command)
         else:
-            self.app.page.run_task(self.run_script_async, script_command)
+            self.app.run_task(self.run_script_async, script_command)
 
         logger.success("Script command execution initiated!")
 
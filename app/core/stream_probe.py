@@ -0,0 +1,124 @@
+import time
+
+import httpx
+
+from ..utils.logger import logger
+
+
+class ProbeResult:
+    LIVE = "live"
+    OFFLINE = "offline"
+    INCONCLUSIVE = "inconclusive"
+
+
+class StreamUrlProbe:
+    """
+    Cheap liveness probe against the last resolved stream URL of a recording.
+
+    A partial GET reads at most `max_bytes` of the stream: a media response means the room is still live,
+    404/410 or an ended HLS playlist means the stream is gone, anything else is inconclusive and the
+    caller should fall back to a full resolution through the platform handler.
+    """
+
+    OFFLINE_STATUS_CODES = (404, 410)
+    MEDIA_CONTENT_TYPES = ("video/", "audio/", "application/octet-stream", "mpegurl", "flv")
+
+    def __init__(self, timeout: float = 5.0, max_bytes: int = 4096):
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self._clients: dict[str | None, httpx.AsyncClient] = {}
+
+    def _get_client(self, proxy: str | None) -> httpx.AsyncClient:
+        if proxy not in self._clients:
+            self._clients[proxy] = httpx.AsyncClient(proxy=proxy, timeout=self.timeout, follow_redirects=True)
+        return self._clients[proxy]
+
+    @staticmethod
+    def parse_headers(headers: str | None) -> dict:
+        """Convert the ffmpeg style `key:value` header string used for recording into a dict."""
+        if not headers:
+            return {}
+        key, _, value = headers.partition(":")
+        return {key.strip(): value.strip()} if value else {}
+
+    async def probe(self, url: str, proxy: str | None = None, headers: str | None = None) -> str:
+        request_headers = {"Range": f"bytes=0-{self.max_bytes - 1}", **self.parse_headers(headers)}
+        try:
+            client = self._get_client(proxy)
+            async with client.stream("GET", url, headers=request_headers) as response:
+                if response.status_code in self.OFFLINE_STATUS_CODES:
+                    return ProbeResult.OFFLINE
+                if response.status_code not in (200, 206):
+                    return ProbeResult.INCONCLUSIVE
+
+                content_type = response.headers.get("content-type", "").lower()
+                chunk = b""
+                async for data in response.aiter_bytes():
+                    chunk += data
+                    if len(chunk) >= self.max_bytes:
+                        break
+
+                if chunk.startswith(b"#EXTM3U"):
+                    return ProbeResult.OFFLINE if b"#EXT-X-ENDLIST" in chunk else ProbeResult.LIVE
+                if chunk and (chunk.startswith(b"FLV") or any(t in content_type for t in self.MEDIA_CONTENT_TYPES)):
+                    return ProbeResult.LIVE
+                return ProbeResult.INCONCLUSIVE
+        except Exception as e:
+            # A malformed cached URL (httpx.InvalidURL, ...) must not break the live check that probes it
+            logger.debug(f"Stream URL probe failed: {type(e).__name__}, {url}")
+            return ProbeResult.INCONCLUSIVE
+
+    async def aclose(self) -> None:
+        """Close the per-proxy clients when the application shuts down."""
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            await client.aclose()
+
+
+class StreamInfoCache:
+    """
+    Last successful stream resolution of each recording, kept for `ttl` seconds on the monotonic clock.
+    Stream URLs are usually signed and expire, so entries are dropped once the TTL has passed.
+    """
+
+    DEFAULT_TTL = 600
+
+    def __init__(self, enabled: bool = False, ttl: float = DEFAULT_TTL):
+        self.enabled = enabled
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, object]] = {}
+
+    @classmethod
+    def from_config(cls, user_config: dict) -> "StreamInfoCache":
+        cache = cls()
+        cache.configure(user_config)
+        return cache
+
+    def configure(self, user_config: dict) -> None:
+        self.enabled = bool(user_config.get("stream_url_probe_enabled", False))
+        try:
+            self.ttl = max(1.0, float(user_config.get("stream_url_probe_ttl")))
+        except (TypeError, ValueError):
+            self.ttl = self.DEFAULT_TTL
+        if not self.enabled:
+            self._entries.clear()
+
+    def get(self, rec_id: str):
+        if not self.enabled:
+            return None
+        entry = self._entries.get(rec_id)
+        if not entry:
+            return None
+        expires_at, stream_info = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[rec_id]
+            return None
+        return stream_info
+
+    def set(self, rec_id: str, stream_info) -> None:
+        if not self.enabled:
+            return
+        self._entries[rec_id] = (time.monotonic() + self.ttl, stream_info)
+
+    def invalidate(self, rec_id: str) -> None:
+        self._entries.pop(rec_id, None)
@@ -0,0 +1,176 @@
+import asyncio
+import os
+import signal
+
+from . import execute_dir
+from .core.config_manager import ConfigManager
+from .core.event_bus import EventBus
+from .core.language_manager import LanguageManager
+from .core.record_manager import RecordingManager
+from .process_manager import AsyncProcessManager
+from .utils import utils
+from .utils.logger import logger
+
+
+class HeadlessSettings:
+    """Read-only view of the user configuration, exposing the part of SettingsPage used by the recording core."""
+
+    def __init__(self, app):
+        self.app = app
+        self.config_manager = app.config_manager
+        self.user_config = self.config_manager.load_user_config()
+        self.language_option = self.config_manager.load_language_config()
+        self.default_config = self.config_manager.load_default_config()
+        self.cookies_config = self.config_manager.load_cookies_config()
+        self.accounts_config = self.config_manager.load_accounts_config()
+        self.config_manager.hot_settings.refresh(self.user_config)
+        self._loaded_mtimes = self._config_mtimes()
+        self.language_code = None
+        self.default_language = None
+        self.load_language()
+
+    def load_language(self):
+        self.default_language, default_language_code = list(self.language_option.items())[0]
+        select_language = self.user_config.get("language")
+        self.language_code = self.language_option.get(select_language, default_language_code)
+        self.app.language_code = self.language_code
+
+    def _config_mtimes(self) -> tuple:
+        mtimes = []
+        for path in (
+            self.config_manager.user_config_path,
+            self.config_manager.cookies_config_path,
+            self.config_manager.accounts_config_path,
+        ):
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def reload_if_changed(self) -> bool:
+        """Reload the configuration files another front end saved since they were read; return True if any was."""
+        mtimes = self._config_mtimes()
+        if mtimes == self._loaded_mtimes:
+            return False
+        self._loaded_mtimes = mtimes
+        # Updated in place, the recording core keeps references to the dict
+        self.user_config.clear()
+        self.user_config.update(self.config_manager.load_user_config())
+        self.cookies_config = self.config_manager.load_cookies_config()
+        self.accounts_config = self.config_manager.load_accounts_config()
+        self.config_manager.hot_settings.refresh(self.user_config)
+        logger.info("Configuration reloaded")
+        return True
+
+    def get_config_value(self, key, default=None):
+        return self.user_config.get(key, self.default_config.get(key, default))
+
+    def get_cookies_value(self, key, default=""):
+        return self.cookies_config.get(key, default)
+
+    def get_accounts_value(self, key, default=None):
+        k1, k2 = key.split("_", maxsplit=1)
+        return self.accounts_config.get(k1, {}).get(k2, default)
+
+    def get_video_save_path(self):
+        live_save_path = self.get_config_value("live_save_path")
+        if not live_save_path:
+            live_save_path = os.path.join(self.app.run_path, 'downloads')
+        return live_save_path
+
+
+class HeadlessApp:
+    """
+    Runs the monitor, ffmpeg and post-processing pipeline on a plain asyncio loop without Flet.
+
+    Its manager is the runner of the monitoring engine. In headless mode state changes published on the event
+    bus are written to the log instead of repainting cards; with the UI the engine creates a HeadlessApp on the
+    engine's event bus, to which the sessions subscribe.
+    """
+
+    runs_monitoring = True
+
+    def __init__(self, event_bus: EventBus | None = None, process_manager: AsyncProcessManager | None = None):
+        self.run_path = execute_dir
+        self.assets_dir = os.path.join(execute_dir, "assets")
+        self.process_manager = process_manager or AsyncProcessManager()
+        self.config_manager = ConfigManager(self.run_path)
+        self.event_bus = event_bus or EventBus()
+        self.is_web_mode = False
+        self.current_page = None
+        self.language_code = None
+        self.settings = HeadlessSettings(self)
+        self.language_manager = LanguageManager(self)
+        self.subprocess_start_up_info = utils.get_startup_info()
+        self.recording_enabled = True
+        self._tasks = set()
+        self._stop_event = None
+        if event_bus is None:
+            self.event_bus.subscribe(EventBus.RECORDING_UPDATED, self.on_recording_updated)
+            self.event_bus.subscribe(EventBus.NOTICE, self.on_notice)
+        self.record_manager = RecordingManager(self)
+
+    def run_task(self, handler, *args, **kwargs):
+        task = asyncio.get_running_loop().create_task(handler(*args, **kwargs))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def add_ffmpeg_process(self, process):
+        self.process_manager.add_process(process)
+
+    @staticmethod
+    def on_recording_updated(recording):
+        logger.info(f"Recording Status: {recording.status_info}, {recording.streamer_name}, {recording.url}")
+
+    @staticmethod
+    def on_notice(message, **_):
+        logger.warning(message)
+
+    def stop(self):
+        if self._stop_event:
+            self._stop_event.set()
+
+    async def run(self):
+        self._stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):
+                # Windows event loops do not support signal handlers; Ctrl+C raises KeyboardInterrupt instead.
+                pass
+
+        await self.record_manager.check_free_space()
+        for recording in self.record_manager.recordings:
+            if recording.monitor_status and self.recording_enabled:
+                self.run_task(self.record_manager.check_if_live, recording)
+        monitor_task = self.run_task(
+            self.record_manager.setup_periodic_live_check, self.record_manager.loop_time_seconds
+        )
+        logger.info(f"Headless mode started, monitoring {len(self.record_manager.recordings)} recordings")
+
+        try:
+            await self._stop_event.wait()
+        finally:
+            logger.info("Headless mode stopping, waiting for recordings to finish")
+            monitor_task.cancel()
+            await self.cleanup()
+
+    async def cleanup(self):
+        self.record_manager.disable_recording()
+        try:
+            await self.process_manager.cleanup()
+        except Exception as e:
+            logger.error(f"Error during cleanup: {e}")
+        await self.record_manager.flush_recordings()
+        await self.record_manager.close()
+
+
+def main() -> int:
+    try:
+        asyncio.run(HeadlessApp().run())
+    except KeyboardInterrupt:
+        logger.info("Headless mode interrupted")
+    return 0
@@ -37,7 +37,9 @@ async def handle_app_close(page: ft.Page, app, save_progress_overlay) -> None:
         await close_dialog(e)
 
     async def close_dialog_dismissed(e):
-        app.recording_enabled = False
+        app.record_manager.disable_recording()
+        await app.record_manager.flush_recordings()
+        await app.record_manager.close()
 
         # check if there are active recordings
         active_recordings = [p for p in app.process_manager.ffmpeg_processes if p.returncode is None]
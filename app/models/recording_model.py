@@ -1,7 +1,98 @@
 from datetime import timedelta
 
 
+class RecordingSpec:
+    """Persistent configuration of a recording task. Every field is saved to the recording store."""
+
+    __slots__ = (
+        "rec_id",
+        "url",
+        "streamer_name",
+        "record_format",
+        "quality",
+        "segment_record",
+        "segment_time",
+        "monitor_status",
+        "scheduled_recording",
+        "scheduled_start_time",
+        "monitor_hours",
+        "recording_dir",
+        "enabled_message_push",
+        "platform",
+        "platform_key",
+        "live_history",
+    )
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+        self.live_history = self.live_history or []  # Recent go-live timestamps used for adaptive polling
+
+
+class RecordingRuntime:
+    """Volatile monitoring, recording and UI state of a recording task. Nothing here is persisted."""
+
+    __slots__ = (
+        "title",
+        "display_title",
+        "scheduled_time_range",
+        "speed",
+        "is_live",
+        "is_recording",
+        "start_time",
+        "manually_stopped",
+        "cumulative_duration",
+        "last_duration",
+        "selected",
+        "is_checking",
+        "status_info",
+        "live_title",
+        "detection_time",
+        "loop_time_seconds",
+        "use_proxy",
+        "record_url",
+        "check_failures",
+        "last_failure",
+        "progress",
+        "ffmpeg_log",
+        "stop_event",
+    )
+
+    def __init__(self, title):
+        self.title = title
+        self.display_title = title
+        self.scheduled_time_range = None
+        self.speed = "X KB/s"
+        self.is_live = False
+        self.is_recording = False
+        self.start_time = None
+        self.manually_stopped = False
+        self.cumulative_duration = timedelta()  # Accumulated recording time
+        self.last_duration = timedelta()  # Save the total time of the last recording
+        self.selected = False
+        self.is_checking = False
+        self.status_info = None
+        self.live_title = None
+        self.detection_time = None
+        self.loop_time_seconds = None
+        self.use_proxy = None
+        self.record_url = None
+        self.check_failures = 0  # Consecutive failed live status checks, drives the retry backoff
+        self.last_failure = None
+        self.progress = None  # FFmpegProgress of the running ffmpeg process
+        self.ffmpeg_log = None  # FFmpegLog with the recent stderr lines of the last ffmpeg process
+        self.stop_event = None  # Wakes the ffmpeg supervisor when the recording should stop
+
+
 class Recording:
+    """
+    A recording task: its persistent spec plus its runtime state. The fields of both parts are exposed as
+    attributes of the recording itself.
+    """
+
+    __slots__ = ("spec", "runtime")
+    field_observers = []
+
     def __init__(
         self,
         rec_id,
@@ -35,87 +126,37 @@ class Recording:
         :param recording_dir: Directory path where the recorded files will be saved.
         :param enabled_message_push: Whether to enable message push.
         """
-
-        self.rec_id = rec_id
-        self.url = url
-        self.quality = quality
-        self.record_format = record_format
-        self.monitor_status = monitor_status
-        self.segment_record = segment_record
-        self.segment_time = segment_time
-        self.streamer_name = streamer_name
-        self.scheduled_recording = scheduled_recording
-        self.scheduled_start_time = scheduled_start_time
-        self.monitor_hours = monitor_hours
-        self.recording_dir = recording_dir
-        self.enabled_message_push = enabled_message_push
-        self.scheduled_time_range = None
-        self.title = f"{streamer_name} - {self.quality}"
-        self.speed = "X KB/s"
-        self.is_live = False
-        self.is_recording = False
-        self.start_time = None
-        self.manually_stopped = False
-        self.platform = None
-        self.platform_key = None
-
-        self.cumulative_duration = timedelta()  # Accumulated recording time
-        self.last_duration = timedelta()  # Save the total time of the last recording
-        self.display_title = self.title
-        self.selected = False
-        self.is_checking = False
-        self.status_info = None
-        self.live_title = None
-        self.detection_time = None
-        self.loop_time_seconds = None
-        self.use_proxy = None
-        self.record_url = None
+        self.spec = RecordingSpec(
+            rec_id=rec_id,
+            url=url,
+            streamer_name=streamer_name,
+            record_format=record_format,
+            quality=quality,
+            segment_record=segment_record,
+            segment_time=segment_time,
+            monitor_status=monitor_status,
+            scheduled_recording=scheduled_recording,
+            scheduled_start_time=scheduled_start_time,
+            monitor_hours=monitor_hours,
+            recording_dir=recording_dir,
+            enabled_message_push=enabled_message_push,
+        )
+        self.runtime = RecordingRuntime(f"{streamer_name} - {quality}")
 
     def to_dict(self):
         """Convert the Recording instance to a dictionary for saving."""
-        return {
-            "rec_id": self.rec_id,
-            "url": self.url,
-            "streamer_name": self.streamer_name,
-            "record_format": self.record_format,
-            "quality": self.quality,
-            "segment_record": self.segment_record,
-            "segment_time": self.segment_time,
-            "monitor_status": self.monitor_status,
-            "scheduled_recording": self.scheduled_recording,
-            "scheduled_start_time": self.scheduled_start_time,
-            "monitor_hours": self.monitor_hours,
-            "recording_dir": self.recording_dir,
-            "enabled_message_push": self.enabled_message_push,
-            "platform": self.platform,
-            "platform_key": self.platform_key,
-        }
+        return {name: getattr(self.spec, name) for name in RecordingSpec.__slots__}
 
     @classmethod
     def from_dict(cls, data):
         """Create a Recording instance from a dictionary."""
-        recording = cls(
-            data.get("rec_id"),
-            data.get("url"),
-            data.get("streamer_name"),
-            data.get("record_format"),
-            data.get("quality"),
-            data.get("segment_record"),
-            data.get("segment_time"),
-            data.get("monitor_status"),
-            data.get("scheduled_recording"),
-            data.get("scheduled_start_time"),
-            data.get("monitor_hours"),
-            data.get("recording_dir"),
-            data.get("enabled_message_push"),
-        )
-        recording.title = data.get("title", recording.title)
+        recording = cls.__new__(cls)
+        recording.spec = RecordingSpec(**{name: data.get(name) for name in RecordingSpec.__slots__})
+        recording.runtime = RecordingRuntime(data.get("title", f"{recording.streamer_name} - {recording.quality}"))
         recording.display_title = data.get("display_title", recording.title)
-        recording.last_duration_str = data.get("last_duration")
-        recording.platform = data.get("platform")
-        recording.platform_key = data.get("platform_key")
-        if recording.last_duration_str is not None:
-            recording.last_duration = timedelta(seconds=float(recording.last_duration_str))
+        last_duration = data.get("last_duration")
+        if last_duration is not None:
+            recording.last_duration = timedelta(seconds=float(last_duration))
         return recording
 
     def update_title(self, quality_info, prefix=None):
@@ -128,3 +169,30 @@ class Recording:
         for attr, value in updated_info.items():
             if hasattr(self, attr):
                 setattr(self, attr, value)
+
+    @classmethod
+    def add_field_observer(cls, observer):
+        """Register a callable notified with (recording, field_name) whenever a field changes its value."""
+        if observer not in cls.field_observers:
+            cls.field_observers.append(observer)
+
+
+def _field_property(part: str, name: str) -> property:
+    def getter(self):
+        return getattr(getattr(self, part), name)
+
+    def setter(self, value):
+        target = getattr(self, part)
+        changed = Recording.field_observers and getattr(target, name) != value
+        setattr(target, name, value)
+        if changed:
+            for observer in Recording.field_observers:
+                observer(self, name)
+
+    return property(getter, setter)
+
+
+for _name in RecordingSpec.__slots__:
+    setattr(Recording, _name, _field_property("spec", _name))
+for _name in RecordingRuntime.__slots__:
+    setattr(Recording, _name, _field_property("runtime", _name))
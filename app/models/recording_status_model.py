@@ -9,6 +9,7 @@ class RecordingStatus:
     RECORDING_ERROR = "RECORDING_ERROR"
     NOT_RECORDING_SPACE = "NOT_RECORDING_SPACE"
     LIVE_STATUS_CHECK_ERROR = "LIVE_STATUS_CHECK_ERROR"
+    PLATFORM_CIRCUIT_OPEN = "PLATFORM_CIRCUIT_OPEN"
 
     @classmethod
     def get_status(cls):
@@ -62,10 +62,9 @@ class AsyncProcessManager:
             try:
                 if process.returncode is None:
                     logger.debug(f"Terminating process {process.pid}")
-                    if os.name == "nt":
-                        if process.stdin:
-                            process.stdin.write(b"q")
-                            await process.stdin.drain()
+                    if os.name == "nt" and process.stdin:
+                        process.stdin.write(b"q")
+                        await process.stdin.drain()
                     else:
                         process.terminate()
 
@@ -37,6 +37,12 @@ class CardDialog(ft.AlertDialog):
         scheduled_time_range = recording.scheduled_time_range or self._["none"]
         save_path = recording.recording_dir or self._["no_recording_dir_tip"]
         recording_status_info = self._[recording.status_info]
+        if recording.check_failures:
+            recording_status_info += f" ({self._['check_failures']}: {recording.check_failures}"
+            if recording.last_failure:
+                recording_status_info += f", {recording.last_failure.kind}"
+            recording_status_info += ")"
+        breaker_state = self.app.record_manager.circuit_breakers.get_state(recording.platform_key)
         from ...messages.message_pusher import MessagePusher
         should_push_message = MessagePusher.should_push_message(self.app.settings, recording)
         message_push = self._["enabled"] if should_push_message else self._["disabled"]
@@ -58,6 +64,7 @@ class CardDialog(ft.AlertDialog):
                 ft.Text(f"{self._['message_push']}: {message_push}", size=14),
                 ft.Text(f"{self._['save_path']}: {save_path}", size=14, selectable=True),
                 ft.Text(f"{self._['recording_status']}: {recording_status_info}", size=14),
+                ft.Text(f"{self._['platform_circuit_state']}: {self._['circuit_' + breaker_state]}", size=14),
             ],
             spacing=8,
             scroll=ft.ScrollMode.AUTO,
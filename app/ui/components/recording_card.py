@@ -1,5 +1,6 @@
 import asyncio
 import os.path
+import time
 from functools import partial
 
 import flet as ft
@@ -7,18 +8,25 @@ import flet as ft
 from ...models.recording_model import Recording
 from ...models.recording_status_model import RecordingStatus
 from ...utils import utils
-from ..views.storage_view import StoragePage
+from ...utils.logger import logger
 from .card_dialog import CardDialog
 from .recording_dialog import RecordingDialog
 from .video_player import VideoPlayer
 
 
 class RecordingCardManager:
+    FLUSHES_PER_SECOND = 5
+
     def __init__(self, app):
         self.app = app
         self.cards_obj = {}
-        self.update_duration_tasks = {}
+        self.visible_ids = None
+        self.duration_ticker = None
         self.selected_cards = {}
+        self._dirty_cards = {}
+        self._broadcast_ids = set()
+        self._flush_scheduled = False
+        self._last_flush = 0.0
         self.app.language_manager.add_observer(self)
         self._ = {}
         self.load()
@@ -37,15 +45,25 @@ class RecordingCardManager:
         """Create a card for a given recording."""
         rec_id = recording.rec_id
         if not self.cards_obj.get(rec_id):
-            if self.app.recording_enabled:
-                self.app.page.run_task(self.app.record_manager.check_if_live, recording)
-            else:
-                recording.status_info = RecordingStatus.NOT_RECORDING_SPACE
+            self.app.record_manager.start_initial_check(recording)
         card_data = self._create_card_components(recording)
         self.cards_obj[rec_id] = card_data
         self.start_update_task(recording)
         return card_data["card"]
 
+    def is_visible(self, rec_id: str) -> bool:
+        """Whether a recording passes the current home page filter."""
+        return self.visible_ids is None or rec_id in self.visible_ids
+
+    def evict_cards(self, keep_ids: set, limit: int):
+        """Drop cached cards that are not rendered once more than `limit` cards are cached."""
+        if len(self.cards_obj) <= limit:
+            return
+        for rec_id in [rec_id for rec_id in self.cards_obj if rec_id not in keep_ids]:
+            if len(self.cards_obj) <= limit:
+                break
+            del self.cards_obj[rec_id]
+
     def _create_card_components(self, recording: Recording):
         """create card components."""
         speed = recording.speed
@@ -178,6 +196,8 @@ class RecordingCardManager:
             RecordingStatus.LIVE_STATUS_CHECK_ERROR
         ]:
             return ft.colors.RED
+        elif recording.status_info == RecordingStatus.PLATFORM_CIRCUIT_OPEN:
+            return ft.colors.DEEP_ORANGE
         elif not recording.is_live and recording.monitor_status:
             return ft.colors.AMBER
         elif not recording.monitor_status:
@@ -205,6 +225,17 @@ class RecordingCardManager:
                 height=26,
                 alignment=ft.alignment.center,
             )
+        elif recording.status_info == RecordingStatus.PLATFORM_CIRCUIT_OPEN:
+            return ft.Container(
+                content=ft.Text(self._["platform_paused"], color=ft.colors.WHITE, size=12, weight=ft.FontWeight.BOLD),
+                bgcolor=ft.colors.DEEP_ORANGE,
+                border_radius=5,
+                padding=5,
+                width=60,
+                height=26,
+                alignment=ft.alignment.center,
+                tooltip=self._["platform_paused_tip"],
+            )
         elif not recording.is_live and recording.monitor_status:
             return ft.Container(
                 content=ft.Text(self._["offline"], color=ft.colors.BLACK, size=12, weight=ft.FontWeight.BOLD),
@@ -227,9 +258,49 @@ class RecordingCardManager:
             )
         return None
 
-    async def update_card(self, recording):
-        """Update only the recordings cards in the scrollable content area."""
+    async def update_card(self, recording, broadcast: bool = True):
+        """Queue a refresh of a recording card; it is applied with the next batched flush."""
+        self.request_update(recording, broadcast)
+
+    def request_update(self, recording, broadcast: bool = True):
+        """
+        Mark a recording card as dirty. Dirty cards are redrawn together at most `FLUSHES_PER_SECOND` times
+        per second with a single page update, and other sessions receive one aggregated pubsub message per flush.
+        """
+        self._dirty_cards[recording.rec_id] = recording
+        if broadcast:
+            self._broadcast_ids.add(recording.rec_id)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.app.page.run_task(self.flush_updates)
+
+    async def flush_updates(self):
+        delay = self._last_flush + 1 / self.FLUSHES_PER_SECOND - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        dirty_cards, self._dirty_cards = self._dirty_cards, {}
+        broadcast_ids, self._broadcast_ids = self._broadcast_ids, set()
+        self._flush_scheduled = False
+        self._last_flush = time.monotonic()
+
+        for recording in dirty_cards.values():
+            self._apply_card_update(recording)
+        try:
+            self.app.page.update()
+        except Exception as e:
+            logger.error(f"Error updating cards: {e}")
+
+        broadcast = [recording for rec_id, recording in dirty_cards.items() if rec_id in broadcast_ids]
+        if broadcast:
+            self.app.page.pubsub.send_others_on_topic("update", broadcast)
+
+    def _apply_card_update(self, recording):
+        """Update the controls of a recording card in the scrollable content area without sending them."""
         if recording.rec_id in self.cards_obj:
+            if recording.is_recording:
+                # Restarts the duration ticker if it stopped, e.g. after a failed page update
+                self.start_update_task(recording)
             try:
                 recording_card = self.cards_obj[recording.rec_id]
                 
@@ -279,10 +350,9 @@ class RecordingCardManager:
                 if recording_card["card"] and recording_card["card"].content:
                     recording_card["card"].content.bgcolor = self.get_card_background_color(recording)
                     recording_card["card"].content.border = ft.border.all(2, self.get_card_border_color(recording))
-                    recording_card["card"].update()
 
             except Exception as e:
-                print(f"Error updating card: {e}")
+                logger.error(f"Error updating card: {e}")
 
     async def update_monitor_state(self, recording: Recording):
         """Update the monitor button state based on the current monitoring status."""
@@ -309,7 +379,6 @@ class RecordingCardManager:
             self.app.page.run_task(self.app.snack_bar.show_snack_bar, self._["start_monitor_tip"], ft.Colors.GREEN)
 
         await self.update_card(recording)
-        self.app.page.pubsub.send_others_on_topic("update", recording)
         self.app.page.run_task(self.app.record_manager.persist_recordings)
 
     async def show_recording_info_dialog(self, recording: Recording):
@@ -332,7 +401,6 @@ class RecordingCardManager:
             recording.scheduled_start_time, recording.monitor_hours)
 
         await self.update_card(recording)
-        self.app.page.pubsub.send_others_on_topic("update", recording_dict)
 
     async def on_toggle_recording(self, recording: Recording):
         """Toggle the recording state for a specific recording."""
@@ -352,7 +420,6 @@ class RecordingCardManager:
                     await self.app.snack_bar.show_snack_bar(self._["please_start_monitor_tip"])
 
             await self.update_card(recording)
-            self.app.page.pubsub.send_others_on_topic("update", recording)
 
     async def on_delete_recording(self, recording: Recording):
         """Delete a recording from the list and update UI."""
@@ -410,21 +477,34 @@ class RecordingCardManager:
     def get_tip_for_monitor_state(self, recording: Recording):
         return self._["stop_monitor"] if recording.monitor_status else self._["start_monitor"]
 
-    async def update_duration(self, recording: Recording):
-        """Update the duration text periodically."""
-        while True:
-            await asyncio.sleep(1)  # Update every second
-            if not recording or recording.rec_id not in self.cards_obj:  # Stop task if card is removed
-                break
-
-            if recording.is_recording:
-                duration_label = self.cards_obj[recording.rec_id]["duration_label"]
-                duration_label.value = self.app.record_manager.get_duration(recording)
-                duration_label.update()
+    async def update_durations(self):
+        """
+        Shared ticker for the duration and speed labels of all cards. Once a second it refreshes the labels
+        of the recordings that are recording and whose card is visible, and sends them in a single page update.
+        Only the active recordings are visited, so the cost does not grow with the size of the list.
+        """
+        try:
+            while self.cards_obj:
+                await asyncio.sleep(1)  # Update every second
+                updated = False
+                for recording in self.app.record_manager.active_recordings:
+                    card_data = self.cards_obj.get(recording.rec_id)
+                    if not card_data or not card_data["card"].visible or card_data["card"].page is None:
+                        continue
+                    card_data["duration_label"].value = self.app.record_manager.get_duration(recording)
+                    card_data["speed_label"].value = recording.speed
+                    updated = True
+                if updated:
+                    self.app.page.update()
+        except Exception as e:
+            logger.debug(f"Duration ticker stopped: {e}")
+        finally:
+            self.duration_ticker = None
 
     def start_update_task(self, recording: Recording):
-        """Start a background task to update the duration text."""
-        self.update_duration_tasks[recording.rec_id] = self.app.page.run_task(self.update_duration, recording)
+        """Start the shared duration ticker if it is not running yet."""
+        if self.duration_ticker is None:
+            self.duration_ticker = self.app.page.run_task(self.update_durations)
 
     async def on_card_click(self, recording: Recording):
         """Handle card click events."""
@@ -491,6 +571,8 @@ class RecordingCardManager:
             if video_files:
                 video_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
                 latest_video = video_files[0]
+                from ..views.storage_view import StoragePage
+
                 await StoragePage(self.app).preview_file(latest_video, recording.url)
             else:
                 await self.app.snack_bar.show_snack_bar(self._["no_video_file"])
@@ -512,8 +594,9 @@ class RecordingCardManager:
     async def recording_card_on_click(self, _, recording: Recording):
         await self.on_card_click(recording)
 
-    async def subscribe_update_card(self, _, recording: Recording):
-        await self.update_card(recording)
+    async def subscribe_update_card(self, _, recordings: list[Recording]):
+        for recording in recordings:
+            self.request_update(recording, broadcast=False)
 
     async def subscribe_remove_cards(self, _, recordings: list[Recording]):
         await self.remove_recording_card(recordings)
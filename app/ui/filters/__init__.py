@@ -1,3 +1,4 @@
 from .recording_filters import RecordingFilters
+from .recording_index import RecordingIndex
 
-__all__ = ["RecordingFilters"] 
\ No newline at end of file
+__all__ = ["RecordingFilters", "RecordingIndex"] 
\ No newline at end of file
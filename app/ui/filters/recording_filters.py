@@ -3,7 +3,11 @@ from ...models.recording_status_model import RecordingStatus
 
 class RecordingFilters:
 
-    ERROR_STATUSES = [RecordingStatus.RECORDING_ERROR, RecordingStatus.LIVE_STATUS_CHECK_ERROR]
+    ERROR_STATUSES = [
+        RecordingStatus.RECORDING_ERROR,
+        RecordingStatus.LIVE_STATUS_CHECK_ERROR,
+        RecordingStatus.PLATFORM_CIRCUIT_OPEN,
+    ]
 
     STATUS_FILTER_MAP = {
         "all": lambda rec: True,
@@ -0,0 +1,204 @@
+import re
+
+from ...models.recording_model import Recording, RecordingSpec
+from .recording_filters import RecordingFilters
+
+
+def _iter_bits(bits: int):
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class RecordingIndex:
+    """
+    Incremental search and filter index over all recordings of the process.
+
+    Every recording gets a slot number. Status filters and platforms are kept as bitmaps over the slots, so
+    a status/platform filter is one AND. A query matches the same text as the plain search did, the saved
+    fields of the recording (as in `to_dict`) and its display title, as one substring. That text is split into
+    tokens with a posting set per token, and a trigram index over the token vocabulary finds the tokens
+    containing a query word, so only the recordings holding every word are checked for the whole query. The
+    index follows field changes through `Recording.add_field_observer` and
+    additions and removals through the observers of `GlobalRecordingState`.
+    """
+
+    SAVED_FIELDS = tuple(name for name in RecordingSpec.__slots__ if name != "live_history")
+    TEXT_FIELDS = (*SAVED_FIELDS, "display_title")
+    STATUS_FIELDS = ("is_recording", "is_live", "monitor_status", "status_info", "platform_key")
+    TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls, record_manager) -> "RecordingIndex":
+        if cls._instance is None:
+            cls._instance = cls(record_manager.recordings)
+            record_manager.add_observer(cls._instance)
+        return cls._instance
+
+    def __init__(self, recordings=()):
+        self._slots: dict[str, int] = {}
+        self._recordings = []
+        self._free_slots = []
+        self._tokens_by_slot: dict[int, frozenset] = {}
+        self._text_by_slot: dict[int, tuple[str, str]] = {}
+        self._postings: dict[str, set[int]] = {}
+        self._trigrams: dict[str, set[str]] = {}
+        self._status_bits = dict.fromkeys(RecordingFilters.STATUS_FILTER_MAP, 0)
+        self._platform_bits: dict[str | None, int] = {}
+        self._platform_by_slot: dict[int, str | None] = {}
+        self.all_bits = 0
+        for recording in recordings:
+            self.recording_added(recording)
+        Recording.add_field_observer(self.on_field_changed)
+
+    @classmethod
+    def tokenize(cls, text: str) -> list[str]:
+        return cls.TOKEN_PATTERN.findall(text.lower())
+
+    @staticmethod
+    def trigrams(token: str) -> set[str]:
+        return {token[i:i + 3] for i in range(len(token) - 2)}
+
+    def recording_added(self, recording) -> None:
+        if recording.rec_id in self._slots:
+            return
+        slot = self._free_slots.pop() if self._free_slots else len(self._recordings)
+        if slot == len(self._recordings):
+            self._recordings.append(recording)
+        else:
+            self._recordings[slot] = recording
+        self._slots[recording.rec_id] = slot
+        self.all_bits |= 1 << slot
+        self._index_text(slot, recording)
+        self._index_status(slot, recording)
+
+    def recording_removed(self, recording) -> None:
+        slot = self._slots.pop(recording.rec_id, None)
+        if slot is None:
+            return
+        self._unindex_text(slot)
+        self._unindex_status(slot)
+        self.all_bits &= ~(1 << slot)
+        self._recordings[slot] = None
+        self._free_slots.append(slot)
+
+    def recordings_cleared(self) -> None:
+        for recording in [rec for rec in self._recordings if rec is not None]:
+            self.recording_removed(recording)
+
+    def on_field_changed(self, recording, field: str) -> None:
+        slot = self._slots.get(recording.rec_id)
+        if slot is None or self._recordings[slot] is not recording:
+            return
+        if field in self.TEXT_FIELDS:
+            self._unindex_text(slot)
+            self._index_text(slot, recording)
+        if field in self.STATUS_FIELDS:
+            self._unindex_status(slot)
+            self._index_status(slot, recording)
+
+    def _index_text(self, slot: int, recording) -> None:
+        saved_text = str({field: getattr(recording, field) for field in self.SAVED_FIELDS}).lower()
+        display_title = recording.display_title or ""
+        self._text_by_slot[slot] = (saved_text, display_title)
+        tokens = set(self.tokenize(saved_text))
+        tokens.update(self.tokenize(display_title))
+        self._tokens_by_slot[slot] = frozenset(tokens)
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = set()
+                for trigram in self.trigrams(token):
+                    self._trigrams.setdefault(trigram, set()).add(token)
+            posting.add(slot)
+
+    def _unindex_text(self, slot: int) -> None:
+        self._text_by_slot.pop(slot, None)
+        for token in self._tokens_by_slot.pop(slot, ()):
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            posting.discard(slot)
+            if not posting:
+                del self._postings[token]
+                for trigram in self.trigrams(token):
+                    tokens = self._trigrams.get(trigram)
+                    if tokens is not None:
+                        tokens.discard(token)
+                        if not tokens:
+                            del self._trigrams[trigram]
+
+    def _index_status(self, slot: int, recording) -> None:
+        bit = 1 << slot
+        for name, status_filter in RecordingFilters.STATUS_FILTER_MAP.items():
+            if status_filter(recording):
+                self._status_bits[name] |= bit
+        platform_key = recording.platform_key
+        self._platform_by_slot[slot] = platform_key
+        self._platform_bits[platform_key] = self._platform_bits.get(platform_key, 0) | bit
+
+    def _unindex_status(self, slot: int) -> None:
+        mask = ~(1 << slot)
+        for name in self._status_bits:
+            self._status_bits[name] &= mask
+        platform_key = self._platform_by_slot.pop(slot, None)
+        if platform_key in self._platform_bits:
+            self._platform_bits[platform_key] &= mask
+            if not self._platform_bits[platform_key]:
+                del self._platform_bits[platform_key]
+
+    def filter_bits(self, status_filter: str = "all", platform_filter: str = "all") -> int:
+        bits = self._status_bits.get(status_filter, 0)
+        if platform_filter != "all":
+            bits &= self._platform_bits.get(platform_filter, 0)
+        return bits
+
+    def _matching_slots(self, word: str) -> set[int]:
+        if len(word) >= 3:
+            candidates = None
+            for trigram in self.trigrams(word):
+                tokens = self._trigrams.get(trigram)
+                if not tokens:
+                    return set()
+                candidates = set(tokens) if candidates is None else candidates & tokens
+        else:
+            candidates = self._postings.keys()
+        slots = set()
+        for token in candidates:
+            if word in token:
+                slots.update(self._postings[token])
+        return slots
+
+    def _to_ids(self, slots) -> set[str]:
+        return {self._recordings[slot].rec_id for slot in slots}
+
+    def filter(self, status_filter: str = "all", platform_filter: str = "all") -> set[str]:
+        """Return the ids of the recordings that pass the status and platform filters."""
+        return self._to_ids(_iter_bits(self.filter_bits(status_filter, platform_filter)))
+
+    def search(self, query: str, status_filter: str = "all", platform_filter: str = "all") -> set[str]:
+        """Return the ids of the filtered recordings whose saved fields or display title contain the query."""
+        lower_query = query.strip().lower()
+        if not lower_query:
+            return self.filter(status_filter, platform_filter)
+        bits = self.filter_bits(status_filter, platform_filter)
+        # Every word of a matching query lies inside one token of the text, so the postings narrow the
+        # candidates; a query without words (only punctuation) is checked against every filtered recording
+        slots = None
+        for word in sorted(self.tokenize(lower_query), key=len, reverse=True):
+            matched = self._matching_slots(word)
+            slots = matched if slots is None else slots & matched
+            if not slots:
+                return set()
+        if slots is None:
+            slots = _iter_bits(bits)
+        matches = []
+        for slot in slots:
+            if bits >> slot & 1:
+                saved_text, display_title = self._text_by_slot[slot]
+                if lower_query in saved_text or lower_query in display_title:
+                    matches.append(slot)
+        return self._to_ids(matches)
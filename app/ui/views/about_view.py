@@ -22,6 +22,7 @@ class AboutPage(PageBase):
     async def load(self):
         """Load the about page content."""
         self.content_area.clean()
+        self.page.on_keyboard_event = self.on_keyboard
 
         # Dynamically set colors based on the current theme mode
         theme_mode = self.page.theme_mode
@@ -1,4 +1,4 @@
-import asyncio
+import math
 import uuid
 
 import flet as ft
@@ -10,10 +10,16 @@ from ..base_page import PageBase
 from ..components.help_dialog import HelpDialog
 from ..components.recording_dialog import RecordingDialog
 from ..components.search_dialog import SearchDialog
-from ..filters import RecordingFilters
+from ..filters import RecordingIndex
 
 
 class HomePage(PageBase):
+    OVERSCAN_ROWS = 3  # Card rows materialized above and below the viewport
+    MAX_CACHED_CARDS = 600  # Cards kept alive for the filtered-out or scrolled-away recordings
+    GRID_COLUMN_WIDTH = 350
+    LIST_ROW_HEIGHT = 125  # Estimated height of a card in list view, spacing included
+    DEFAULT_VIEWPORT_HEIGHT = 1000  # Used until the first scroll event reports the real height
+
     def __init__(self, app):
         super().__init__(app)
         self.page_name = "home"
@@ -26,6 +32,15 @@ class HomePage(PageBase):
         self.current_filter = "all"
         self.current_platform_filter = "all"
         self.platform_buttons = {}
+        self.filtered_ids = None
+        self.cards_column = None
+        self.cards_top_spacer = ft.Container(height=0)
+        self.cards_bottom_spacer = ft.Container(height=0)
+        self.scroll_offset = 0.0
+        self.viewport_height = self.DEFAULT_VIEWPORT_HEIGHT
+        self.match_count = 0
+        self.window_range = (0, 0)
+        self.is_rendering = False
         self.init()
 
     def load_language(self):
@@ -97,8 +112,7 @@ class HomePage(PageBase):
         current_content = self.recording_card_area.content
         current_controls = current_content.controls if hasattr(current_content, 'controls') else []
 
-        column_width = 350
-        runs_count = max(1, int(self.page.width / column_width))
+        runs_count = max(1, int(self.page.width / self.GRID_COLUMN_WIDTH))
 
         if self.is_grid_view:
             new_content = ft.GridView(
@@ -126,6 +140,8 @@ class HomePage(PageBase):
             ]
         )
         self.content_area.update()
+        # Rows have another height and width in the new mode, so the card window is computed again
+        await self.render_cards()
         
         self.app.settings.user_config["is_grid_view"] = self.is_grid_view
         self.page.run_task(self.app.config_manager.save_user_config, self.app.settings.user_config)
@@ -284,68 +300,117 @@ class HomePage(PageBase):
         self.current_filter = "stopped"
         await self.apply_filter()
     
-    async def apply_filter(self):
+    async def apply_filter(self, reset: bool = True):
         self.content_area.controls[1] = self.create_filter_area()
-        
-        cards_obj = self.app.record_card_manager.cards_obj
-        recordings = self.app.record_manager.recordings
-        
-        for recording in recordings:
-            card_info = cards_obj.get(recording.rec_id)
-            if not card_info:
-                continue
-            
-            status_visible = RecordingFilters.get_status_filter_result(recording, self.current_filter)
-            platform_visible = RecordingFilters.get_platform_filter_result(recording, self.current_platform_filter)
-            
-            visible = status_visible and platform_visible
-            card_info["card"].visible = visible
-        
+        self.set_filtered_ids(self.get_search_index().filter(self.current_filter, self.current_platform_filter))
+        await self.render_cards(reset)
         self.content_area.update()
-        self.recording_card_area.update()
+
+    def set_filtered_ids(self, filtered_ids: set | None):
+        self.filtered_ids = filtered_ids
+        self.app.record_card_manager.visible_ids = filtered_ids
+
+    async def get_or_create_card(self, recording: Recording):
+        card_data = self.app.record_card_manager.cards_obj.get(recording.rec_id)
+        if card_data:
+            card = card_data["card"]
+        else:
+            card = await self.app.record_card_manager.create_card(recording)
+            recording.scheduled_time_range = await self.app.record_manager.get_scheduled_time_range(
+                recording.scheduled_start_time, recording.monitor_hours
+            )
+        card.visible = True
+        return card
+
+    def get_row_metrics(self) -> tuple[int, float]:
+        """Cards per row and the estimated height of a row, spacing included, in the current view mode."""
+        content = self.recording_card_area.content
+        if isinstance(content, ft.GridView):
+            per_row = max(1, content.runs_count or 1)
+            width = self.page.width or self.GRID_COLUMN_WIDTH * per_row
+            return per_row, width / per_row / content.child_aspect_ratio + content.run_spacing
+        return 1, self.LIST_ROW_HEIGHT
+
+    def get_cards_in_view(self, overscan_rows: int = 0) -> tuple[int, int]:
+        """Range of the matching recordings whose rows are in the viewport, widened by `overscan_rows`."""
+        per_row, row_height = self.get_row_metrics()
+        first_row = max(int(self.scroll_offset // row_height) - overscan_rows, 0)
+        last_row = math.ceil((self.scroll_offset + self.viewport_height) / row_height) + overscan_rows
+        end = min(last_row * per_row, self.match_count)
+        return min(first_row * per_row, end), end
+
+    async def render_cards(self, reset: bool = True):
+        """
+        Put the cards of the filtered recordings around the viewport into the card area.
+        Only the rows in view plus `OVERSCAN_ROWS` on either side are materialized, and spacers take the
+        height of the rows above and below them, so the page holds the same number of controls whatever the
+        size of the watchlist. Cards scrolled out of the window stay cached, up to `MAX_CACHED_CARDS`, and
+        are reused when they come back into view.
+        """
+        if reset:
+            self.scroll_to_top()
+        matches = [
+            recording for recording in self.app.record_manager.recordings
+            if self.filtered_ids is None or recording.rec_id in self.filtered_ids
+        ]
+        self.match_count = len(matches)
+        start, end = self.get_cards_in_view(self.OVERSCAN_ROWS)
+        self.window_range = (start, end)
+        window = matches[start:end]
+
+        per_row, row_height = self.get_row_metrics()
+        self.cards_top_spacer.height = start // per_row * row_height
+        self.cards_bottom_spacer.height = math.ceil((len(matches) - end) / per_row) * row_height
+        controls = [await self.get_or_create_card(recording) for recording in window]
+        self.recording_card_area.content.controls = controls
+        self.app.record_card_manager.evict_cards({recording.rec_id for recording in window}, self.MAX_CACHED_CARDS)
+        if self.cards_column and self.cards_column.page:
+            self.cards_column.update()
+
+    def scroll_to_top(self):
+        self.scroll_offset = 0.0
+        if self.cards_column and self.cards_column.page:
+            self.cards_column.scroll_to(offset=0)
+
+    async def on_cards_scroll(self, e: ft.OnScrollEvent):
+        self.scroll_offset = e.pixels
+        if e.viewport_dimension:
+            self.viewport_height = e.viewport_dimension
+        if self.is_rendering:
+            return
+        # Slide the window only once rows outside of it come into view, not on every scroll event
+        start, end = self.get_cards_in_view()
+        window_start, window_end = self.window_range
+        if window_start <= start and end <= window_end:
+            return
+        self.is_rendering = True
+        try:
+            await self.render_cards(reset=False)
+        finally:
+            self.is_rendering = False
 
     async def reset_cards_visibility(self):
-        cards_obj = self.app.record_card_manager.cards_obj
-        for card_info in cards_obj.values():
-            if not card_info["card"].visible:
-                card_info["card"].visible = True
-                card_info["card"].update()
+        self.set_filtered_ids(None)
+        await self.render_cards()
 
-    async def filter_recordings(self, query):
-        recordings = self.app.record_manager.recordings
-        cards_obj = self.app.record_card_manager.cards_obj
+    def get_search_index(self) -> RecordingIndex:
+        return RecordingIndex.get_instance(self.app.record_manager)
 
+    async def filter_recordings(self, query):
         if not query.strip():
             await self.apply_filter()
             return {}
         else:
-            lower_query = query.strip().lower()
-            search_ids = {
-                rec.rec_id
-                for rec in recordings
-                if lower_query in str(rec.to_dict()).lower() or lower_query in rec.display_title
-            }
-            
-            filtered_ids = set()
-            
-            for rec_id in search_ids:
-                recording = self.app.record_manager.find_recording_by_id(rec_id)
-                if not recording:
-                    continue
-
-                if RecordingFilters.should_show_recording(self.current_filter, self.current_platform_filter, recording):
-                    filtered_ids.add(rec_id)
-
-            for card_info in cards_obj.values():
-                card_info["card"].visible = card_info["card"].key in filtered_ids
-                card_info["card"].update()
+            filtered_ids = self.get_search_index().search(query, self.current_filter, self.current_platform_filter)
+            self.set_filtered_ids(filtered_ids)
+            await self.render_cards()
 
             if not filtered_ids:
                 await self.app.snack_bar.show_snack_bar(self._["not_search_result"], duration=2000)
             return filtered_ids
 
     def create_home_content_area(self):
-        return ft.Column(
+        self.cards_column = ft.Column(
             expand=True,
             controls=[
                 ft.Divider(height=1),
@@ -353,52 +418,29 @@ class HomePage(PageBase):
                     content=self.loading_indicator,
                     alignment=ft.alignment.center
                 ),
+                self.cards_top_spacer,
                 self.recording_card_area,
+                self.cards_bottom_spacer,
             ],
             scroll=ft.ScrollMode.AUTO,
+            on_scroll=self.on_cards_scroll,
+            on_scroll_interval=100,
         )
+        return self.cards_column
 
     async def add_record_cards(self):
         
         self.loading_indicator.visible = True
         self.loading_indicator.update()
 
-        cards_to_create = []
-        existing_cards = []
-        
+        # Every room gets its first live check, whether or not its card is on the first page
         for recording in self.app.record_manager.recordings:
             if recording.rec_id not in self.app.record_card_manager.cards_obj:
-                cards_to_create.append(recording)
-            else:
-                existing_card = self.app.record_card_manager.cards_obj[recording.rec_id]["card"]
-                existing_card.visible = True
-                existing_cards.append(existing_card)
-        
-        async def create_card_with_time_range(_recording: Recording):
-            _card = await self.app.record_card_manager.create_card(_recording)
-            _recording.scheduled_time_range = await self.app.record_manager.get_scheduled_time_range(
-                _recording.scheduled_start_time, _recording.monitor_hours
-            )
-            return _card, _recording
-        
-        if cards_to_create:
-            results = await asyncio.gather(*[
-                create_card_with_time_range(recording)
-                for recording in cards_to_create
-            ])
-            
-            for card, recording in results:
-                self.recording_card_area.content.controls.append(card)
-                self.app.record_card_manager.cards_obj[recording.rec_id]["card"] = card
-            
-            if existing_cards:
-                for card in existing_cards:
-                    self.recording_card_area.content.controls.append(card)
+                self.app.record_manager.start_initial_check(recording)
 
         self.loading_indicator.visible = False
         self.loading_indicator.update()
-        self.recording_card_area.update()
-        
+
         if not self.app.record_manager.periodic_task_started:
             self.page.run_task(
                 self.app.record_manager.setup_periodic_live_check,
@@ -408,11 +450,6 @@ class HomePage(PageBase):
         await self.apply_filter()
 
     async def show_all_cards(self):
-        cards_obj = self.app.record_card_manager.cards_obj
-        for card in cards_obj.values():
-            card["card"].visible = True
-        self.recording_card_area.update()
-        
         await self.apply_filter()
 
     async def add_recording(self, recordings_info):
@@ -465,27 +502,10 @@ class HomePage(PageBase):
             new_recordings.append(recording)
 
         if new_recordings:
-            async def create_card_with_time_range(rec):
-                _card = await self.app.record_card_manager.create_card(rec)
-                rec.scheduled_time_range = await self.app.record_manager.get_scheduled_time_range(
-                    rec.scheduled_start_time, rec.monitor_hours
-                )
-                return _card, rec
-
-            results = await asyncio.gather(*[
-                create_card_with_time_range(rec)
-                for rec in new_recordings
-            ])
-
-            for card, recording in results:
-                self.recording_card_area.content.controls.append(card)
-                self.app.record_card_manager.cards_obj[recording.rec_id]["card"] = card
+            for recording in new_recordings:
+                self.app.record_manager.start_initial_check(recording)
                 self.app.page.pubsub.send_others_on_topic("add", recording)
-            
-            self.recording_card_area.update()
-            
-            self.content_area.controls[1] = self.create_filter_area()
-            self.content_area.update()
+            await self.apply_filter(reset=False)
 
         await self.app.snack_bar.show_snack_bar(self._["add_recording_success_tip"], bgcolor=ft.Colors.GREEN)
 
@@ -516,12 +536,10 @@ class HomePage(PageBase):
             if card_id in selected_cards:
                 selected_cards[card_id].selected = False
                 card["card"].content.bgcolor = None
-                card["card"].update()
 
         for card in to_remove:
             card_key = card["card"].key
             cards_obj.pop(card_key, None)
-            self.recording_card_area.controls.remove(card["card"])
         await self.show_all_cards()
         
         self.content_area.controls[1] = self.create_filter_area()
@@ -589,6 +607,9 @@ class HomePage(PageBase):
         self.recording_card_area.content.controls.clear()
         self.recording_card_area.update()
         self.app.record_card_manager.cards_obj = {}
+        self.cards_top_spacer.height = self.cards_bottom_spacer.height = 0
+        self.match_count = 0
+        self.window_range = (0, 0)
         
         self.current_platform_filter = "all"
         
@@ -605,21 +626,11 @@ class HomePage(PageBase):
         self.loading_indicator.update()
         
         if recording.rec_id not in self.app.record_card_manager.cards_obj:
-            card = await self.app.record_card_manager.create_card(recording)
-            recording.scheduled_time_range = await self.app.record_manager.get_scheduled_time_range(
-                recording.scheduled_start_time, recording.monitor_hours
-            )
-            
-            self.recording_card_area.content.controls.append(card)
-            self.app.record_card_manager.cards_obj[recording.rec_id]["card"] = card
-            
-            self.loading_indicator.visible = False
-            self.loading_indicator.update()
-            
-            self.recording_card_area.update()
-            
-            self.content_area.controls[1] = self.create_filter_area()
-            self.content_area.update()
+            self.app.record_manager.start_initial_check(recording)
+            await self.apply_filter(reset=False)
+
+        self.loading_indicator.visible = False
+        self.loading_indicator.update()
 
     async def update_grid_layout(self, _):
         self.page.run_task(self.recalculate_grid_columns)
@@ -628,13 +639,13 @@ class HomePage(PageBase):
         if not self.is_grid_view:
             return
 
-        column_width = 350
-        runs_count = max(1, int(self.page.width / column_width))
+        runs_count = max(1, int(self.page.width / self.GRID_COLUMN_WIDTH))
 
         if isinstance(self.recording_card_area.content, ft.GridView):
             grid_view = self.recording_card_area.content
-            grid_view.runs_count = runs_count
-            grid_view.update()
+            if grid_view.runs_count != runs_count:
+                grid_view.runs_count = runs_count
+                await self.render_cards(reset=False)
 
     async def on_keyboard(self, e: ft.KeyboardEvent):
         if e.alt and e.key == "H":
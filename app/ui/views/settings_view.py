@@ -3,6 +3,7 @@ import os
 
 import flet as ft
 
+from ...core.config_manager import HotSettings
 from ...models.audio_format_model import AudioFormat
 from ...models.video_format_model import VideoFormat
 from ...models.video_quality_model import VideoQuality
@@ -23,6 +24,7 @@ class SettingsPage(PageBase):
         self.default_config = self.config_manager.load_default_config()
         self.cookies_config = self.config_manager.load_cookies_config()
         self.accounts_config = self.config_manager.load_accounts_config()
+        self.config_manager.hot_settings.refresh(self.user_config)
 
         self.language_code = None
         self.default_language = None
@@ -149,6 +151,8 @@ class SettingsPage(PageBase):
             self.user_config[key] = e.data.lower() == "true"
         else:
             self.user_config[key] = e.data
+        if key in HotSettings.KEYS:
+            self.config_manager.hot_settings.refresh(self.user_config)
             
         if key in ["folder_name_platform", "folder_name_author", "folder_name_time", "folder_name_title"]:
             for recording in self.app.record_manager.recordings:
@@ -161,11 +165,25 @@ class SettingsPage(PageBase):
             self.app.language_manager.notify_observers()
             self.page.run_task(self.load)
 
-        if key == "loop_time_seconds":
-            self.app.record_manager.initialize_dynamic_state()
+        if key == "adaptive_loop_time_enabled":
+            self.apply_check_interval()
+        if key in ["platform_max_concurrent_checks", "platform_checks_per_second", "custom_platform_check_limits"]:
+            self.app.record_manager.live_check_limiter.configure(self.user_config)
+        if key in ["circuit_breaker_failure_threshold", "circuit_breaker_recovery_seconds"]:
+            self.app.record_manager.circuit_breakers.configure(self.user_config)
+        if key in ["stream_url_probe_enabled", "stream_url_probe_ttl"]:
+            self.app.record_manager.stream_info_cache.configure(self.user_config)
         self.page.run_task(self.delay_handler.start_task_timer, self.save_user_config_after_delay, None)
         self.has_unsaved_changes['user_config'] = True
 
+    async def on_check_interval_blur(self, _e):
+        """Apply the check interval fields once editing is finished, not on every keystroke."""
+        self.apply_check_interval()
+
+    def apply_check_interval(self):
+        self.app.record_manager.adaptive_interval.configure(self.user_config)
+        self.app.record_manager.apply_check_interval()
+
     def on_cookies_change(self, e):
         """Handle changes in any input field and trigger auto-save."""
         key = e.control.data
@@ -323,6 +341,38 @@ class SettingsPage(PageBase):
                                 width=100,
                                 data="loop_time_seconds",
                                 on_change=self.on_change,
+                                on_blur=self.on_check_interval_blur,
+                                on_submit=self.on_check_interval_blur,
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["adaptive_loop_time"],
+                            ft.Switch(
+                                value=self.get_config_value("adaptive_loop_time_enabled"),
+                                data="adaptive_loop_time_enabled",
+                                on_change=self.on_change,
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["adaptive_min_loop_time"],
+                            ft.TextField(
+                                value=self.get_config_value("adaptive_min_loop_time"),
+                                width=100,
+                                data="adaptive_min_loop_time",
+                                on_change=self.on_change,
+                                on_blur=self.on_check_interval_blur,
+                                on_submit=self.on_check_interval_blur,
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["adaptive_max_loop_time"],
+                            ft.TextField(
+                                value=self.get_config_value("adaptive_max_loop_time"),
+                                width=100,
+                                data="adaptive_max_loop_time",
+                                on_change=self.on_change,
+                                on_blur=self.on_check_interval_blur,
+                                on_submit=self.on_check_interval_blur,
                             ),
                         ),
                         self.create_setting_row(
@@ -409,6 +459,99 @@ class SettingsPage(PageBase):
                                 on_change=self.on_change,
                             ),
                         ),
+                        self.create_setting_row(
+                            self._["platform_max_concurrent_checks"],
+                            ft.TextField(
+                                value=self.get_config_value("platform_max_concurrent_checks"),
+                                width=100,
+                                data="platform_max_concurrent_checks",
+                                on_change=self.on_change,
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["platform_checks_per_second"],
+                            ft.TextField(
+                                value=self.get_config_value("platform_checks_per_second"),
+                                width=100,
+                                data="platform_checks_per_second",
+                                on_change=self.on_change,
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["custom_platform_check_limits"],
+                            ft.TextField(
+                                value=self.get_config_value("custom_platform_check_limits"),
+                                width=300,
+                                hint_text="douyin=3/1.5, tiktok=2/0.5",
+                                data="custom_platform_check_limits",
+                                on_change=self.on_change,
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["circuit_breaker_failure_threshold"],
+                            ft.TextField(
+                                value=self.get_config_value("circuit_breaker_failure_threshold"),
+                                width=100,
+                                data="circuit_breaker_failure_threshold",
+                                on_change=self.on_change,
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["circuit_breaker_recovery_seconds"],
+                            ft.TextField(
+                                value=self.get_config_value("circuit_breaker_recovery_seconds"),
+                                width=100,
+                                data="circuit_breaker_recovery_seconds",
+                                on_change=self.on_change,
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["stream_url_probe_enabled"],
+                            ft.Switch(
+                                value=self.get_config_value("stream_url_probe_enabled"),
+                                data="stream_url_probe_enabled",
+                                on_change=self.on_change,
+                                tooltip=self._["stream_url_probe_tip"],
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["stream_url_probe_ttl"],
+                            ft.TextField(
+                                value=self.get_config_value("stream_url_probe_ttl"),
+                                width=100,
+                                data="stream_url_probe_ttl",
+                                on_change=self.on_change,
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["recording_storage_backend"],
+                            ft.Dropdown(
+                                options=[
+                                    ft.dropdown.Option("json", text="JSON"),
+                                    ft.dropdown.Option("journal", text="JSON + Journal"),
+                                    ft.dropdown.Option("sqlite", text="SQLite"),
+                                ],
+                                value=self.get_config_value("recording_storage_backend", "json"),
+                                width=200,
+                                data="recording_storage_backend",
+                                on_change=self.on_change,
+                                tooltip=self._["recording_storage_backend_tip"],
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["recording_engine"],
+                            ft.Dropdown(
+                                options=[
+                                    ft.dropdown.Option("ffmpeg", text="FFmpeg"),
+                                    ft.dropdown.Option("native", text=self._["recording_engine_native"]),
+                                ],
+                                value=self.get_config_value("recording_engine", "ffmpeg"),
+                                width=200,
+                                data="recording_engine",
+                                on_change=self.on_change,
+                                tooltip=self._["recording_engine_tip"],
+                            ),
+                        ),
                     ],
                 ),
             ],
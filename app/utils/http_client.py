@@ -0,0 +1,26 @@
+import httpx
+
+_clients: dict[str | None, httpx.AsyncClient] = {}
+
+
+def get_http_client(proxy: str | None = None) -> httpx.AsyncClient:
+    """
+    The HTTP client shared by everything in the process that uses the same proxy, e.g. the native captures
+    and the batch live probes, so concurrent requests reuse one connection pool instead of opening their own.
+    """
+    if proxy not in _clients:
+        _clients[proxy] = httpx.AsyncClient(
+            proxy=proxy or None,
+            timeout=httpx.Timeout(15.0, connect=10.0),
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+            follow_redirects=True,
+        )
+    return _clients[proxy]
+
+
+async def close_http_clients() -> None:
+    """Close the shared clients when the application shuts down."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
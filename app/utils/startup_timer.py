@@ -0,0 +1,35 @@
+import time
+
+from .logger import logger
+
+
+class StartupTimer:
+    """
+    Collects the durations of the startup phases (module imports, object construction, first page load)
+    and logs them once as a single report.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.phases: list[tuple[str, float]] = []
+        self.reported = False
+
+    def mark(self, phase: str) -> float:
+        """Record the time spent since the previous mark under the given phase name."""
+        now = time.perf_counter()
+        elapsed = now - self._last
+        self._last = now
+        self.phases.append((phase, elapsed))
+        return elapsed
+
+    def report(self) -> None:
+        if self.reported:
+            return
+        self.reported = True
+        total = time.perf_counter() - self.started
+        details = ", ".join(f"{phase}: {elapsed * 1000:.0f} ms" for phase, elapsed in self.phases)
+        logger.info(f"Startup finished in {total * 1000:.0f} ms ({details})")
+
+
+startup_timer = StartupTimer()
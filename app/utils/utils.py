@@ -15,6 +15,7 @@ from typing import Any
 from urllib.parse import urlparse
 
 import execjs
+import httpx
 
 from .logger import logger
 
@@ -37,18 +38,63 @@ class Color:
         print(f"{color}{text}{Color.RESET}")
 
 
+class FetchFailure:
+    """
+    Falsy result returned instead of stream data when fetching fails, so callers keep
+    the failure type instead of an empty value.
+    """
+
+    TIMEOUT = "timeout"
+    NETWORK = "network"
+    HTTP_STATUS = "http_status"
+    JS_RUNTIME = "js_runtime"
+    PARSE = "parse"
+    EMPTY = "empty"
+    UNSUPPORTED = "unsupported"
+    UNKNOWN = "unknown"
+
+    __slots__ = ("kind", "error")
+
+    def __init__(self, kind: str, error: str | None = None):
+        self.kind = kind
+        self.error = error
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return f"FetchFailure(kind={self.kind!r}, error={self.error!r})"
+
+    @classmethod
+    def from_exception(cls, e: Exception) -> "FetchFailure":
+        if isinstance(e, execjs.ProgramError):
+            kind = cls.JS_RUNTIME
+        elif isinstance(e, httpx.TimeoutException | TimeoutError):
+            kind = cls.TIMEOUT
+        elif isinstance(e, httpx.HTTPStatusError):
+            kind = cls.HTTP_STATUS
+        elif isinstance(e, httpx.TransportError | ConnectionError):
+            kind = cls.NETWORK
+        elif isinstance(e, ValueError | KeyError | IndexError | TypeError):
+            kind = cls.PARSE
+        else:
+            kind = cls.UNKNOWN
+        return cls(kind, f"{type(e).__name__}: {e}")
+
+
 def trace_error_decorator(func: callable) -> callable:
     @functools.wraps(func)
     async def wrapper(*args: list, **kwargs: dict) -> Any:
         try:
             return await func(*args, **kwargs)
-        except execjs.ProgramError:
+        except execjs.ProgramError as e:
             logger.warning("Failed to execute JS code. Please check if the Node.js environment")
+            return FetchFailure.from_exception(e)
         except Exception as e:
             error_line = traceback.extract_tb(e.__traceback__)[-1].lineno
             error_info = f"Type: {type(e).__name__}, {e} in function {func.__name__} at line: {error_line}"
             logger.error(error_info)
-            return []
+            return FetchFailure.from_exception(e)
 
     return wrapper
 
@@ -1,6 +1,18 @@
 import argparse
 import multiprocessing
 import os
+import sys
+
+if __name__ == "__main__" and "--headless" in sys.argv[1:]:
+    # Headless mode must not import Flet, so dispatch before the UI imports below.
+    from dotenv import load_dotenv
+
+    from app.headless import main as run_headless
+
+    load_dotenv()
+    sys.exit(run_headless())
+
+from app.utils.startup_timer import startup_timer  # noqa: I001 - started before the UI imports it measures
 
 import flet as ft
 from dotenv import load_dotenv
@@ -14,6 +26,8 @@ from app.ui.components.save_progress_overlay import SaveProgressOverlay
 from app.ui.views.login_view import LoginPage
 from app.utils.logger import logger
 
+startup_timer.mark("imports")
+
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 6006
 WINDOW_SCALE = 0.65
@@ -77,6 +91,8 @@ def handle_disconnect(page: ft.Page) -> callable:
 
     def disconnect(_: ft.ControlEvent) -> None:
         page.pubsub.unsubscribe_all()
+        if isinstance(page.data, App):
+            page.data.record_manager.detach()
 
     return disconnect
 
@@ -89,6 +105,7 @@ async def main(page: ft.Page) -> None:
 
     is_web = args.web or platform == "web"
     setup_window(page, is_web)
+    startup_timer.mark("flet session")
 
     app = App(page)
     page.data = app
@@ -169,6 +186,7 @@ if __name__ == "__main__":
     parser.add_argument("--web", action="store_true", help="Run the app in web mode")
     parser.add_argument("--host", type=str, default=default_host, help=f"Host address (default: {default_host})")
     parser.add_argument("--port", type=int, default=default_port, help=f"Port number (default: {default_port})")
+    parser.add_argument("--headless", action="store_true", help="Run the recorder without the UI")
     args = parser.parse_args()
 
     multiprocessing.freeze_support()
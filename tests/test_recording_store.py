@@ -0,0 +1,128 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from app.core.config_manager import ConfigManager
+from app.core.recording_store import JournaledRecordingStore, JsonRecordingStore, SqliteRecordingStore
+
+
+class RecordingStoreTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_manager = ConfigManager(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_snapshot(self, records: list[dict]) -> None:
+        with open(self.config_manager.recordings_config_path, "w", encoding="utf-8") as file:
+            json.dump(records, file)
+
+    def touch_snapshot(self) -> None:
+        """Move the snapshot mtime forward, so a rewrite is detected even on a coarse filesystem clock."""
+        path = self.config_manager.recordings_config_path
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    def read_snapshot(self) -> list[dict]:
+        with open(self.config_manager.recordings_config_path, encoding="utf-8") as file:
+            return json.load(file)
+
+
+class TestJournaledRecordingStore(RecordingStoreTestCase):
+    def create_store(self) -> JournaledRecordingStore:
+        store = JournaledRecordingStore(self.config_manager)
+        store.load()
+        return store
+
+    def read_journal(self, store: JournaledRecordingStore) -> list[str]:
+        with open(store.journal_path, encoding="utf-8") as file:
+            return file.read().splitlines(keepends=True)
+
+    async def test_replays_journal_over_snapshot(self):
+        self.write_snapshot([{"rec_id": "a", "url": "https://a"}, {"rec_id": "b", "url": "https://b"}])
+        store = self.create_store()
+        await store.save([{"rec_id": "a", "url": "https://a2"}, {"rec_id": "c", "url": "https://c"}])
+
+        self.assertEqual([record["url"] for record in self.read_snapshot()], ["https://a", "https://b"])
+        self.assertEqual(
+            JournaledRecordingStore(self.config_manager).load(),
+            [{"rec_id": "a", "url": "https://a2"}, {"rec_id": "c", "url": "https://c"}],
+        )
+
+    async def test_drops_torn_tail(self):
+        self.write_snapshot([{"rec_id": "a", "url": "https://a"}])
+        store = self.create_store()
+        await store.save([{"rec_id": "a", "url": "https://a2"}])
+        with open(store.journal_path, "a", encoding="utf-8") as file:
+            file.write('{"op": "set", "rec_id": "a", "fie')
+
+        reloaded = JournaledRecordingStore(self.config_manager)
+        self.assertEqual(reloaded.load(), [{"rec_id": "a", "url": "https://a2"}])
+        self.assertTrue(self.read_journal(reloaded)[-1].endswith("\n"))
+
+        await reloaded.save([{"rec_id": "a", "url": "https://a3"}])
+        self.assertEqual(JournaledRecordingStore(self.config_manager).load(), [{"rec_id": "a", "url": "https://a3"}])
+
+    async def test_discards_journal_of_older_snapshot(self):
+        self.write_snapshot([{"rec_id": "a", "url": "https://a"}])
+        store = self.create_store()
+        await store.save([{"rec_id": "a", "url": "https://a2"}])
+
+        # Another backend rewrites the snapshot after the journal was started
+        await JsonRecordingStore(self.config_manager).save([{"rec_id": "b", "url": "https://b"}])
+        self.touch_snapshot()
+
+        reloaded = JournaledRecordingStore(self.config_manager)
+        self.assertEqual(reloaded.load(), [{"rec_id": "b", "url": "https://b"}])
+        self.assertEqual(len(self.read_journal(reloaded)), 1)
+
+    async def test_failed_compaction_keeps_journal_until_retried(self):
+        self.write_snapshot([{"rec_id": "a", "url": "https://a"}])
+        store = self.create_store()
+        await store.save([{"rec_id": "a", "url": "https://a2"}])
+        store.COMPACT_BYTES = 0
+
+        failing_save = mock.AsyncMock(side_effect=OSError("No space left on device"))
+        with mock.patch.object(self.config_manager, "save_recordings_config", failing_save):
+            with self.assertRaises(OSError):
+                await store.save([{"rec_id": "a", "url": "https://a3"}])
+        self.assertEqual(JournaledRecordingStore(self.config_manager).load(), [{"rec_id": "a", "url": "https://a2"}])
+
+        store.COMPACT_BYTES = JournaledRecordingStore.COMPACT_BYTES
+        await store.save([{"rec_id": "a", "url": "https://a3"}])
+        self.assertEqual(self.read_snapshot(), [{"rec_id": "a", "url": "https://a3"}])
+        self.assertEqual(len(self.read_journal(store)), 1)
+        self.assertEqual(JournaledRecordingStore(self.config_manager).load(), [{"rec_id": "a", "url": "https://a3"}])
+
+
+class TestSqliteRecordingStore(RecordingStoreTestCase):
+    def create_store(self) -> SqliteRecordingStore:
+        db_path = os.path.join(self.config_manager.config_path, "recordings.db")
+        store = SqliteRecordingStore(db_path, self.config_manager.recordings_config_path)
+        self.addCleanup(store.close)
+        return store
+
+    async def test_import_export_round_trip(self):
+        records = [
+            {"rec_id": "a", "url": "https://a", "platform_key": "douyin", "monitor_status": True},
+            {"rec_id": "b", "url": "https://b", "platform_key": "huya", "monitor_status": False, "streamer_name": "主"},
+        ]
+        self.write_snapshot(records)
+        store = self.create_store()
+        self.assertEqual(store.load(), records)
+        self.assertFalse(store.needs_export())
+
+        changed = [records[1], {**records[0], "monitor_status": False}]
+        await store.save(changed)
+        self.assertTrue(store.needs_export())
+        self.assertEqual(store.export_json(self.config_manager.recordings_config_path), 2)
+        self.assertEqual(self.read_snapshot(), changed)
+        self.assertFalse(store.json_changed())
+
+        self.write_snapshot(records[:1])
+        self.touch_snapshot()
+        self.assertTrue(store.json_changed())
+        self.assertEqual(store.load(), records[:1])